@@ -4,8 +4,6 @@ from fastapi import FastAPI
 from py_eureka_client import eureka_client
 from app.config.settings import settings
 
-# 로깅 설정
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
@@ -0,0 +1,92 @@
+import atexit
+import json
+import logging
+import logging.config
+import queue
+from logging.handlers import QueueHandler, QueueListener
+from pathlib import Path
+from typing import List
+import yaml
+
+LOGGING_CONFIG_PATH = Path(__file__).resolve().parents[2] / "logging.yaml"
+
+# LogRecord 기본 속성 (extra로 전달된 필드만 구조화 로그에 포함하기 위해 사용)
+RESERVED_RECORD_ATTRS = set(vars(logging.makeLogRecord({}))) | {"message", "asctime"}
+
+
+class QueueListenerHandler(QueueHandler):
+    """로그 레코드를 큐에 넣고 별도 스레드에서 실제 핸들러로 기록합니다.
+
+    logging.yaml에서 dictConfig로 생성하며, 메시지 포맷팅과 파일 쓰기는
+    모두 리스너 스레드에서 수행되어 이벤트 루프를 막지 않습니다.
+    큐가 가득 차면 레코드를 버리고 dropped 수를 셉니다.
+    """
+
+    def __init__(self, handlers: List[logging.Handler], queue_size: int = 10000):
+        super().__init__(queue.Queue(maxsize=queue_size))
+        self.dropped = 0
+        # dictConfig의 cfg:// 참조는 인덱스로 접근할 때 핸들러 객체로 변환됨
+        resolved_handlers = [handlers[i] for i in range(len(handlers))]
+        self.listener = QueueListener(
+            self.queue, *resolved_handlers, respect_handler_level=True
+        )
+        self.listener.start()
+        atexit.register(self.listener.stop)
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # 포맷팅은 리스너 스레드의 핸들러가 수행하므로 레코드를 그대로 전달
+        return record
+
+    def enqueue(self, record: logging.LogRecord):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+class MaxLengthFilter(logging.Filter):
+    """메시지가 너무 길면 잘라서 기록합니다."""
+
+    def __init__(self, max_length: int = 2000):
+        super().__init__()
+        self.max_length = max_length
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        message = record.getMessage()
+        if len(message) > self.max_length:
+            record.msg = (
+                f"{message[:self.max_length]}... (truncated, {len(message)} chars)"
+            )
+            record.args = None
+        return True
+
+
+class JsonFormatter(logging.Formatter):
+    """로그 레코드를 한 줄의 JSON으로 기록합니다. extra로 전달된 필드도 포함합니다."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        log = {
+            "time": self.formatTime(record, self.datefmt),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        for key, value in vars(record).items():
+            if key not in RESERVED_RECORD_ATTRS:
+                log[key] = value
+        if record.exc_info:
+            log["exc_info"] = self.formatException(record.exc_info)
+        return json.dumps(log, ensure_ascii=False, default=str)
+
+
+def setup_logging(config_path: Path = LOGGING_CONFIG_PATH):
+    """logging.yaml로 로깅을 설정합니다.
+
+    uvicorn --log-config로 이미 설정된 경우에는 다시 설정하지 않습니다.
+    """
+    root_logger = logging.getLogger()
+    if any(isinstance(h, QueueListenerHandler) for h in root_logger.handlers):
+        return
+
+    with open(config_path, encoding="utf-8") as f:
+        logging.config.dictConfig(yaml.safe_load(f))
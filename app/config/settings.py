@@ -1,5 +1,5 @@
 from functools import lru_cache
-from typing import Dict, List
+from typing import Dict, List, Literal, Optional
 from pydantic_settings import BaseSettings
 
 
@@ -12,6 +12,24 @@ class Settings(BaseSettings):
 
     # OpenAI settings
     OPENAI_API_KEY: str
+    OPENAI_BASE_URL: Optional[str] = None  # OpenAI 호환 서버 주소 (기본값: 공식 API)
+    OPENAI_MODEL: str = "gpt-4o-mini"
+    OPENAI_TIMEOUT_SECONDS: float = 60.0
+    OPENAI_CONNECT_TIMEOUT_SECONDS: float = 5.0
+    OPENAI_MAX_RETRIES: int = 3  # 지수 백오프로 재시도
+    OPENAI_MAX_CONNECTIONS: int = 100
+    OPENAI_MAX_KEEPALIVE_CONNECTIONS: int = 20
+    OPENAI_KEEPALIVE_EXPIRY_SECONDS: float = 30.0
+    OPENAI_REQUESTS_PER_MINUTE: int = 500  # 개별 기사 요약 요청 한도(RPM)
+    OPENAI_TOKENS_PER_MINUTE: int = 200000  # 개별 기사 요약 토큰 한도(TPM)
+
+    # 개별 기사 요약 설정
+    INDIVIDUAL_SUMMARY_CONCURRENCY: int = 8  # 동시에 요약할 기사 수
+    INDIVIDUAL_SUMMARY_TIMEOUT_SECONDS: float = 30.0  # 기사 1건 요약 제한 시간
+    INDIVIDUAL_SUMMARY_MAX_RETRIES: int = 4  # 429·연결 오류·5xx 응답 재시도 횟수
+    INDIVIDUAL_SUMMARY_RETRY_BASE_SECONDS: float = 1.0
+    INDIVIDUAL_SUMMARY_RETRY_MAX_SECONDS: float = 30.0
+    INDIVIDUAL_SUMMARY_CACHE_TTL_SECONDS: int = 60 * 60 * 24 * 8
 
     # Database settings
     DATABASE_HOST: str
@@ -25,6 +43,116 @@ class Settings(BaseSettings):
     REDIS_PORT: int
     REDIS_PASSWORD: str
     REDIS_DB: int
+    REDIS_MAX_CONNECTIONS: int = 50
+    REDIS_POOL_TIMEOUT_SECONDS: float = 5.0  # 풀에서 연결을 기다리는 최대 시간
+    REDIS_SOCKET_TIMEOUT_SECONDS: float = 2.0
+    REDIS_SOCKET_CONNECT_TIMEOUT_SECONDS: float = 2.0
+    REDIS_HEALTH_CHECK_INTERVAL_SECONDS: int = 30
+
+    # 기동 시 연결에 실패한 DB/Redis 재연결 시도 간격(초)
+    RECONNECT_INTERVAL_SECONDS: float = 10.0
+
+    # DB 연결 풀 설정
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT_SECONDS: float = 10.0  # 풀에서 연결을 기다리는 최대 시간
+    DB_POOL_RECYCLE_SECONDS: int = 1800  # MySQL wait_timeout 이전에 연결 교체
+    DB_POOL_PRE_PING: bool = True
+    DB_CONNECT_TIMEOUT_SECONDS: int = 5
+    DB_READ_TIMEOUT_SECONDS: int = 30
+    DB_WRITE_TIMEOUT_SECONDS: int = 30
+
+    # DB 조회 스레드 풀 크기 (DB 연결 풀 크기와 맞춤)
+    DB_EXECUTOR_MAX_WORKERS: int = 5
+    # 기사 조회 방식 (stream: 커서 행을 바로 DTO로 변환, dataframe: pandas 경유)
+    DB_RETRIEVAL_MODE: Literal["stream", "dataframe"] = "stream"
+
+    # Redis 요약 캐시 저장 형식 (orjson, msgpack, zstd는 requirements-optional.txt 설치 필요)
+    CACHE_SERIALIZER: Literal["json", "orjson", "msgpack"] = "json"
+    CACHE_COMPRESSION: Literal["none", "zlib", "zstd"] = "none"
+    CACHE_COMPRESSION_MIN_BYTES: int = 1024  # 이보다 작은 값은 압축하지 않음
+    CACHE_VALIDATE_ON_READ: bool = False  # 캐시 적중 시 pydantic 재검증 여부
+
+    # 요약 API 응답의 Cache-Control max-age(초)
+    SUMMARY_CACHE_MAX_AGE_SECONDS: int = 60
+
+    # 프로세스 내부 요약 캐시 설정
+    LOCAL_CACHE_MAX_SIZE: int = 256
+    LOCAL_CACHE_TTL_SECONDS: float = 300.0
+
+    # 요약 요청 합치기(single-flight) 설정
+    SUMMARY_LOCK_TIMEOUT_SECONDS: float = 120.0  # 인스턴스 간 락 만료 시간
+    SUMMARY_LOCK_WAIT_SECONDS: float = 90.0  # 다른 인스턴스의 결과를 기다리는 최대 시간
+    SUMMARY_LOCK_POLL_INTERVAL_SECONDS: float = 0.5  # 결과 확인 주기
+
+    # 기사 버전별 요약 캐시 설정
+    CONTENT_VERSION_REFRESH_SECONDS: float = (
+        30.0  # 수집 알림을 놓쳐도 버전을 다시 읽는 주기
+    )
+    SUMMARY_SERVE_STALE: bool = True  # 새 버전 요약을 만드는 동안 이전 요약 반환
+
+    # 06:15 기준 시각 캐시 사전 생성 설정
+    PREWARM_ENABLED: bool = True
+    PREWARM_CONCURRENCY: int = 4  # 동시에 생성할 요약 수
+    PREWARM_DELAY_SECONDS: float = 60.0  # 기준 시각 이후 대기 시간
+    PREWARM_LOCK_TTL_SECONDS: int = 60 * 60  # 사전 생성 담당 인스턴스 락 유지 시간
+
+    # news_articles 일 단위 파티션 유지 작업 설정
+    ARTICLE_RETENTION_DAYS: int = 8  # 오늘 이전으로 보관할 일 수 (7일 조회보다 길게)
+    PARTITION_MAINTENANCE_ENABLED: bool = True
+    PARTITION_PRECREATE_DAYS: int = 1  # 오늘 이후로 미리 만들 파티션 수
+    PARTITION_MAINTENANCE_INTERVAL_SECONDS: float = 60.0 * 60  # 유지 작업 확인 주기
+    PARTITION_MAINTENANCE_LOCK_TTL_SECONDS: int = 10 * 60  # 유지 작업 담당 인스턴스 락
+
+    # 기간 요약 증분 생성 (일별·언론사별 부분 요약을 저장해 재사용)
+    INCREMENTAL_SUMMARY_ENABLED: bool = True
+    INCREMENTAL_SUMMARY_PERIODS: List[int] = [3, 5, 7]
+    PARTIAL_SUMMARY_TTL_SECONDS: int = 60 * 60 * 24 * 8  # DB 보관 기간(7일)보다 길게
+    PARTIAL_SUMMARY_CONCURRENCY: int = 4  # 동시에 생성할 부분 요약 수
+
+    # 여러 언론사의 거의 같은 기사 중복 제거 (MinHash)
+    ARTICLE_DEDUP_ENABLED: bool = True
+    ARTICLE_DEDUP_THRESHOLD: float = 0.7  # 추정 Jaccard 유사도가 이 이상이면 같은 기사
+    ARTICLE_DEDUP_NUM_PERM: int = 64  # 서명 길이
+    ARTICLE_DEDUP_SHINGLE_SIZE: int = 5  # 문자 n-gram 크기
+    ARTICLE_DEDUP_COLLAPSE_SOURCES: bool = False  # sources에서도 중복 기사 제외
+    ARTICLE_SIGNATURE_TTL_SECONDS: int = 60 * 60 * 24 * 8
+
+    # 종합 요약 프롬프트 입력 토큰 예산 (시스템 프롬프트 제외)
+    PROMPT_INPUT_TOKEN_BUDGET: int = 6000
+    PROMPT_MAX_MAP_BATCHES: int = 4  # 예산 초과 시 나눠서 요약할 최대 묶음 수
+    PROMPT_DEDUP_THRESHOLD: float = 0.8  # 이 이상 유사한(Jaccard) 요약은 하나만 사용
+
+    # 기사 수집(ingest) 설정
+    # {keyword}, {domain}은 URL 인코딩된 검색어와 언론사 도메인으로 치환됨
+    INGEST_RSS_URL_TEMPLATE: str = (
+        "https://news.google.com/rss/search"
+        "?q={keyword}+site:{domain}+when:1d&hl=ko&gl=KR&ceid=KR:ko"
+    )
+    NEWS_SITE_STRUCTURES_PATH: Optional[str] = (
+        None  # 기본값: resources/news_site_structures.json
+    )
+    # lxml은 requirements-optional.txt의 lxml, cssselect 설치 필요
+    INGEST_PARSER_BACKEND: Literal["auto", "selectolax", "lxml", "bs4"] = "auto"
+    INGEST_SELECTOR_RELOAD_INTERVAL_SECONDS: float = (
+        5.0  # 선택자 정의 파일 변경 확인 주기
+    )
+    INGEST_MAX_CONNECTIONS: int = 20
+    INGEST_PER_DOMAIN_CONCURRENCY: int = 2  # 도메인별 동시 요청 수
+    INGEST_PER_DOMAIN_DELAY_SECONDS: float = 0.5  # 같은 도메인 요청 사이 최소 간격
+    INGEST_DECODE_CONCURRENCY: int = 4  # Google News URL 동시 변환 수
+    INGEST_DECODE_INTERVAL_SECONDS: float = 1.0  # googlenewsdecoder 요청 간격
+    INGEST_REQUEST_TIMEOUT_SECONDS: float = 15.0
+    INGEST_BATCH_SIZE: int = 100  # 한 번에 저장할 기사 수
+    INGEST_FLUSH_INTERVAL_SECONDS: float = 2.0  # 묶음이 덜 찼어도 저장하는 주기
+    INGEST_WRITE_QUEUE_SIZE: int = 500  # 저장 대기 기사 수 (가득 차면 수집을 멈춤)
+    INGEST_USER_AGENT: str = (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+        "(KHTML, like Gecko) Chrome/130.0.0.0 Safari/537.36"
+    )
+
+    # 메인 페이지 헤드라인 캐시 갱신 주기(초)
+    HEADLINE_REFRESH_SECONDS: int = 60
 
     # News settings
     NEWS_KEYWORD: List[str] = [
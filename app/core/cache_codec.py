@@ -0,0 +1,132 @@
+import json
+import zlib
+from typing import Any, Callable, Dict, Tuple
+
+# 캐시 값 헤더: 매직 바이트, 형식 버전, 직렬화 방식 ID, 압축 방식 ID
+MAGIC = b"\xa7"
+FORMAT_VERSION = 1
+HEADER_SIZE = 4
+
+
+def _load_orjson() -> Tuple[Callable[[Any], bytes], Callable[[bytes], Any]]:
+    import orjson
+
+    return orjson.dumps, orjson.loads
+
+
+def _load_msgpack() -> Tuple[Callable[[Any], bytes], Callable[[bytes], Any]]:
+    import msgpack
+
+    return msgpack.packb, lambda data: msgpack.unpackb(data, raw=False)
+
+
+def _load_json() -> Tuple[Callable[[Any], bytes], Callable[[bytes], Any]]:
+    return (
+        lambda obj: json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode(
+            "utf-8"
+        ),
+        json.loads,
+    )
+
+
+def _load_zstd() -> Tuple[Callable[[bytes], bytes], Callable[[bytes], bytes]]:
+    import zstandard
+
+    return zstandard.ZstdCompressor().compress, zstandard.ZstdDecompressor().decompress
+
+
+def _load_zlib() -> Tuple[Callable[[bytes], bytes], Callable[[bytes], bytes]]:
+    return zlib.compress, zlib.decompress
+
+
+def _load_none() -> Tuple[Callable[[bytes], bytes], Callable[[bytes], bytes]]:
+    return (lambda data: data), (lambda data: data)
+
+
+# 이름: (헤더 ID, 로더). orjson, msgpack, zstandard는 선택한 경우에만 설치가 필요함
+SERIALIZERS: Dict[str, Tuple[int, Callable]] = {
+    "json": (1, _load_json),
+    "orjson": (2, _load_orjson),
+    "msgpack": (3, _load_msgpack),
+}
+COMPRESSORS: Dict[str, Tuple[int, Callable]] = {
+    "none": (0, _load_none),
+    "zlib": (1, _load_zlib),
+    "zstd": (2, _load_zstd),
+}
+
+
+class CacheCodec:
+    """Redis 캐시 값을 직렬화/압축하고 형식 헤더를 붙입니다.
+
+    읽을 때는 헤더에 기록된 방식으로 복원하므로, 설정을 바꿔도 기존 값을 읽을 수 있습니다.
+    헤더가 없는 값은 이전 형식(JSON 문자열)으로 처리합니다.
+    """
+
+    def __init__(self, serializer: str, compression: str, compression_min_bytes: int):
+        if serializer not in SERIALIZERS:
+            raise ValueError(f"지원하지 않는 캐시 직렬화 방식입니다: {serializer}")
+        if compression not in COMPRESSORS:
+            raise ValueError(f"지원하지 않는 캐시 압축 방식입니다: {compression}")
+
+        self.serializer_id, load_serializer = SERIALIZERS[serializer]
+        self.compression_id, load_compressor = COMPRESSORS[compression]
+        # 선택한 라이브러리가 없으면 첫 요청이 아니라 기동 시점에 실패하도록 여기서 불러옴
+        try:
+            self.dumps, _ = load_serializer()
+            self.compress, _ = load_compressor()
+        except ImportError as e:
+            raise ImportError(
+                f"캐시 형식 {serializer}/{compression}에 필요한 {e.name} 패키지가 "
+                "없습니다. requirements-optional.txt를 설치하거나 "
+                "CACHE_SERIALIZER/CACHE_COMPRESSION 설정을 바꾸십시오.",
+                name=e.name,
+            ) from e
+        self.compression_min_bytes = compression_min_bytes
+        self._loaders: Dict[int, Callable[[bytes], Any]] = {}
+        self._decompressors: Dict[int, Callable[[bytes], bytes]] = {}
+
+    def encode(self, obj: Any) -> bytes:
+        """객체를 헤더가 붙은 바이트로 변환합니다."""
+        payload = self.dumps(obj)
+        compression_id = 0
+        if self.compression_id and len(payload) >= self.compression_min_bytes:
+            payload = self.compress(payload)
+            compression_id = self.compression_id
+        header = MAGIC + bytes((FORMAT_VERSION, self.serializer_id, compression_id))
+        return header + payload
+
+    def decode(self, data: bytes | str) -> Any:
+        """헤더에 기록된 방식으로 바이트를 객체로 복원합니다."""
+        if isinstance(data, str) or not data.startswith(MAGIC):
+            return json.loads(data)
+
+        version, serializer_id, compression_id = data[1:HEADER_SIZE]
+        if version != FORMAT_VERSION:
+            raise ValueError(f"지원하지 않는 캐시 형식 버전입니다: {version}")
+
+        payload = data[HEADER_SIZE:]
+        if compression_id:
+            payload = self._get_decoder(
+                COMPRESSORS, self._decompressors, compression_id
+            )(payload)
+        return self._get_decoder(SERIALIZERS, self._loaders, serializer_id)(payload)
+
+    def is_legacy(self, data: bytes | str) -> bool:
+        """헤더가 없는 이전 형식의 값인지 확인합니다."""
+        return isinstance(data, str) or not data.startswith(MAGIC)
+
+    @staticmethod
+    def _get_decoder(
+        registry: Dict[str, Tuple[int, Callable]],
+        decoders: Dict[int, Callable],
+        id_: int,
+    ) -> Callable:
+        if id_ not in decoders:
+            for codec_id, loader in registry.values():
+                if codec_id == id_:
+                    decoders[id_] = loader()[1]
+                    break
+            else:
+                raise ValueError(f"알 수 없는 캐시 형식 ID입니다: {id_}")
+        return decoders[id_]
@@ -1,7 +1,9 @@
-import json
+from functools import lru_cache
 from sqlalchemy import create_engine
+from sqlalchemy.engine import Engine
 from app.config.settings import settings
-from redis import Redis
+from app.core.cache_codec import CacheCodec
+from redis import BlockingConnectionPool, Redis
 
 
 def get_database_connection():
@@ -10,7 +12,19 @@ def get_database_connection():
         if not connection_info:
             raise ValueError("데이터 베이스 연결정보가 없습니다.")
 
-        engine = create_engine(connection_info)
+        engine = create_engine(
+            connection_info,
+            pool_size=settings.DB_POOL_SIZE,
+            max_overflow=settings.DB_MAX_OVERFLOW,
+            pool_timeout=settings.DB_POOL_TIMEOUT_SECONDS,
+            pool_recycle=settings.DB_POOL_RECYCLE_SECONDS,
+            pool_pre_ping=settings.DB_POOL_PRE_PING,
+            connect_args={
+                "connect_timeout": settings.DB_CONNECT_TIMEOUT_SECONDS,
+                "read_timeout": settings.DB_READ_TIMEOUT_SECONDS,
+                "write_timeout": settings.DB_WRITE_TIMEOUT_SECONDS,
+            },
+        )
         print("MySQL 데이터베이스에 성공적으로 연결되었습니다.")
         return engine
     except Exception as e:
@@ -18,15 +32,31 @@ def get_database_connection():
         return None
 
 
+@lru_cache()
+def get_redis_pool() -> BlockingConnectionPool:
+    """프로세스에서 공유하는 Redis 연결 풀을 반환합니다.
+
+    연결이 모두 사용 중이면 REDIS_POOL_TIMEOUT_SECONDS 동안 반환을 기다립니다.
+    """
+    return BlockingConnectionPool(
+        host=settings.REDIS_HOST,
+        port=settings.REDIS_PORT,
+        password=settings.REDIS_PASSWORD,
+        db=settings.REDIS_DB,
+        max_connections=settings.REDIS_MAX_CONNECTIONS,
+        timeout=settings.REDIS_POOL_TIMEOUT_SECONDS,
+        socket_timeout=settings.REDIS_SOCKET_TIMEOUT_SECONDS,
+        socket_connect_timeout=settings.REDIS_SOCKET_CONNECT_TIMEOUT_SECONDS,
+        socket_keepalive=True,
+        health_check_interval=settings.REDIS_HEALTH_CHECK_INTERVAL_SECONDS,
+        # 요약 캐시는 바이너리(헤더 + 직렬화/압축 데이터)로 저장하므로 bytes로 받음
+        decode_responses=False,
+    )
+
+
 def get_redis_connection():
     try:
-        redis_client = Redis(
-            host=settings.REDIS_HOST,
-            port=settings.REDIS_PORT,
-            password=settings.REDIS_PASSWORD,
-            db=settings.REDIS_DB,
-            decode_responses=True,
-        )
+        redis_client = Redis(connection_pool=get_redis_pool())
         redis_client.ping()
         print("Redis에 성공적으로 연결되었습니다.")
         return redis_client
@@ -36,8 +66,48 @@ def get_redis_connection():
 
 
 def get_cached_summary(key: str) -> dict | None:
-    redis_client = get_redis_connection()
-    if not redis_client:
+    try:
+        result = Redis(connection_pool=get_redis_pool()).get(key)
+    except Exception as e:
+        print(f"Redis 조회 오류: {str(e)}")
         return None
-    result = redis_client.get(key)
-    return json.loads(result) if result else None
+    if not result:
+        return None
+    codec = CacheCodec(
+        serializer=settings.CACHE_SERIALIZER,
+        compression=settings.CACHE_COMPRESSION,
+        compression_min_bytes=settings.CACHE_COMPRESSION_MIN_BYTES,
+    )
+    return codec.decode(result)
+
+
+def get_pool_stats(engine: Engine | None) -> dict:
+    """MySQL과 Redis 연결 풀 사용 현황을 반환합니다.
+
+    Args:
+        engine (Engine | None): DB 엔진
+
+    Returns:
+        dict: 풀 크기, 사용 중/유휴 연결 수
+    """
+    stats = {}
+    if engine is not None:
+        pool = engine.pool
+        stats["mysql"] = {
+            "size": pool.size(),
+            "checked_in": pool.checkedin(),
+            "checked_out": pool.checkedout(),
+            "overflow": pool.overflow(),
+        }
+
+    redis_pool = get_redis_pool()
+    # BlockingConnectionPool은 반환된 연결과 아직 만들지 않은 자리(None)를 큐에 보관함
+    idle = sum(1 for conn in list(redis_pool.pool.queue) if conn is not None)
+    created = len(redis_pool._connections)
+    stats["redis"] = {
+        "max_connections": redis_pool.max_connections,
+        "created": created,
+        "in_use": created - idle,
+        "idle": idle,
+    }
+    return stats
@@ -0,0 +1,66 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+
+
+class LocalCache:
+    """크기와 TTL이 제한된 프로세스 내부 LRU 캐시
+
+    Redis Pub/Sub 수신 스레드에서도 항목을 지우므로 모든 연산은 락으로 보호합니다.
+    """
+
+    def __init__(self, max_size: int, ttl: float):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Any]:
+        """키에 해당하는 값을 반환합니다. 없거나 만료되면 None을 반환합니다."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] < time.monotonic():
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def set(self, key: str, value: Any):
+        """값을 저장하고, 최대 크기를 넘으면 가장 오래 사용하지 않은 항목을 제거합니다."""
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def delete(self, key: str):
+        """키에 해당하는 항목을 제거합니다."""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def delete_if(self, predicate: Callable[[str], bool]) -> int:
+        """조건에 맞는 키의 항목을 모두 제거합니다.
+
+        Returns:
+            int: 제거된 항목 수
+        """
+        with self._lock:
+            keys = [key for key in self._entries if predicate(key)]
+            for key in keys:
+                del self._entries[key]
+            return len(keys)
+
+    def stats(self) -> Dict[str, int]:
+        """적중/미적중 횟수와 현재 크기를 반환합니다."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "size": len(self._entries),
+            }
@@ -0,0 +1,98 @@
+from prometheus_client import Counter, Histogram, REGISTRY
+from prometheus_client.core import CounterMetricFamily, GaugeMetricFamily
+from app.config.settings import settings
+
+# 요약 처리 단계별 소요 시간
+# stage: cache_lookup, sql, dedup, dto_conversion, openai, parse, cache_write
+SUMMARY_STAGE_SECONDS = Histogram(
+    "news_summary_stage_seconds",
+    "뉴스 요약 처리 단계별 소요 시간(초)",
+    ["stage"],
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60),
+)
+
+SUMMARY_CACHE_REQUESTS = Counter(
+    "news_summary_cache_requests_total",
+    "요약 캐시 조회 결과",
+    ["keyword", "period", "result"],
+)
+
+OPENAI_TOKENS = Counter(
+    "news_openai_tokens_total",
+    "OpenAI 사용 토큰 수",
+    ["kind"],
+)
+
+OPENAI_ERRORS = Counter(
+    "news_openai_errors_total",
+    "OpenAI 호출 오류 수",
+    ["error"],
+)
+
+PARTIAL_SUMMARY_REQUESTS = Counter(
+    "news_partial_summary_requests_total",
+    "일별·언론사별 부분 요약 조회 결과",
+    ["result"],
+)
+
+PROMPT_PACKING_ITEMS = Counter(
+    "news_prompt_packing_items_total",
+    "종합 요약 프롬프트 구성 시 요약 처리 결과",
+    ["result"],
+)
+
+COMBINED_FANOUT_ARTICLES = Histogram(
+    "news_combined_fanout_articles",
+    "종합 키워드 조회 시 키워드별 쿼리에서 가져온 기사 수",
+    buckets=(0, 5, 10, 20, 30, 50, 75, 100, 150),
+)
+
+
+def keyword_label(keyword: str) -> str:
+    """레이블 수가 무한히 늘어나지 않도록 정해진 키워드 외에는 other로 묶습니다."""
+    if keyword == "종합" or keyword in settings.NEWS_KEYWORD:
+        return keyword
+    return "other"
+
+
+def record_openai_usage(usage):
+    """OpenAI 응답의 usage로 토큰 사용량을 기록합니다."""
+    if usage is None:
+        return
+    OPENAI_TOKENS.labels(kind="prompt").inc(usage.prompt_tokens)
+    OPENAI_TOKENS.labels(kind="completion").inc(usage.completion_tokens)
+
+
+class NewsDataManagerCollector:
+    """스크랩 시점의 캐시 계층별 적중 횟수와 연결 풀 사용 현황을 수집합니다."""
+
+    def __init__(self, news_data_manager):
+        self.news_data_manager = news_data_manager
+
+    def collect(self):
+        cache_stats = self.news_data_manager.get_cache_stats()
+        # 누적 값이므로 rate()를 쓸 수 있도록 카운터로 노출 (_total 접미사가 붙음)
+        cache = CounterMetricFamily(
+            "news_summary_cache_tier_requests",
+            "캐시 계층별 누적 적중/미적중 횟수",
+            labels=["tier", "result"],
+        )
+        for tier, stats in cache_stats.items():
+            cache.add_metric([tier, "hit"], stats["hits"])
+            cache.add_metric([tier, "miss"], stats["misses"])
+        yield cache
+
+        pool = GaugeMetricFamily(
+            "news_connection_pool_connections",
+            "연결 풀 상태별 연결 수",
+            labels=["backend", "state"],
+        )
+        for backend, stats in self.news_data_manager.get_pool_stats().items():
+            for state, value in stats.items():
+                pool.add_metric([backend, state], value)
+        yield pool
+
+
+def register_news_data_manager(news_data_manager):
+    """NewsDataManager의 캐시/연결 풀 현황을 /metrics에 노출합니다."""
+    REGISTRY.register(NewsDataManagerCollector(news_data_manager))
@@ -0,0 +1,40 @@
+from functools import lru_cache
+import httpx
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient
+from app.config.settings import settings
+
+
+@lru_cache()
+def get_openai_client() -> AsyncOpenAI:
+    """프로세스에서 공유하는 비동기 OpenAI 클라이언트를 반환합니다.
+
+    HTTP 연결 풀을 재사용하고, 타임아웃과 재시도(지수 백오프)는
+    OpenAI 클라이언트 설정으로 처리합니다.
+
+    Returns:
+        AsyncOpenAI: 공유 OpenAI 클라이언트
+    """
+    http_client = DefaultAsyncHttpxClient(
+        limits=httpx.Limits(
+            max_connections=settings.OPENAI_MAX_CONNECTIONS,
+            max_keepalive_connections=settings.OPENAI_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=settings.OPENAI_KEEPALIVE_EXPIRY_SECONDS,
+        ),
+    )
+    return AsyncOpenAI(
+        api_key=settings.OPENAI_API_KEY,
+        base_url=settings.OPENAI_BASE_URL,
+        timeout=httpx.Timeout(
+            settings.OPENAI_TIMEOUT_SECONDS,
+            connect=settings.OPENAI_CONNECT_TIMEOUT_SECONDS,
+        ),
+        max_retries=settings.OPENAI_MAX_RETRIES,
+        http_client=http_client,
+    )
+
+
+async def close_openai_client():
+    """공유 OpenAI 클라이언트의 연결 풀을 닫습니다."""
+    if get_openai_client.cache_info().currsize:
+        await get_openai_client().close()
+        get_openai_client.cache_clear()
@@ -0,0 +1,44 @@
+import hashlib
+from fastapi import Response
+from pydantic import BaseModel
+
+
+class RenderedResponse:
+    """미리 직렬화한 JSON 응답 본문과 ETag"""
+
+    __slots__ = ("body", "etag")
+
+    def __init__(self, body: bytes, etag: str | None = None):
+        self.body = body
+        self.etag = etag or f'"{hashlib.sha1(body).hexdigest()}"'
+
+    @classmethod
+    def from_model(cls, model: BaseModel) -> "RenderedResponse":
+        """pydantic 모델을 JSON 바이트로 직렬화합니다."""
+        return cls(model.model_dump_json().encode("utf-8"))
+
+    def matches(self, if_none_match: str | None) -> bool:
+        """If-None-Match 헤더가 현재 ETag와 일치하는지 확인합니다."""
+        if not if_none_match:
+            return False
+        candidates = [tag.strip() for tag in if_none_match.split(",")]
+        return "*" in candidates or any(
+            tag.removeprefix("W/") == self.etag for tag in candidates
+        )
+
+    def to_response(self, if_none_match: str | None, max_age: int) -> Response:
+        """직렬화된 본문을 그대로 담은 응답을 만듭니다. ETag가 일치하면 304를 반환합니다.
+
+        Args:
+            if_none_match (str | None): 요청의 If-None-Match 헤더
+            max_age (int): Cache-Control max-age(초)
+
+        Returns:
+            Response: 200 또는 304 응답
+        """
+        headers = {"ETag": self.etag, "Cache-Control": f"public, max-age={max_age}"}
+        if self.matches(if_none_match):
+            return Response(status_code=304, headers=headers)
+        return Response(
+            content=self.body, media_type="application/json", headers=headers
+        )
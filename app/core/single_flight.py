@@ -0,0 +1,166 @@
+import asyncio
+import logging
+import uuid
+from typing import Awaitable, Callable, Dict, Optional, TypeVar
+from redis import Redis
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# 락을 잡은 요청(토큰 일치)만 락을 해제하도록 하는 스크립트
+RELEASE_LOCK_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+else
+    return 0
+end
+"""
+
+
+class SingleFlight:
+    """같은 키에 대한 동시 요청을 하나의 실행으로 합칩니다.
+
+    프로세스 내부에서는 asyncio Future로 동일 키의 요청을 합치고,
+    여러 인스턴스 사이에서는 Redis 락을 잡은 인스턴스만 계산하며
+    나머지는 결과가 캐시에 저장될 때까지 기다립니다.
+    """
+
+    def __init__(
+        self,
+        lock_timeout: float,
+        wait_timeout: float,
+        poll_interval: float,
+    ):
+        self.lock_timeout = lock_timeout
+        self.wait_timeout = wait_timeout
+        self.poll_interval = poll_interval
+        self._futures: Dict[str, asyncio.Future] = {}
+
+    def get_pending(self, key: str) -> Optional[asyncio.Future]:
+        """이 프로세스에서 진행 중인 키의 Future를 반환합니다. 없으면 None을 반환합니다."""
+        return self._futures.get(key)
+
+    async def do(
+        self,
+        key: str,
+        fn: Callable[[], Awaitable[T]],
+        lookup: Optional[Callable[[], Optional[T]]] = None,
+        redis_client: Optional[Redis] = None,
+    ) -> T:
+        """키에 대한 계산을 한 번만 실행하고 모든 대기 요청에 결과를 반환합니다.
+
+        계산하던 요청이 취소되면(클라이언트 연결 종료 등) 기다리던 요청 중 하나가 다시 계산합니다.
+
+        Args:
+            key (str): 요청을 합칠 기준 키
+            fn (Callable[[], Awaitable[T]]): 결과를 계산하는 코루틴 함수
+            lookup (Callable[[], Optional[T]]): 다른 인스턴스가 저장한 결과를 조회하는 함수
+            redis_client (Redis): 인스턴스 간 락에 사용할 Redis 클라이언트
+
+        Returns:
+            T: 계산 결과
+        """
+        while True:
+            future = self._futures.get(key)
+            if future is None:
+                break
+            logger.info(f"진행 중인 요청에 합류: {key}")
+            try:
+                return await asyncio.shield(future)
+            except asyncio.CancelledError:
+                # 이 요청이 취소된 경우는 그대로 전파 (cancelling은 Python 3.11+)
+                task = asyncio.current_task()
+                if not future.cancelled() or getattr(task, "cancelling", int)():
+                    raise
+                # 계산하던 요청만 취소되었으면 다시 시도해 직접 계산하거나 새 계산에 합류
+                logger.info(f"진행 중인 요청이 취소되어 다시 시도: {key}")
+
+        future = asyncio.get_running_loop().create_future()
+        # 기다리는 요청이 없을 때 예외 미확인 경고가 남지 않도록 처리
+        future.add_done_callback(lambda f: f.cancelled() or f.exception())
+        self._futures[key] = future
+        try:
+            result = await self._run_with_lock(key, fn, lookup, redis_client)
+            future.set_result(result)
+            return result
+        except asyncio.CancelledError:
+            # 기다리던 요청은 취소를 확인하고 다시 시도함
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            raise
+        finally:
+            self._futures.pop(key, None)
+
+    async def _run_with_lock(
+        self,
+        key: str,
+        fn: Callable[[], Awaitable[T]],
+        lookup: Optional[Callable[[], Optional[T]]],
+        redis_client: Optional[Redis],
+    ) -> T:
+        if redis_client is None:
+            return await fn()
+
+        loop = asyncio.get_running_loop()
+        lock_key = f"lock:{key}"
+        token = uuid.uuid4().hex
+        deadline = loop.time() + self.wait_timeout
+
+        while True:
+            try:
+                acquired = await asyncio.to_thread(
+                    redis_client.set,
+                    lock_key,
+                    token,
+                    nx=True,
+                    px=int(self.lock_timeout * 1000),
+                )
+            except Exception as e:
+                logger.error(f"Redis 락 획득 실패, 직접 계산합니다: {str(e)}")
+                return await fn()
+
+            if acquired:
+                try:
+                    # 락을 기다리는 사이 다른 인스턴스가 결과를 저장했을 수 있음
+                    result = await self._lookup(lookup)
+                    if result:
+                        return result
+                    return await fn()
+                finally:
+                    await self._release_lock(redis_client, lock_key, token)
+
+            # 다른 인스턴스가 계산 중이면 결과가 저장되거나 락이 풀릴 때까지 대기
+            logger.info(f"다른 인스턴스의 계산 결과 대기: {key}")
+            while loop.time() < deadline:
+                await asyncio.sleep(self.poll_interval)
+                result = await self._lookup(lookup)
+                if result:
+                    return result
+                try:
+                    locked = await asyncio.to_thread(redis_client.exists, lock_key)
+                except Exception as e:
+                    logger.error(f"Redis 락 확인 실패, 직접 계산합니다: {str(e)}")
+                    return await fn()
+                if not locked:
+                    break
+            else:
+                logger.warning(f"결과 대기 시간 초과, 직접 계산합니다: {key}")
+                return await fn()
+
+    @staticmethod
+    async def _lookup(lookup: Optional[Callable[[], Optional[T]]]) -> Optional[T]:
+        # 조회 함수도 Redis를 읽으므로 이벤트 루프를 막지 않도록 스레드에서 실행
+        if lookup is None:
+            return None
+        return await asyncio.to_thread(lookup)
+
+    async def _release_lock(self, redis_client: Redis, lock_key: str, token: str):
+        try:
+            await asyncio.to_thread(
+                redis_client.eval, RELEASE_LOCK_SCRIPT, 1, lock_key, token
+            )
+        except Exception as e:
+            logger.error(f"Redis 락 해제 실패: {str(e)}")
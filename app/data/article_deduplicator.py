@@ -0,0 +1,208 @@
+import logging
+import re
+from typing import Dict, List
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+from app.config.settings import settings
+from app.models.dtos import NewsArticleDTO
+
+logger = logging.getLogger(__name__)
+
+SIGNATURE_KEY_PREFIX = "news:minhash"
+
+# 프로세스와 관계없이 같은 서명이 나오도록 고정된 시드 사용
+MINHASH_SEED = 20241101
+SHINGLE_BASE = 1_000_003
+WHITESPACE_PATTERN = re.compile(r"\s+")
+
+
+class ArticleDeduplicator:
+    """여러 언론사가 함께 보도한 거의 같은 기사를 MinHash로 찾습니다.
+
+    제목과 본문의 문자 n-gram을 NumPy로 한 번에 해싱해 서명을 만들고,
+    서명이 일치하는 비율(추정 Jaccard 유사도)이 임계값 이상이면 같은 기사로 봅니다.
+    서명은 URL별로 Redis에 저장해 다음 조회부터 다시 계산하지 않습니다.
+    """
+
+    def __init__(
+        self,
+        news_data_manager,
+        num_perm: int = settings.ARTICLE_DEDUP_NUM_PERM,
+        threshold: float = settings.ARTICLE_DEDUP_THRESHOLD,
+        shingle_size: int = settings.ARTICLE_DEDUP_SHINGLE_SIZE,
+    ):
+        self.news_data_manager = news_data_manager
+        self.num_perm = num_perm
+        self.threshold = threshold
+        self.shingle_size = shingle_size
+
+        rng = np.random.default_rng(MINHASH_SEED)
+        # multiply-shift 해시: 홀수 a로 곱한 뒤 상위 32비트 사용 (uint64 오버플로는 mod 2^64)
+        self.a = rng.integers(1, 2**63, size=num_perm, dtype=np.uint64) | np.uint64(1)
+        self.b = rng.integers(0, 2**63, size=num_perm, dtype=np.uint64)
+        # n-gram 다항식 해시 계수 (SHINGLE_BASE^i mod 2^64)
+        self.powers = np.array(
+            [pow(SHINGLE_BASE, i, 2**64) for i in range(shingle_size)],
+            dtype=np.uint64,
+        )
+
+    def shingle_hashes(self, text: str) -> np.ndarray:
+        """정규화한 텍스트의 문자 n-gram 해시값을 중복 없이 반환합니다."""
+        normalized = WHITESPACE_PATTERN.sub(" ", text).strip().lower()
+        codes = np.frombuffer(normalized.encode("utf-32-le"), dtype=np.uint32).astype(
+            np.uint64
+        )
+        if len(codes) < self.shingle_size:
+            codes = np.pad(codes, (0, self.shingle_size - len(codes)))
+        windows = sliding_window_view(codes, self.shingle_size)
+        return np.unique(windows @ self.powers)
+
+    def signature(self, article: NewsArticleDTO) -> np.ndarray:
+        """기사 제목과 본문으로 MinHash 서명을 계산합니다."""
+        hashes = self.shingle_hashes(f"{article.title} {article.content}")
+        hashed = (self.a[:, None] * hashes[None, :] + self.b[:, None]) >> np.uint64(32)
+        return hashed.min(axis=1).astype(np.uint32)
+
+    @staticmethod
+    def get_signature_key(url: str) -> str:
+        return f"{SIGNATURE_KEY_PREFIX}:{url}"
+
+    def load_signatures(
+        self, articles: List[NewsArticleDTO]
+    ) -> List[np.ndarray | None]:
+        """저장된 서명을 조회합니다. 조회 실패 시 모두 없는 것으로 처리합니다."""
+        redis_client = self.news_data_manager.redis_client
+        if redis_client is None or not articles:
+            return [None] * len(articles)
+        try:
+            values = redis_client.mget(
+                [self.get_signature_key(article.url) for article in articles]
+            )
+        except Exception as e:
+            logger.warning(f"기사 서명 조회 실패: {str(e)}")
+            return [None] * len(articles)
+
+        signatures = []
+        for value in values:
+            # 서명 길이 설정이 바뀐 경우 다시 계산
+            if value and len(value) == self.num_perm * 4:
+                signatures.append(np.frombuffer(value, dtype=np.uint32))
+            else:
+                signatures.append(None)
+        return signatures
+
+    def save_signatures(self, signatures: dict):
+        """서명을 저장합니다. 저장에 실패해도 중복 제거는 계속 진행합니다."""
+        redis_client = self.news_data_manager.redis_client
+        if redis_client is None or not signatures:
+            return
+        try:
+            pipe = redis_client.pipeline(transaction=False)
+            for url, signature in signatures.items():
+                pipe.setex(
+                    self.get_signature_key(url),
+                    settings.ARTICLE_SIGNATURE_TTL_SECONDS,
+                    signature.tobytes(),
+                )
+            pipe.execute()
+        except Exception as e:
+            logger.warning(f"기사 서명 저장 실패: {str(e)}")
+
+    def get_signatures(self, articles: List[NewsArticleDTO]) -> np.ndarray:
+        """기사별 서명 행렬을 반환합니다. 저장된 서명이 없는 기사만 계산해 저장합니다.
+
+        Args:
+            articles (List[NewsArticleDTO]): 뉴스 기사 목록
+
+        Returns:
+            np.ndarray: (기사 수, num_perm) 크기의 서명 행렬
+        """
+        signatures = self.load_signatures(articles)
+        created = {}
+        for index, article in enumerate(articles):
+            if signatures[index] is None:
+                signatures[index] = self.signature(article)
+                created[article.url] = signatures[index]
+        self.save_signatures(created)
+        return np.stack(signatures)
+
+    def precompute(self, articles: List[NewsArticleDTO]):
+        """기사 저장 시점에 서명을 미리 계산해 둡니다."""
+        if articles:
+            self.get_signatures(articles)
+
+    def find_representatives(self, articles: List[NewsArticleDTO]) -> List[int]:
+        """기사마다 같은 기사로 묶인 대표 기사의 인덱스를 반환합니다.
+
+        앞에 있는 기사가 묶음의 기준이 되며, 기준이 아닌 기사는 자신보다 앞선
+        기준 기사 중 유사도가 임계값 이상인 첫 기사에 묶입니다.
+
+        Args:
+            articles (List[NewsArticleDTO]): 뉴스 기사 목록
+
+        Returns:
+            List[int]: 기사별 대표 기사 인덱스
+        """
+        if len(articles) < 2:
+            return list(range(len(articles)))
+
+        signatures = self.get_signatures(articles)
+        # 모든 기사 쌍의 추정 Jaccard 유사도
+        similarity = (signatures[:, None, :] == signatures[None, :, :]).mean(axis=2)
+
+        representatives = []
+        kept = []
+        for index in range(len(articles)):
+            matches = [
+                candidate
+                for candidate in kept
+                if similarity[index, candidate] >= self.threshold
+            ]
+            if matches:
+                representatives.append(matches[0])
+            else:
+                representatives.append(index)
+                kept.append(index)
+        return representatives
+
+    @staticmethod
+    def choose_article(
+        articles: List[NewsArticleDTO], members: List[int]
+    ) -> NewsArticleDTO:
+        """같은 기사 묶음에서 남길 기사를 고릅니다.
+
+        요약이 있는 기사를 우선하고, 그중 가장 최근에 발행된 기사를 고릅니다.
+        종합 키워드 조회는 키워드별 결과를 이어 붙이므로 목록의 첫 기사가 최신 기사가 아닐 수 있습니다.
+        """
+        best = max(
+            members,
+            key=lambda index: (
+                articles[index].summary is not None,
+                articles[index].published_date,
+            ),
+        )
+        return articles[best]
+
+    def dedupe(self, articles: List[NewsArticleDTO]) -> List[NewsArticleDTO]:
+        """거의 같은 기사를 묶어 묶음마다 기사 하나만 남깁니다.
+
+        남는 기사는 choose_article로 고르며, 결과는 묶음의 대표 기사 순서를 따릅니다.
+
+        Args:
+            articles (List[NewsArticleDTO]): 뉴스 기사 목록
+
+        Returns:
+            List[NewsArticleDTO]: 중복을 제거한 뉴스 기사 목록
+        """
+        representatives = self.find_representatives(articles)
+        clusters: Dict[int, List[int]] = {}
+        for index, representative in enumerate(representatives):
+            clusters.setdefault(representative, []).append(index)
+        unique_articles = [
+            self.choose_article(articles, members) for members in clusters.values()
+        ]
+        if len(unique_articles) < len(articles):
+            logger.info(
+                f"중복 기사 {len(articles) - len(unique_articles)}개 제외 (전체 {len(articles)}개)"
+            )
+        return unique_articles
@@ -0,0 +1,252 @@
+"""news_articles 테이블 스키마 마이그레이션
+
+배포 전에 한 번 실행합니다. 이미 적용된 항목은 건너뜁니다.
+
+    python -m app.data.migrations            # 마이그레이션 적용
+    python -m app.data.migrations --explain  # 조회 쿼리 실행 계획 점검
+"""
+
+import argparse
+import logging
+import sys
+from typing import Dict, List, Tuple
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+from app.config.logging_config import setup_logging
+from app.config.settings import settings
+from app.data.news_data_manager import NewsDataManager
+from app.data.partitions import partition_table
+from app.models.dtos import SummaryRequestDTO
+from app.models.enums import PressName
+
+logger = logging.getLogger(__name__)
+
+# TEXT 계열 컬럼은 인덱스에 접두사 길이가 필요함
+TEXT_TYPES = {"tinytext", "text", "mediumtext", "longtext"}
+TEXT_PREFIX_LENGTH = 191
+
+# (인덱스 이름, 인덱스 키 목록)
+# 괄호로 감싼 키는 MySQL 8.0.13+ 함수 기반 키(숨겨진 생성 컬럼)로 만들어짐
+NEWS_ARTICLE_INDEXES: List[Tuple[str, List[str]]] = [
+    # 1, 3, 5일 조회: keyword/press 동등 조건 + published_date 범위 조건
+    ("idx_news_articles_keyword_press_date", ["keyword", "press", "published_date"]),
+    # 7일 조회: PARTITION BY press, DATE(published_date) ORDER BY published_date
+    (
+        "idx_news_articles_keyword_press_day",
+        ["keyword", "press", "(DATE(published_date))", "published_date"],
+    ),
+    # 순위가 매겨진 기사의 본문 컬럼을 다시 가져올 때 사용
+    ("idx_news_articles_url", ["url"]),
+]
+
+# (컬럼 이름, 컬럼 정의)
+NEWS_ARTICLE_COLUMNS: List[Tuple[str, str]] = [
+    # 제목·본문 해시. 다시 수집한 기사가 바뀌지 않았으면 갱신을 건너뜀
+    ("content_hash", "CHAR(40) NULL"),
+    # url이 TEXT 계열이면 전체 값에 고유 키를 걸 수 없으므로 해시 생성 컬럼을 사용
+    ("url_hash", "BINARY(20) AS (UNHEX(SHA1(url))) STORED"),
+]
+
+# INSERT ... ON DUPLICATE KEY UPDATE의 중복 판단 기준
+# 파티션 테이블의 고유 키는 파티션 컬럼(published_date)을 포함해야 함
+URL_UNIQUE_INDEX = "uq_news_articles_url"
+
+
+def get_column_types(engine: Engine, table: str) -> Dict[str, str]:
+    """테이블의 컬럼별 데이터 타입을 조회합니다."""
+    with engine.connect() as conn:
+        rows = conn.execute(
+            text("""
+                SELECT COLUMN_NAME, DATA_TYPE
+                FROM information_schema.COLUMNS
+                WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = :table
+                """),
+            {"table": table},
+        )
+        return {row[0]: row[1].lower() for row in rows}
+
+
+def get_index_names(engine: Engine, table: str) -> set:
+    """테이블에 이미 존재하는 인덱스 이름을 조회합니다."""
+    with engine.connect() as conn:
+        rows = conn.execute(
+            text("""
+                SELECT DISTINCT INDEX_NAME
+                FROM information_schema.STATISTICS
+                WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = :table
+                """),
+            {"table": table},
+        )
+        return {row[0] for row in rows}
+
+
+def build_index_key(key: str, column_types: Dict[str, str]) -> str:
+    """인덱스 키 정의를 만듭니다. TEXT 컬럼에는 접두사 길이를 붙입니다."""
+    if key.startswith("("):
+        return key
+    if column_types.get(key) in TEXT_TYPES:
+        return f"{key}({TEXT_PREFIX_LENGTH})"
+    return key
+
+
+def find_duplicate_urls(engine: Engine, limit: int = 5) -> List[str]:
+    """같은 발행 시각으로 두 번 이상 저장된 기사 URL을 조회합니다."""
+    with engine.connect() as conn:
+        rows = conn.exec_driver_sql(
+            """
+            SELECT url FROM news_articles
+            GROUP BY url, published_date HAVING COUNT(*) > 1
+            LIMIT %s
+            """,
+            (limit,),
+        )
+        return [row[0] for row in rows]
+
+
+def apply_migrations(engine: Engine) -> List[str]:
+    """news_articles 테이블에 필요한 컬럼과 인덱스를 생성하고 일 단위 파티션 테이블로 변환합니다.
+
+    url 고유 키는 중복 URL이 남아 있으면 만들지 않고 오류를 기록합니다.
+
+    Args:
+        engine (Engine): DB 엔진
+
+    Returns:
+        List[str]: 새로 적용된 마이그레이션 이름 목록
+    """
+    column_types = get_column_types(engine, "news_articles")
+    existing_indexes = get_index_names(engine, "news_articles")
+    applied = []
+
+    with engine.begin() as conn:
+        for column_name, definition in NEWS_ARTICLE_COLUMNS:
+            if column_name in column_types:
+                continue
+            if column_name == "url_hash" and column_types["url"] not in TEXT_TYPES:
+                continue
+            conn.exec_driver_sql(
+                f"ALTER TABLE news_articles ADD COLUMN {column_name} {definition}"
+            )
+            logger.info(f"컬럼 추가: {column_name} {definition}")
+            applied.append(column_name)
+
+    if URL_UNIQUE_INDEX not in existing_indexes:
+        duplicate_urls = find_duplicate_urls(engine)
+        if duplicate_urls:
+            logger.error(
+                f"중복 URL이 있어 {URL_UNIQUE_INDEX}를 만들 수 없습니다: {duplicate_urls}"
+            )
+        else:
+            key = "url_hash" if column_types["url"] in TEXT_TYPES else "url"
+            with engine.begin() as conn:
+                conn.exec_driver_sql(
+                    f"CREATE UNIQUE INDEX {URL_UNIQUE_INDEX} "
+                    f"ON news_articles ({key}, published_date)"
+                )
+            logger.info(f"인덱스 생성: {URL_UNIQUE_INDEX} ({key}, published_date)")
+            applied.append(URL_UNIQUE_INDEX)
+
+    with engine.begin() as conn:
+        for index_name, keys in NEWS_ARTICLE_INDEXES:
+            if index_name in existing_indexes:
+                continue
+            index_keys = ", ".join(build_index_key(key, column_types) for key in keys)
+            conn.exec_driver_sql(
+                f"CREATE INDEX {index_name} ON news_articles ({index_keys})"
+            )
+            logger.info(f"인덱스 생성: {index_name} ({index_keys})")
+            applied.append(index_name)
+
+    # 고유 키를 만든 뒤에 변환해야 파티션 컬럼이 포함된 키로 만들어짐
+    if partition_table(
+        engine, settings.ARTICLE_RETENTION_DAYS, settings.PARTITION_PRECREATE_DAYS
+    ):
+        applied.append("partition_by_published_date")
+
+    return applied
+
+
+def explain_query(engine: Engine, query: str, params: tuple) -> List[dict]:
+    """쿼리의 실행 계획을 조회합니다."""
+    with engine.connect() as conn:
+        result = conn.exec_driver_sql(f"EXPLAIN {query}", params)
+        return [dict(row._mapping) for row in result]
+
+
+def find_full_table_scans(plan: List[dict]) -> List[dict]:
+    """실행 계획에서 실제 테이블을 전체 스캔하는 단계를 찾습니다.
+
+    WITH 절 결과(<derived..>)를 읽는 단계는 제외합니다.
+    """
+    return [
+        step
+        for step in plan
+        if step.get("type") == "ALL"
+        and not str(step.get("table") or "").startswith("<")
+    ]
+
+
+def check_query_plans(
+    news_data_manager: NewsDataManager,
+) -> List[Tuple[SummaryRequestDTO, List[dict]]]:
+    """모든 기간과 언론사 수 조합의 조회 쿼리가 테이블 전체 스캔을 하지 않는지 점검합니다.
+
+    테이블이 7일치 이상으로 커져도 인덱스 조회가 유지되는지 확인하는 용도입니다.
+
+    Args:
+        news_data_manager (NewsDataManager): 쿼리를 생성하고 실행할 데이터 매니저
+
+    Returns:
+        List[Tuple[SummaryRequestDTO, List[dict]]]: 전체 스캔이 발견된 요청과 해당 단계
+    """
+    presses = list(PressName)
+    failures = []
+    for period, press_counts in settings.ARTICLES_PER_DAY_MATRIX.items():
+        for press_count in press_counts:
+            request = SummaryRequestDTO(
+                keyword=settings.NEWS_KEYWORD[0],
+                press=presses[:press_count],
+                period=period,
+            )
+            for is_combined in (False, True):
+                query, params, _ = news_data_manager.get_query_and_params(
+                    request, is_combined=is_combined
+                )
+                full_scans = find_full_table_scans(
+                    explain_query(news_data_manager.engine, query, params)
+                )
+                if full_scans:
+                    failures.append((request, full_scans))
+    return failures
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="news_articles 스키마 마이그레이션")
+    parser.add_argument(
+        "--explain",
+        action="store_true",
+        help="마이그레이션 대신 조회 쿼리의 실행 계획을 점검합니다.",
+    )
+    args = parser.parse_args()
+
+    setup_logging()
+    news_data_manager = NewsDataManager()
+    if news_data_manager.engine is None:
+        return 1
+
+    if args.explain:
+        failures = check_query_plans(news_data_manager)
+        for request, steps in failures:
+            logger.error(f"테이블 전체 스캔 발견: {request} -> {steps}")
+        if failures:
+            return 1
+        logger.info("모든 조회 쿼리가 인덱스를 사용합니다.")
+        return 0
+
+    applied = apply_migrations(news_data_manager.engine)
+    logger.info(f"적용된 마이그레이션: {applied or '없음'}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,32 +1,275 @@
+import asyncio
+import hashlib
 import json
-from typing import List
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Callable, Dict, Iterable, List, Tuple
 from app.config.settings import settings
 from app.models.dtos import (
+    ApiResponseDTO,
     NewsArticleDTO,
+    SummaryItemDTO,
     SummaryRequestDTO,
     NewsArticleSourceDTO,
     SummaryResponseDTO,
 )
-import pandas as pd
 from datetime import datetime, timedelta
 import logging
-from app.core.database_connection import get_database_connection, get_redis_connection
+from redis import Redis
+from sqlalchemy.engine import Engine
+from app.core.database_connection import (
+    get_database_connection,
+    get_pool_stats,
+    get_redis_connection,
+)
+from app.core.cache_codec import CacheCodec
+from app.core.local_cache import LocalCache
+from app.core.metrics import SUMMARY_STAGE_SECONDS
+from app.core.rendered_response import RenderedResponse
+from app.models.enums import PressName
 
 logger = logging.getLogger(__name__)
 
+# 직렬화된 최종 API 응답을 저장하는 캐시 키 접두사
+RESPONSE_KEY_PREFIX = "news:response"
+
+# 요약 캐시가 갱신되면 다른 인스턴스의 로컬 캐시를 무효화하기 위한 채널
+SUMMARY_INVALIDATION_CHANNEL = "news:summary:invalidate"
+
+# (키워드, 언론사)별 기사 버전 카운터 키 접두사. 기사가 수집될 때마다 증가하며 만료되지 않음
+CONTENT_VERSION_KEY_PREFIX = "news:version"
+
+# 기사 버전이 바뀌면 각 인스턴스의 버전 캐시와 헤드라인을 갱신하기 위한 채널
+CONTENT_UPDATE_CHANNEL = "news:content:updated"
+
+# 요청의 언론사 코드 -> DB에 저장된 언론사 이름
+PRESS_NAMES = {"hk": "한국경제", "mk": "매일경제", "sed": "서울경제"}
+
 
 class NewsDataManager:
     def __init__(self):
-        self.engine = get_database_connection()
-        self.redis_client = get_redis_connection()
+        self._engine = get_database_connection()
+        self._redis_client = get_redis_connection()
+        now = time.monotonic()
+        self._last_connect_attempt = {"engine": now, "redis": now}
+        # PyMySQL은 동기 드라이버이므로 DB 조회는 전용 스레드 풀에서 실행해 이벤트 루프를 막지 않음
+        self.db_executor = ThreadPoolExecutor(
+            max_workers=settings.DB_EXECUTOR_MAX_WORKERS,
+            thread_name_prefix="news-db",
+        )
+        # Redis 앞단의 프로세스 내부 캐시 (검증된 SummaryResponseDTO와 직렬화된 응답 저장)
+        self.local_cache = LocalCache(
+            max_size=settings.LOCAL_CACHE_MAX_SIZE,
+            ttl=settings.LOCAL_CACHE_TTL_SECONDS,
+        )
+        self.local_cache_date = None
+        self.cache_codec = CacheCodec(
+            serializer=settings.CACHE_SERIALIZER,
+            compression=settings.CACHE_COMPRESSION,
+            compression_min_bytes=settings.CACHE_COMPRESSION_MIN_BYTES,
+        )
+        self.redis_hits = 0
+        self.redis_misses = 0
+        self.instance_id = uuid.uuid4().hex
+        self.invalidation_thread = None
+        # 로컬 캐시 무효화 구독을 요청받았는지 여부 (Redis 재연결 시 구독 시작에 사용)
+        self.invalidation_requested = False
+        # 버전 키 -> (버전, Redis에서 읽은 시각)
+        self.content_versions: Dict[str, Tuple[int, float]] = {}
+        # 새 기사가 수집되었을 때 호출할 함수 (헤드라인 캐시 무효화 등)
+        self.content_update_listeners: List[Callable[[], None]] = []
+
+    @property
+    def engine(self) -> Engine | None:
+        """DB 엔진. 기동 시 연결에 실패했으면 일정 간격으로 다시 연결을 시도합니다."""
+        if self._engine is None and self._should_reconnect("engine"):
+            self._engine = get_database_connection()
+        return self._engine
+
+    @engine.setter
+    def engine(self, engine: Engine | None):
+        self._engine = engine
+
+    @property
+    def redis_client(self) -> Redis | None:
+        """Redis 클라이언트. 기동 시 연결에 실패했으면 일정 간격으로 다시 연결을 시도합니다."""
+        if self._redis_client is None and self._should_reconnect("redis"):
+            self._redis_client = get_redis_connection()
+            # 기동 시 Redis가 없어 구독하지 못했다면 다시 연결된 지금 구독을 시작
+            if self._redis_client is not None and self.invalidation_requested:
+                try:
+                    self.start_cache_invalidation_listener()
+                except Exception as e:
+                    logger.error(f"로컬 캐시 무효화 구독 시작 실패: {str(e)}")
+        return self._redis_client
+
+    @redis_client.setter
+    def redis_client(self, redis_client: Redis | None):
+        self._redis_client = redis_client
+
+    def _should_reconnect(self, name: str) -> bool:
+        now = time.monotonic()
+        if now - self._last_connect_attempt[name] < settings.RECONNECT_INTERVAL_SECONDS:
+            return False
+        self._last_connect_attempt[name] = now
+        return True
+
+    def get_pool_stats(self) -> dict:
+        """MySQL과 Redis 연결 풀 사용 현황을 반환합니다."""
+        return get_pool_stats(self._engine)
+
+    @staticmethod
+    def get_target_date() -> datetime:
+        """데이터 조회와 캐시 키의 기준 시각(06:15)을 반환합니다.
+
+        현재가 오늘 06:15 이전이면 어제 06:15을 기준 시각으로 사용합니다.
+
+        Returns:
+            datetime: 기준 시각
+        """
+        now = datetime.now()
+
+        # 오늘 06:15으로 기준 시각 설정
+        today_base = now.replace(hour=6, minute=15, second=0, microsecond=0)
+
+        # 현재가 오늘 06:15 이전이면 어제 06:15을 기준으로 날짜 범위를 설정
+        if now < today_base:
+            return today_base - timedelta(days=1)
+        return today_base
+
+    def get_cache_key(
+        self,
+        keyword: str,
+        press: List[str],
+        period: str,
+        prefix: str = "news:summary",
+        version: int | None = None,
+    ) -> str:
+        """요약 결과의 Redis 캐시 키를 생성합니다.
+
+        언론사는 정렬해서 넣으므로 요청의 언론사 순서가 달라도 같은 키를 사용합니다.
+
+        Args:
+            keyword (str): 키워드
+            press (List[str]): 언론사
+            period (str): 기간
+            prefix (str): 키 접두사 (news:summary: 요약 DTO, news:response: 직렬화된 응답)
+            version (int | None): 기사 버전 (None이면 가장 최근에 저장된 결과의 키)
+
+        Returns:
+            str: 캐시 키
+        """
+        target_date = self.get_target_date()
+        press = sorted(press)
+        key = f"{prefix}:{target_date.strftime('%Y%m%d')}:{keyword}:{press}:{period}"
+        if version is None:
+            return key
+        return f"{key}:v{version}"
+
+    @staticmethod
+    def get_content_version_keys(keyword: str, press: List[str]) -> List[str]:
+        """요청이 읽는 (키워드, 언론사)별 버전 카운터 키를 반환합니다."""
+        keywords = settings.NEWS_KEYWORD if keyword == "종합" else [keyword]
+        return [
+            f"{CONTENT_VERSION_KEY_PREFIX}:{kw}:{PRESS_NAMES[PressName(p).value]}"
+            for kw in keywords
+            for p in press
+        ]
+
+    def get_content_version(self, keyword: str, press: List[str]) -> int:
+        """요청이 읽는 기사들의 버전을 반환합니다.
+
+        카운터는 증가만 하므로 합계는 어느 카운터가 바뀌어도 커집니다.
+        값은 프로세스에 보관하고 CONTENT_VERSION_REFRESH_SECONDS가 지난 키만 Redis에서
+        다시 읽습니다. 수집 알림을 받으면 그 전에 바로 갱신됩니다.
+
+        Args:
+            keyword (str): 키워드
+            press (List[str]): 언론사
+
+        Returns:
+            int: 기사 버전
+        """
+        keys = self.get_content_version_keys(keyword, press)
+        now = time.monotonic()
+        expired = [
+            key
+            for key in keys
+            if key not in self.content_versions
+            or now - self.content_versions[key][1]
+            >= settings.CONTENT_VERSION_REFRESH_SECONDS
+        ]
+        if expired and self.redis_client:
+            try:
+                for key, value in zip(expired, self.redis_client.mget(expired)):
+                    self.content_versions[key] = (int(value or 0), now)
+            except Exception as e:
+                logger.error(f"기사 버전 조회 중 오류 발생: {str(e)}")
+        return sum(self.content_versions.get(key, (0, now))[0] for key in keys)
+
+    async def get_content_version_async(self, keyword: str, press: List[str]) -> int:
+        """get_content_version을 이벤트 루프를 막지 않고 실행합니다.
+
+        프로세스에 보관한 버전이 모두 유효하면 Redis를 읽지 않으므로 바로 계산하고,
+        다시 읽어야 하는 키가 있을 때만 스레드에서 실행합니다.
+
+        Args:
+            keyword (str): 키워드
+            press (List[str]): 언론사
+
+        Returns:
+            int: 기사 버전
+        """
+        keys = self.get_content_version_keys(keyword, press)
+        now = time.monotonic()
+        if all(
+            key in self.content_versions
+            and now - self.content_versions[key][1]
+            < settings.CONTENT_VERSION_REFRESH_SECONDS
+            for key in keys
+        ):
+            return sum(self.content_versions[key][0] for key in keys)
+        return await asyncio.to_thread(self.get_content_version, keyword, press)
+
+    def bump_content_versions(self, groups: Iterable[Tuple[str, str]]) -> dict:
+        """새 기사가 저장된 (키워드, 언론사 이름)의 버전을 올리고 각 인스턴스에 알립니다.
+
+        Args:
+            groups (Iterable[Tuple[str, str]]): (키워드, 언론사 이름) 목록
+
+        Returns:
+            dict: 버전 키별 새 버전 (Redis 연결이 없거나 실패하면 빈 dict)
+        """
+        keys = sorted(
+            {
+                f"{CONTENT_VERSION_KEY_PREFIX}:{keyword}:{press}"
+                for keyword, press in groups
+            }
+        )
+        if not keys or not self.redis_client:
+            return {}
+        try:
+            pipeline = self.redis_client.pipeline(transaction=False)
+            for key in keys:
+                pipeline.incr(key)
+            versions = dict(zip(keys, pipeline.execute()))
+            self.redis_client.publish(
+                CONTENT_UPDATE_CHANNEL, json.dumps({"versions": versions})
+            )
+            return versions
+        except Exception as e:
+            logger.error(f"기사 버전 갱신 중 오류 발생: {str(e)}")
+            return {}
 
     def get_query_and_params(
         self, request: SummaryRequestDTO, is_combined: bool = False
     ) -> tuple:
         """쿼리와 파라미터를 생성합니다.
 
-        period가 7일인 경우 전체 데이터를 조회하고,
-        1, 3, 5일인 경우 정확한 시간 간격으로 데이터를 조회합니다.
+        기준 시각으로부터 period일 이내의 기사를 조회합니다.
+        7일은 언론사·날짜별로, 1, 3, 5일은 정확한 시간 간격으로 순위를 매깁니다.
 
         Args:
             request: 요청 DTO (키워드, 언론사, 기간 포함)
@@ -36,20 +279,10 @@ class NewsDataManager:
             tuple[str, tuple]: SQL 쿼리문, 파라미터, 기준 시각
         """
 
-        now = datetime.now()
-
-        # 오늘 06:15으로 기준 시각 설정
-        today_base = now.replace(hour=6, minute=15, second=0, microsecond=0)
-
-        # 현재가 오늘 06:15 이전이면 어제 06:15을 기준으로 날짜 범위를 설정
-        if now < today_base:
-            target_date = today_base - timedelta(days=1)
-        else:
-            target_date = today_base
+        target_date = self.get_target_date()
 
         # press 코드를 실제 press 이름으로 변환
-        press_mapping = {"hk": "한국경제", "mk": "매일경제", "sed": "서울경제"}
-        press_names = [press_mapping[p.value] for p in request.press]
+        press_names = [PRESS_NAMES[p.value] for p in request.press]
 
         # IN 절을 위한 플레이스홀더(%s) 생성
         placeholders = ", ".join(["%s"] * len(press_names))
@@ -60,71 +293,49 @@ class NewsDataManager:
         ]
         logger.info(f"articles_per_press: {articles_per_press}")
 
+        # 모든 기간에 published_date 하한을 두어 기간에 해당하는 날짜 파티션만 읽도록 함
+        where_clause = f"""published_date >= DATE_SUB(%s, INTERVAL %s DAY)
+                AND keyword = %s
+                AND press IN ({placeholders})"""
+        params = (
+            target_date,
+            request.period,
+            request.keyword,
+            *press_names,
+        )
         if request.period == 7:
-            # 7일이면 전체 데이터 조회 (어차피 DB에는 7일치만 있음)
-
-            # WITH 절로 임시 결과 집합을 만들어서 rank를 부여하고, article_per_press만큼만 선택
-            query = f"""
-                WITH RankedNews AS (
-                    SELECT *,
-                        ROW_NUMBER() OVER (
-                            PARTITION BY press, DATE(published_date)
-                            ORDER BY published_date DESC
-                        ) as row_num
-                    FROM news_articles
-                    WHERE keyword = %s
-                    AND press IN ({placeholders})
-                )
-                SELECT url, title, content, published_date, press, keyword, summary
-                FROM RankedNews
-                WHERE row_num <= {articles_per_press}
-                ORDER BY published_date DESC
-            """
-            params = (request.keyword, *press_names)
+            partition_by = "press, DATE(published_date)"
+            row_limit = articles_per_press
         else:
             # 1, 3, 5일은 시간 단위로 조회
-
-            # WITH 절로 임시 결과 집합을 만들어서 rank를 부여하고, article_per_press만큼만 선택
-            base_query = f"""
-                WITH RankedNews AS (
-                    SELECT *,
-                        ROW_NUMBER() OVER (
-                            PARTITION BY press{', DATE(published_date)' if request.period > 1 else ''}
-                            ORDER BY published_date DESC
-                        ) as row_num
-                    FROM news_articles
-                    WHERE published_date >= DATE_SUB(%s, INTERVAL %s DAY)
-                    AND keyword = %s
-                    AND press IN ({placeholders})
-                )
-            """
-            if is_combined:  # 종합 키워드 조회
-                query = (
-                    base_query
-                    + """
-                    SELECT url, title, content, published_date, press, keyword, summary
-                    FROM RankedNews
-                    WHERE row_num = 1
-                    ORDER BY published_date DESC
-                """
-                )
-            else:
-                query = (
-                    base_query
-                    + f"""
-                    SELECT url, title, content, published_date, press, keyword, summary
-                    FROM RankedNews
-                    WHERE row_num <= {articles_per_press}
-                    ORDER BY published_date DESC
-                """
-                )
-
-            params = (
-                target_date,
-                request.period,
-                request.keyword,
-                *press_names,
+            partition_by = (
+                f"press{', DATE(published_date)' if request.period > 1 else ''}"
             )
+            # 종합 키워드 조회는 언론사별로 1개씩만 선택
+            row_limit = 1 if is_combined else articles_per_press
+
+        # WITH 절에서는 좁은 컬럼만으로 rank를 부여하고(인덱스 범위 조회),
+        # article_per_press만큼 선택된 기사에 대해서만 content 등 본문 컬럼을 가져옴
+        query = f"""
+            WITH RankedNews AS (
+                SELECT url, published_date,
+                    ROW_NUMBER() OVER (
+                        PARTITION BY {partition_by}
+                        ORDER BY published_date DESC
+                    ) as row_num
+                FROM news_articles
+                WHERE {where_clause}
+            )
+            SELECT n.url, n.title, n.content, n.published_date, n.press, n.keyword, n.summary
+            FROM RankedNews r
+            JOIN news_articles n
+                ON n.url = r.url
+                AND n.published_date = r.published_date
+                AND n.keyword = %s
+            WHERE r.row_num <= {row_limit}
+            ORDER BY r.published_date DESC
+        """
+        params = (*params, request.keyword)
 
         return query, params, target_date
 
@@ -153,18 +364,18 @@ class NewsDataManager:
 
             logger.info(f"request: {request}")
 
-            df = pd.read_sql_query(
-                query, self.engine, params=params, parse_dates=["published_date"]
-            )
+            with SUMMARY_STAGE_SECONDS.labels(stage="sql").time():
+                if settings.DB_RETRIEVAL_MODE == "dataframe":
+                    articles = self.fetch_articles_dataframe(query, params)
+                else:
+                    articles = self.fetch_articles_stream(query, params)
 
-            if df.empty:
+            if not articles:
                 logger.warning(
                     f"{target_date.date()} 날짜의 {request.keyword}에 대한 뉴스 기사가 없습니다."
                 )
                 return []
 
-            articles = [NewsArticleDTO(**row) for row in df.to_dict("records")]
-
             logger.info(
                 f"Retrieved {len(articles)} articles for keyword: {request.keyword}"
             )
@@ -174,6 +385,65 @@ class NewsDataManager:
             logger.error(f"DB에서 뉴스 가져오는 중 오류 발생: {str(e)}")
             raise
 
+    def fetch_articles_stream(self, query: str, params: tuple) -> List[NewsArticleDTO]:
+        """커서에서 읽은 행을 바로 NewsArticleDTO로 변환합니다.
+
+        DataFrame을 거치지 않아 기사 본문을 한 번만 복사합니다.
+
+        Args:
+            query (str): SQL 쿼리문
+            params (tuple): 쿼리 파라미터
+
+        Returns:
+            List[NewsArticleDTO]: 뉴스 기사 목록
+        """
+        with self.engine.connect() as conn:
+            result = conn.execution_options(stream_results=True).exec_driver_sql(
+                query, params
+            )
+            return [NewsArticleDTO(**row._mapping) for row in result]
+
+    def fetch_articles_dataframe(
+        self, query: str, params: tuple
+    ) -> List[NewsArticleDTO]:
+        """pandas DataFrame으로 조회한 뒤 NewsArticleDTO로 변환합니다.
+
+        Args:
+            query (str): SQL 쿼리문
+            params (tuple): 쿼리 파라미터
+
+        Returns:
+            List[NewsArticleDTO]: 뉴스 기사 목록
+        """
+        # pandas는 이 조회 방식을 사용할 때만 불러옴
+        import pandas as pd
+
+        df = pd.read_sql_query(
+            query, self.engine, params=params, parse_dates=["published_date"]
+        )
+        return [NewsArticleDTO(**row) for row in df.to_dict("records")]
+
+    async def retrieve_news_articles_async(
+        self, request: SummaryRequestDTO, is_combined: bool = False
+    ) -> List[NewsArticleDTO]:
+        """DB에서 뉴스 기사를 이벤트 루프를 막지 않고 조회합니다.
+
+        retrieve_news_articles를 크기가 제한된 DB 전용 스레드 풀에서 실행합니다.
+        동시에 실행되는 쿼리 수는 DB_EXECUTOR_MAX_WORKERS로 제한됩니다.
+
+        Args:
+            request: 요청 DTO (키워드, 언론사, 기간 포함)
+            is_combined: 종합 키워드 조회 여부 (기본값: False)
+
+        Returns:
+            List[NewsArticleDTO]: 뉴스 기사 목록
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self.db_executor,
+            partial(self.retrieve_news_articles, request, is_combined),
+        )
+
     def convert_articles(
         self, articles: List[NewsArticleDTO]
     ) -> List[NewsArticleSourceDTO]:
@@ -217,62 +487,255 @@ class NewsDataManager:
 
         return articles_dto
 
+    def retrieve_articles_without_summary(
+        self, after_url: str, after_published_date: datetime | None, limit: int
+    ) -> List[NewsArticleDTO]:
+        """요약이 없는 기사를 (url, published_date) 순으로 조회합니다 (keyset 페이지네이션).
+
+        파티션 테이블의 고유 키는 (url, published_date)이므로 url만으로 페이지를 나누면
+        같은 url의 행이 페이지 경계에서 빠질 수 있습니다.
+
+        Args:
+            after_url (str): 이전 페이지의 마지막 url (처음이면 빈 문자열)
+            after_published_date (datetime | None): 이전 페이지의 마지막 발행 시각
+                (None이면 after_url의 행을 모두 건너뜀)
+            limit (int): 조회할 최대 행 수
+
+        Returns:
+            List[NewsArticleDTO]: 뉴스 기사 목록
+        """
+        if after_published_date is None:
+            after_clause = "url > %s"
+            params = (after_url, limit)
+        else:
+            after_clause = "(url > %s OR (url = %s AND published_date > %s))"
+            params = (after_url, after_url, after_published_date, limit)
+        query = f"""
+            SELECT url, title, content, published_date, press, keyword, summary
+            FROM news_articles
+            WHERE summary IS NULL AND {after_clause}
+            ORDER BY url, published_date
+            LIMIT %s
+        """
+        return self.fetch_articles_stream(query, params)
+
+    def get_existing_urls(self, urls: List[str]) -> set:
+        """이미 저장된 기사 URL을 반환합니다.
+
+        Args:
+            urls (List[str]): 확인할 URL 목록
+
+        Returns:
+            set: DB에 있는 URL 집합
+        """
+        if not urls:
+            return set()
+        placeholders = ", ".join(["%s"] * len(urls))
+        with self.engine.connect() as conn:
+            result = conn.exec_driver_sql(
+                f"SELECT url FROM news_articles WHERE url IN ({placeholders})",
+                tuple(urls),
+            )
+            return {row.url for row in result}
+
+    @staticmethod
+    def get_content_hash(article: NewsArticleDTO) -> str:
+        """기사 제목과 본문의 해시를 반환합니다. 바뀌지 않은 기사를 다시 쓰지 않는 데 사용합니다."""
+        return hashlib.sha1(
+            f"{article.title}\n{article.content}".encode("utf-8")
+        ).hexdigest()
+
+    @staticmethod
+    def get_article_key(url: str, published_date: datetime) -> Tuple[str, datetime]:
+        """저장된 행과 비교할 (url, 발행 시각) 키를 반환합니다.
+
+        DB에는 시간대 없이 초 단위로 저장되므로 같은 기준으로 맞춥니다.
+        """
+        return url, published_date.replace(tzinfo=None, microsecond=0)
+
+    def upsert_articles(
+        self, articles: List[NewsArticleDTO]
+    ) -> Dict[Tuple[str, str], int]:
+        """수집한 기사 중 새로 생겼거나 바뀐 기사만 다중 행 INSERT ... ON DUPLICATE KEY UPDATE로 저장합니다.
+
+        저장된 행의 published_date·content_hash와 비교해 바뀌지 않은 기사는 쓰지 않습니다.
+        SQLAlchemy는 FOUND_ROWS 플래그로 연결하므로 rowcount로는 값이 그대로인 행을
+        구분할 수 없어, 바뀐 기사 수는 비교 결과로 셉니다.
+
+        같은 url·published_date의 기사가 있으면 content_hash가 달라진 경우에만
+        내용을 갱신하고 요약을 비웁니다 (파티션 테이블의 고유 키는 published_date를 포함해야 함).
+        MySQL은 대입을 왼쪽부터 적용하므로 content_hash는 마지막에 갱신해야 합니다.
+
+        고유 키에 published_date가 포함되어 발행 시각이 정정된 기사는 중복으로 판단되지 않으므로,
+        같은 트랜잭션에서 발행 시각이 다른 기존 행을 먼저 지워 url당 한 행을 유지합니다.
+        묶음 안에 같은 url이 여러 번 있으면 마지막 기사만 저장합니다.
+
+        Args:
+            articles (List[NewsArticleDTO]): 저장할 기사 목록
+
+        Returns:
+            Dict[Tuple[str, str], int]: (키워드, 언론사 이름)별 새로 저장되거나 바뀐 기사 수
+        """
+        if not articles:
+            return {}
+        articles = list({article.url: article for article in articles}.values())
+        content_hashes = {
+            article.url: self.get_content_hash(article) for article in articles
+        }
+        url_placeholders = ", ".join(["%s"] * len(articles))
+        unchanged = "content_hash <=> VALUES(content_hash)"
+        with self.engine.begin() as conn:
+            stored = {
+                self.get_article_key(row.url, row.published_date): row.content_hash
+                for row in conn.exec_driver_sql(
+                    f"""
+                    SELECT url, published_date, content_hash FROM news_articles
+                    WHERE url IN ({url_placeholders})
+                    """,
+                    tuple(content_hashes),
+                )
+            }
+            changed = [
+                article
+                for article in articles
+                if stored.get(self.get_article_key(article.url, article.published_date))
+                != content_hashes[article.url]
+            ]
+            if not changed:
+                return {}
+
+            conn.exec_driver_sql(
+                "DELETE FROM news_articles WHERE url = %s AND published_date <> %s",
+                [(article.url, article.published_date) for article in changed],
+            )
+            placeholders = ", ".join(["(%s, %s, %s, %s, %s, %s, %s)"] * len(changed))
+            params = []
+            for article in changed:
+                params.extend(
+                    (
+                        article.url,
+                        article.title,
+                        article.content,
+                        article.published_date,
+                        article.press,
+                        article.keyword,
+                        content_hashes[article.url],
+                    )
+                )
+            conn.exec_driver_sql(
+                f"""
+                INSERT INTO news_articles
+                    (url, title, content, published_date, press, keyword, content_hash)
+                VALUES {placeholders}
+                ON DUPLICATE KEY UPDATE
+                    title = IF({unchanged}, title, VALUES(title)),
+                    content = IF({unchanged}, content, VALUES(content)),
+                    summary = IF({unchanged}, summary, NULL),
+                    content_hash = VALUES(content_hash)
+                """,
+                tuple(params),
+            )
+
+        affected: Dict[Tuple[str, str], int] = {}
+        for article in changed:
+            group = (article.keyword, article.press)
+            affected[group] = affected.get(group, 0) + 1
+        return affected
+
+    def update_article_summaries(
+        self, summaries: List[Tuple[str, datetime, str]]
+    ) -> int:
+        """기사 요약을 한 트랜잭션에서 일괄 저장합니다.
+
+        Args:
+            summaries (List[Tuple[str, datetime, str]]): (url, 발행 시각, 요약) 목록
+
+        Returns:
+            int: 갱신된 행 수
+        """
+        if not summaries:
+            return 0
+        with self.engine.begin() as conn:
+            result = conn.exec_driver_sql(
+                "UPDATE news_articles SET summary = %s "
+                "WHERE url = %s AND published_date = %s",
+                [
+                    (summary, url, published_date)
+                    for url, published_date, summary in summaries
+                ],
+            )
+        return result.rowcount
+
     def caching_results(
-        self, keyword: str, press: List[str], period: str, response: SummaryResponseDTO
+        self,
+        keyword: str,
+        press: List[str],
+        period: str,
+        response: SummaryResponseDTO,
+        version: int = 0,
     ):
         """뉴스 기사를 Redis에 캐싱합니다.
 
+        기사 버전이 붙은 키와 함께, 새 버전의 요약이 만들어지는 동안 대신 반환할
+        최근 결과 키(버전 없음)에도 저장합니다.
+
         Args:
             keyword (str): 키워드
             press (List[str]): 언론사
             period (str): 기간
             response (SummaryResponseDTO): 요약 결과 DTO
+            version (int): 요약에 사용한 기사의 버전
 
         Raises:
             Exception: 캐시 중 오류 발생 시
         """
         try:
-            now = datetime.now()
-
-            # 오늘 06:15으로 기준 시각 설정
-            today_base = now.replace(hour=6, minute=15, second=0, microsecond=0)
-
-            # 현재가 오늘 06:15 이전이면 어제 06:15을 기준으로 날짜 범위를 설정
-            if now < today_base:
-                target_date = today_base - timedelta(days=1)
-            else:
-                target_date = today_base
-
             if self.redis_client and response.summaries:
-                key = f"news:summary:{target_date.strftime('%Y%m%d')}:{keyword}:{press}:{period}"
-
-                response_dict = self.convert_timestamps(obj=response.model_dump())
+                key = self.get_cache_key(keyword, press, period, version=version)
+                response_key = self.get_cache_key(
+                    keyword, press, period, prefix=RESPONSE_KEY_PREFIX, version=version
+                )
+                latest_key = self.get_cache_key(keyword, press, period)
+                latest_response_key = self.get_cache_key(
+                    keyword, press, period, prefix=RESPONSE_KEY_PREFIX
+                )
 
-                self.redis_client.setex(key, 60 * 60 * 24, json.dumps(response_dict))
+                # mode="json"으로 datetime을 ISO 문자열로 변환
+                cached_value = self.cache_codec.encode(response.model_dump(mode="json"))
+                # 캐시 적중 시 그대로 반환할 최종 API 응답 본문
+                rendered = self.render_response(response)
+
+                pipeline = self.redis_client.pipeline(transaction=False)
+                pipeline.setex(key, 60 * 60 * 24, cached_value)
+                pipeline.setex(response_key, 60 * 60 * 24, rendered.body)
+                pipeline.setex(latest_key, 60 * 60 * 24, cached_value)
+                pipeline.setex(latest_response_key, 60 * 60 * 24, rendered.body)
+                pipeline.publish(
+                    SUMMARY_INVALIDATION_CHANNEL,
+                    json.dumps(
+                        {
+                            "keys": [latest_key, latest_response_key],
+                            "instance": self.instance_id,
+                        }
+                    ),
+                )
+                pipeline.execute()
+                self.local_cache.set(key, response)
+                self.local_cache.set(response_key, rendered)
+                self.local_cache.set(latest_key, response)
+                self.local_cache.set(latest_response_key, rendered)
                 logger.info(f"캐시된 결과: {key}")
         except Exception as e:
             logger.error(f"캐시 중 오류 발생: {str(e)}")
             raise
 
-    def convert_timestamps(self, obj):
-        """Timestamp 객체를 문자열로 변환합니다.
-
-        Args:
-            obj: 변환할 객체
-
-        Returns:
-            str: 변환된 문자열
-        """
-        if isinstance(obj, dict):
-            return {key: self.convert_timestamps(value) for key, value in obj.items()}
-        elif isinstance(obj, list):
-            return [self.convert_timestamps(item) for item in obj]
-        elif isinstance(obj, datetime):
-            return obj.isoformat()
-        return obj
-
     def get_cached_results(
-        self, keyword: str, press: List[str], period: str
+        self,
+        keyword: str,
+        press: List[str],
+        period: str,
+        version: int | None = None,
+        record_stats: bool = False,
     ) -> SummaryResponseDTO | None:
         """Redis에서 캐싱된 뉴스 기사를 가져옵니다.
 
@@ -280,30 +743,247 @@ class NewsDataManager:
             keyword (str): 키워드
             press (List[str]): 언론사
             period (str): 기간
+            version (int | None): 기사 버전 (None이면 가장 최근에 저장된 결과)
+            record_stats (bool): Redis 적중/미적중 횟수 기록 여부.
+                이전 버전 조회나 대기 중 재조회가 중복으로 세지 않도록 요청의 첫 조회에서만 기록
 
         Returns:
-            SummaryResponseDTO: 캐싱된 결과 DTO
+            SummaryResponseDTO | None: 캐싱된 결과 DTO (없거나 조회에 실패하면 None)
         """
         try:
-            now = datetime.now()
+            key = self.get_cache_key(keyword, press, period, version=version)
 
-            # 오늘 06:15으로 기준 시각 설정
-            today_base = now.replace(hour=6, minute=15, second=0, microsecond=0)
+            self.sync_local_cache_date()
+            local_result = self.local_cache.get(key)
+            if local_result is not None:
+                return local_result
 
-            # 현재가 오늘 06:15 이전이면 어제 06:15을 기준으로 날짜 범위를 설정
-            if now < today_base:
-                target_date = today_base - timedelta(days=1)
-            else:
-                target_date = today_base
-
-            key = f"news:summary:{target_date.strftime('%Y%m%d')}:{keyword}:{press}:{period}"
-            cached_result = self.redis_client.get(key)
+            # 재연결 대기 중에는 Redis 없이 미적중으로 처리
+            redis_client = self.redis_client
+            if redis_client is None:
+                return None
+            cached_result = redis_client.get(key)
+            if record_stats:
+                self.record_redis_lookup(bool(cached_result))
             if cached_result:
-                return SummaryResponseDTO(**json.loads(cached_result))
+                response = self.load_cached_response(cached_result)
+                self.local_cache.set(key, response)
+                return response
             else:
                 return None
 
         except Exception as e:
             logger.error(f"캐시된 결과 가져오는 중 오류 발생: {str(e)}")
 
-        return SummaryResponseDTO()
+        # 빈 SummaryResponseDTO는 참으로 평가되어 캐시 적중으로 처리되므로 None을 반환
+        return None
+
+    def get_rendered_results(
+        self,
+        keyword: str,
+        press: List[str],
+        period: str,
+        version: int | None = None,
+        record_stats: bool = False,
+    ) -> RenderedResponse | None:
+        """캐싱된 최종 API 응답 본문을 역직렬화 없이 가져옵니다.
+
+        Args:
+            keyword (str): 키워드
+            press (List[str]): 언론사
+            period (str): 기간
+            version (int | None): 기사 버전 (None이면 가장 최근에 저장된 결과)
+            record_stats (bool): Redis 적중/미적중 횟수 기록 여부 (요청의 첫 조회에서만 기록)
+
+        Returns:
+            RenderedResponse | None: 직렬화된 응답 본문과 ETag
+        """
+        try:
+            key = self.get_cache_key(
+                keyword, press, period, prefix=RESPONSE_KEY_PREFIX, version=version
+            )
+
+            self.sync_local_cache_date()
+            local_result = self.local_cache.get(key)
+            if local_result is not None:
+                return local_result
+
+            redis_client = self.redis_client
+            if redis_client is None:
+                return None
+            cached_result = redis_client.get(key)
+            if record_stats:
+                self.record_redis_lookup(bool(cached_result))
+            if cached_result:
+                rendered = RenderedResponse(cached_result)
+                self.local_cache.set(key, rendered)
+                return rendered
+        except Exception as e:
+            logger.error(f"캐시된 응답 가져오는 중 오류 발생: {str(e)}")
+
+        return None
+
+    @staticmethod
+    def render_response(response: SummaryResponseDTO) -> RenderedResponse:
+        """요약 결과를 최종 API 응답(ApiResponseDTO) JSON 바이트로 직렬화합니다.
+
+        Args:
+            response (SummaryResponseDTO): 요약 결과 DTO
+
+        Returns:
+            RenderedResponse: 직렬화된 응답 본문과 ETag
+        """
+        return RenderedResponse.from_model(
+            ApiResponseDTO(
+                isSuccess=True, code="COMMON200", message="성공", result=response
+            )
+        )
+
+    def load_cached_response(self, cached_result: bytes) -> SummaryResponseDTO:
+        """Redis에 저장된 값을 SummaryResponseDTO로 복원합니다.
+
+        이 서비스가 형식 헤더를 붙여 저장한 값은 이미 검증된 데이터이므로
+        CACHE_VALIDATE_ON_READ가 꺼져 있으면 pydantic 검증을 생략합니다.
+
+        Args:
+            cached_result (bytes): Redis에 저장된 값
+
+        Returns:
+            SummaryResponseDTO: 캐싱된 결과 DTO
+        """
+        data = self.cache_codec.decode(cached_result)
+        if settings.CACHE_VALIDATE_ON_READ or self.cache_codec.is_legacy(cached_result):
+            return SummaryResponseDTO(**data)
+
+        sources = data.get("sources")
+        return SummaryResponseDTO.model_construct(
+            summaries=[
+                SummaryItemDTO.model_construct(**item)
+                for item in data.get("summaries") or []
+            ],
+            sources=(
+                None
+                if sources is None
+                else [
+                    NewsArticleSourceDTO.model_construct(
+                        **{
+                            **source,
+                            "date": datetime.fromisoformat(
+                                source["date"].replace("Z", "+00:00")
+                            ),
+                        }
+                    )
+                    for source in sources
+                ]
+            ),
+        )
+
+    def sync_local_cache_date(self):
+        """기준 시각(06:15)의 날짜가 바뀌면 이전 날짜의 로컬 캐시 항목을 제거합니다."""
+        target_date = self.get_target_date().strftime("%Y%m%d")
+        if self.local_cache_date == target_date:
+            return
+
+        # 캐시 키 형식: {접두사}:{날짜}:{키워드}:{언론사}:{기간}
+        removed = self.local_cache.delete_if(
+            lambda key: key.split(":")[2] != target_date
+        )
+        self.local_cache_date = target_date
+        logger.info(f"로컬 캐시 날짜 갱신: {target_date}, 제거된 항목: {removed}")
+
+    def record_redis_lookup(self, hit: bool):
+        """Redis 캐시 조회 결과를 적중/미적중 횟수에 더합니다."""
+        if hit:
+            self.redis_hits += 1
+        else:
+            self.redis_misses += 1
+
+    def get_cache_stats(self) -> dict:
+        """캐시 계층별 적중/미적중 횟수를 반환합니다.
+
+        Returns:
+            dict: 로컬 캐시와 Redis의 적중/미적중 횟수
+        """
+        return {
+            "local": self.local_cache.stats(),
+            "redis": {"hits": self.redis_hits, "misses": self.redis_misses},
+        }
+
+    def start_cache_invalidation_listener(self):
+        """다른 인스턴스의 캐시 갱신 알림을 받아 로컬 캐시를 무효화하는 스레드를 시작합니다.
+
+        Redis에 연결되어 있지 않으면 redis_client가 다시 연결될 때 구독을 시작합니다.
+        """
+        self.invalidation_requested = True
+        # redis_client 재연결 중에 이미 구독을 시작했을 수 있으므로 연결을 먼저 확인
+        redis_client = self.redis_client
+        if self.invalidation_thread:
+            return
+        if not redis_client:
+            logger.warning(
+                "Redis 연결이 없어 재연결 후 로컬 캐시 무효화 구독을 시작합니다."
+            )
+            return
+
+        pubsub = redis_client.pubsub(ignore_subscribe_messages=True)
+        pubsub.subscribe(
+            **{
+                SUMMARY_INVALIDATION_CHANNEL: self.handle_invalidation,
+                CONTENT_UPDATE_CHANNEL: self.handle_content_update,
+            }
+        )
+        self.invalidation_thread = pubsub.run_in_thread(
+            sleep_time=1.0,
+            daemon=True,
+            exception_handler=self.handle_invalidation_error,
+        )
+        logger.info("로컬 캐시 무효화 구독 시작")
+
+    def stop_cache_invalidation_listener(self):
+        """로컬 캐시 무효화 스레드를 중지합니다."""
+        self.invalidation_requested = False
+        if self.invalidation_thread:
+            self.invalidation_thread.stop()
+            self.invalidation_thread = None
+
+    def handle_invalidation(self, message: dict):
+        """캐시 갱신 알림을 받으면 해당 키의 로컬 캐시 항목을 제거합니다.
+
+        Args:
+            message (dict): Redis Pub/Sub 메시지
+        """
+        try:
+            payload = json.loads(message["data"])
+        except (TypeError, ValueError) as e:
+            logger.warning(f"잘못된 캐시 무효화 메시지: {str(e)}")
+            return
+
+        # 자신이 보낸 알림은 이미 로컬 캐시에 새 값을 저장했으므로 무시
+        if payload.get("instance") != self.instance_id:
+            for key in payload.get("keys", []):
+                self.local_cache.delete(key)
+
+    def handle_content_update(self, message: dict):
+        """기사 수집 알림을 받으면 버전 캐시를 갱신하고 등록된 함수를 호출합니다.
+
+        Args:
+            message (dict): Redis Pub/Sub 메시지
+        """
+        try:
+            versions = json.loads(message["data"])["versions"]
+        except (TypeError, ValueError, KeyError) as e:
+            logger.warning(f"잘못된 기사 수집 알림: {str(e)}")
+            return
+
+        now = time.monotonic()
+        for key, version in versions.items():
+            self.content_versions[key] = (int(version), now)
+        for listener in self.content_update_listeners:
+            try:
+                listener()
+            except Exception as e:
+                logger.error(f"기사 수집 알림 처리 중 오류: {str(e)}")
+
+    def handle_invalidation_error(self, error: Exception, pubsub, thread):
+        logger.error(f"캐시 무효화 구독 오류: {str(error)}")
+        time.sleep(1.0)
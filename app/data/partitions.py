@@ -0,0 +1,205 @@
+import logging
+from datetime import date, datetime, timedelta
+from typing import Dict, List, Tuple
+from sqlalchemy.engine import Engine
+from app.config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+# published_date 날짜별 p{YYYYMMDD} 파티션 뒤에 항상 비어 있는 pmax를 둠
+TABLE_NAME = "news_articles"
+MAXVALUE_PARTITION = "pmax"
+
+
+def get_partition_name(day: date) -> str:
+    return f"p{day.strftime('%Y%m%d')}"
+
+
+def parse_partition_name(name: str) -> date | None:
+    """p{YYYYMMDD} 형식이면 날짜를, 아니면 None을 반환합니다."""
+    try:
+        return datetime.strptime(name, "p%Y%m%d").date()
+    except ValueError:
+        return None
+
+
+def build_partition_definition(day: date) -> str:
+    """day 하루(와 그 이전)의 행을 담는 파티션 정의를 만듭니다."""
+    upper_bound = (day + timedelta(days=1)).isoformat()
+    return (
+        f"PARTITION {get_partition_name(day)} "
+        f"VALUES LESS THAN (TO_DAYS('{upper_bound}'))"
+    )
+
+
+def get_partitions(engine: Engine) -> List[str]:
+    """테이블의 파티션 이름을 순서대로 조회합니다. 파티션이 없으면 빈 목록을 반환합니다."""
+    with engine.connect() as conn:
+        rows = conn.exec_driver_sql(
+            """
+            SELECT PARTITION_NAME
+            FROM information_schema.PARTITIONS
+            WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s
+                AND PARTITION_NAME IS NOT NULL
+            ORDER BY PARTITION_ORDINAL_POSITION
+            """,
+            (TABLE_NAME,),
+        )
+        return [row[0] for row in rows]
+
+
+def get_unique_keys(engine: Engine) -> Dict[str, List[str]]:
+    """고유 키(PRIMARY 포함)별 키 컬럼 정의를 조회합니다. 접두사 길이가 있으면 포함합니다."""
+    with engine.connect() as conn:
+        rows = conn.exec_driver_sql(
+            """
+            SELECT INDEX_NAME, COLUMN_NAME, SUB_PART
+            FROM information_schema.STATISTICS
+            WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s AND NON_UNIQUE = 0
+            ORDER BY INDEX_NAME, SEQ_IN_INDEX
+            """,
+            (TABLE_NAME,),
+        )
+        unique_keys: Dict[str, List[str]] = {}
+        for index_name, column_name, sub_part in rows:
+            key = f"{column_name}({sub_part})" if sub_part else column_name
+            unique_keys.setdefault(index_name, []).append(key)
+        return unique_keys
+
+
+def partition_table(engine: Engine, retention_days: int, precreate_days: int) -> bool:
+    """news_articles를 published_date 기준 일 단위 RANGE 파티션 테이블로 변환합니다.
+
+    MySQL은 모든 고유 키에 파티션 컬럼이 포함되어야 하므로, published_date가 없는
+    고유 키에는 published_date를 추가합니다. 첫 파티션은 그 이전의 오래된 행도 함께 담으며,
+    보관 기간이 지나면 유지 작업에서 삭제됩니다.
+
+    Args:
+        engine (Engine): DB 엔진
+        retention_days (int): 오늘 이전으로 보관할 일 수
+        precreate_days (int): 오늘 이후로 미리 만들 파티션 수
+
+    Returns:
+        bool: 변환 여부 (이미 파티션 테이블이면 False)
+    """
+    if get_partitions(engine):
+        return False
+
+    today = date.today()
+    with engine.begin() as conn:
+        for index_name, keys in get_unique_keys(engine).items():
+            if "published_date" in keys:
+                continue
+            columns = ", ".join([*keys, "published_date"])
+            if index_name == "PRIMARY":
+                conn.exec_driver_sql(
+                    f"ALTER TABLE {TABLE_NAME} DROP PRIMARY KEY, ADD PRIMARY KEY ({columns})"
+                )
+            else:
+                conn.exec_driver_sql(
+                    f"ALTER TABLE {TABLE_NAME} DROP INDEX {index_name}, "
+                    f"ADD UNIQUE INDEX {index_name} ({columns})"
+                )
+            logger.info(f"고유 키에 published_date 추가: {index_name} ({columns})")
+
+        first_day = today - timedelta(days=retention_days)
+        oldest = conn.exec_driver_sql(
+            f"SELECT DATE(MIN(published_date)) FROM {TABLE_NAME}"
+        ).scalar()
+        if oldest and oldest > first_day:
+            first_day = oldest
+
+        days = [
+            first_day + timedelta(days=offset)
+            for offset in range((today - first_day).days + precreate_days + 1)
+        ]
+        definitions = [build_partition_definition(day) for day in days]
+        definitions.append(f"PARTITION {MAXVALUE_PARTITION} VALUES LESS THAN MAXVALUE")
+        conn.exec_driver_sql(
+            f"ALTER TABLE {TABLE_NAME} PARTITION BY RANGE (TO_DAYS(published_date)) "
+            f"({', '.join(definitions)})"
+        )
+    logger.info(
+        f"파티션 테이블로 변환: {get_partition_name(days[0])} ~ {get_partition_name(days[-1])}"
+    )
+    return True
+
+
+def plan_partition_changes(
+    partitions: List[str], today: date, retention_days: int, precreate_days: int
+) -> Tuple[List[date], List[str]]:
+    """현재 파티션 목록에서 새로 만들 날짜와 삭제할 파티션 이름을 계산합니다.
+
+    마지막 날짜 파티션 다음 날부터 오늘 + precreate_days까지 빠진 날짜를 모두 만들고,
+    오늘 - retention_days보다 이전 날짜의 파티션을 삭제합니다.
+
+    Args:
+        partitions (List[str]): 테이블의 파티션 이름 목록 (pmax 포함)
+        today (date): 기준 날짜
+        retention_days (int): 오늘 이전으로 보관할 일 수
+        precreate_days (int): 오늘 이후로 미리 만들 파티션 수
+
+    Returns:
+        Tuple[List[date], List[str]]: 새로 만들 날짜, 삭제할 파티션 이름
+    """
+    days = [day for day in map(parse_partition_name, partitions) if day]
+    last_day = max(days) if days else today - timedelta(days=1)
+    new_days = [
+        last_day + timedelta(days=offset)
+        for offset in range(1, (today - last_day).days + precreate_days + 1)
+    ]
+    cutoff = today - timedelta(days=retention_days)
+    expired = [get_partition_name(day) for day in days if day < cutoff]
+    return new_days, expired
+
+
+def maintain_partitions(
+    engine: Engine,
+    retention_days: int = settings.ARTICLE_RETENTION_DAYS,
+    precreate_days: int = settings.PARTITION_PRECREATE_DAYS,
+    today: date | None = None,
+) -> Tuple[List[str], List[str]]:
+    """앞으로 쓸 날짜 파티션을 만들고 보관 기간이 지난 파티션을 삭제합니다.
+
+    pmax는 항상 비어 있도록 유지되므로 REORGANIZE PARTITION은 데이터를 옮기지 않고,
+    DROP PARTITION은 해당 날짜의 행을 행 단위 삭제 없이 제거합니다.
+
+    Args:
+        engine (Engine): DB 엔진
+        retention_days (int): 오늘 이전으로 보관할 일 수
+        precreate_days (int): 오늘 이후로 미리 만들 파티션 수
+        today (date | None): 기준 날짜 (None이면 오늘)
+
+    Returns:
+        Tuple[List[str], List[str]]: 추가된 파티션, 삭제된 파티션
+    """
+    partitions = get_partitions(engine)
+    if not partitions:
+        logger.warning(
+            f"{TABLE_NAME}이 파티션 테이블이 아닙니다. 마이그레이션을 먼저 실행하세요."
+        )
+        return [], []
+
+    new_days, expired = plan_partition_changes(
+        partitions, today or date.today(), retention_days, precreate_days
+    )
+
+    with engine.begin() as conn:
+        if new_days:
+            definitions = [build_partition_definition(day) for day in new_days]
+            definitions.append(
+                f"PARTITION {MAXVALUE_PARTITION} VALUES LESS THAN MAXVALUE"
+            )
+            conn.exec_driver_sql(
+                f"ALTER TABLE {TABLE_NAME} REORGANIZE PARTITION {MAXVALUE_PARTITION} "
+                f"INTO ({', '.join(definitions)})"
+            )
+        if expired:
+            conn.exec_driver_sql(
+                f"ALTER TABLE {TABLE_NAME} DROP PARTITION {', '.join(expired)}"
+            )
+
+    added = [get_partition_name(day) for day in new_days]
+    if added or expired:
+        logger.info(f"파티션 유지 작업: 추가 {added}, 삭제 {expired}")
+    return added, expired
@@ -0,0 +1,118 @@
+import asyncio
+import logging
+import time
+from typing import List
+from app.config.settings import settings
+from app.data.news_data_manager import NewsDataManager
+from app.models.dtos import NewsArticleDTO
+
+logger = logging.getLogger(__name__)
+
+
+class ArticleWriter:
+    """수집한 기사를 큐에 모아 batch_size개 또는 flush_interval마다 일괄 upsert합니다.
+
+    async with로 사용하며, 큐가 가득 차면 put이 대기하므로 DB 저장이 밀리는 동안
+    수집 쪽도 함께 속도를 늦춥니다. 종료 시 남은 기사를 모두 저장합니다.
+    묶음에서 새로 저장되거나 바뀐 기사가 있는 (키워드, 언론사)만 기사 버전을 올립니다.
+    """
+
+    def __init__(
+        self,
+        news_data_manager: NewsDataManager,
+        batch_size: int = settings.INGEST_BATCH_SIZE,
+        flush_interval: float = settings.INGEST_FLUSH_INTERVAL_SECONDS,
+        queue_size: int = settings.INGEST_WRITE_QUEUE_SIZE,
+    ):
+        self.news_data_manager = news_data_manager
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        self.task: asyncio.Task | None = None
+        self.rows = 0
+        self.affected = 0
+        self.batches = 0
+        self.elapsed = 0.0
+
+    async def __aenter__(self) -> "ArticleWriter":
+        self.task = asyncio.create_task(self.run())
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        # None은 종료 신호
+        await self.queue.put(None)
+        await self.task
+
+    async def put(self, article: NewsArticleDTO):
+        """기사를 저장 대기열에 넣습니다. 대기열이 가득 차면 자리가 날 때까지 기다립니다."""
+        await self.queue.put(article)
+
+    async def next_batch(self) -> tuple[List[NewsArticleDTO], bool]:
+        """첫 기사를 받은 뒤 batch_size개가 모이거나 flush_interval이 지날 때까지 모읍니다.
+
+        Returns:
+            tuple[List[NewsArticleDTO], bool]: 기사 묶음, 종료 신호를 받았는지 여부
+        """
+        article = await self.queue.get()
+        if article is None:
+            return [], True
+
+        batch = [article]
+        deadline = time.monotonic() + self.flush_interval
+        while len(batch) < self.batch_size:
+            timeout = deadline - time.monotonic()
+            if timeout <= 0:
+                break
+            try:
+                article = await asyncio.wait_for(self.queue.get(), timeout)
+            except asyncio.TimeoutError:
+                break
+            if article is None:
+                return batch, True
+            batch.append(article)
+        return batch, False
+
+    async def run(self):
+        """종료 신호를 받을 때까지 묶음 단위로 저장합니다."""
+        closed = False
+        while not closed:
+            batch, closed = await self.next_batch()
+            if batch:
+                await self.flush(batch)
+
+    async def flush(self, batch: List[NewsArticleDTO]):
+        """기사 묶음을 저장합니다. 실패한 묶음은 로그만 남기고 다음 묶음을 계속 저장합니다."""
+        loop = asyncio.get_running_loop()
+        started_at = time.monotonic()
+        try:
+            changed_groups = await loop.run_in_executor(
+                self.news_data_manager.db_executor,
+                self.news_data_manager.upsert_articles,
+                batch,
+            )
+        except Exception as e:
+            logger.error(f"기사 {len(batch)}건 저장 실패: {str(e)}", exc_info=True)
+            return
+
+        # 기사가 바뀐 (키워드, 언론사)의 버전만 올려 해당 요약 캐시가 적중하지 않도록 함
+        # (Redis INCR/PUBLISH는 동기 호출이므로 이벤트 루프 밖에서 실행)
+        if changed_groups:
+            await asyncio.to_thread(
+                self.news_data_manager.bump_content_versions, list(changed_groups)
+            )
+        affected = sum(changed_groups.values())
+
+        elapsed = time.monotonic() - started_at
+        self.rows += len(batch)
+        self.affected += affected
+        self.batches += 1
+        self.elapsed += elapsed
+        logger.info(
+            f"기사 {len(batch)}건 저장 ({len(batch) / elapsed:.1f}건/초), "
+            f"누적 {self.rows}건 ({self.rows_per_second:.1f}건/초)"
+        )
+
+    @property
+    def rows_per_second(self) -> float:
+        """저장에 걸린 시간 기준 초당 처리 행 수입니다."""
+        return self.rows / self.elapsed if self.elapsed else 0.0
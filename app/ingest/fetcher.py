@@ -0,0 +1,99 @@
+import asyncio
+import time
+from collections import defaultdict
+from urllib.parse import urlsplit
+import aiohttp
+from app.config.settings import settings
+from app.core.exceptions import CrawlingError
+
+
+class DomainThrottle:
+    """도메인별 동시 요청 수와 요청 사이 최소 간격을 지킵니다."""
+
+    def __init__(self, concurrency: int, delay: float):
+        self.delay = delay
+        self.semaphores = defaultdict(lambda: asyncio.Semaphore(concurrency))
+        self.locks = defaultdict(asyncio.Lock)
+        self.last_request_at = defaultdict(float)
+
+    async def wait(self, host: str):
+        """같은 도메인의 직전 요청으로부터 delay가 지날 때까지 기다립니다."""
+        async with self.locks[host]:
+            elapsed = time.monotonic() - self.last_request_at[host]
+            if elapsed < self.delay:
+                await asyncio.sleep(self.delay - elapsed)
+            self.last_request_at[host] = time.monotonic()
+
+    def slot(self, host: str) -> asyncio.Semaphore:
+        return self.semaphores[host]
+
+
+class Fetcher:
+    """연결을 재사용하는 aiohttp 세션으로 도메인별 제한을 지키며 페이지를 가져옵니다.
+
+    async with로 사용하며, 세션과 커넥터는 수집 한 번 동안 모든 요청이 공유합니다.
+    """
+
+    def __init__(
+        self,
+        concurrency: int = settings.INGEST_PER_DOMAIN_CONCURRENCY,
+        delay: float = settings.INGEST_PER_DOMAIN_DELAY_SECONDS,
+    ):
+        self.throttle = DomainThrottle(concurrency, delay)
+        self.session: aiohttp.ClientSession | None = None
+
+    async def __aenter__(self) -> "Fetcher":
+        connector = aiohttp.TCPConnector(
+            limit=settings.INGEST_MAX_CONNECTIONS,
+            limit_per_host=settings.INGEST_PER_DOMAIN_CONCURRENCY,
+            ttl_dns_cache=300,
+        )
+        self.session = aiohttp.ClientSession(
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(
+                total=settings.INGEST_REQUEST_TIMEOUT_SECONDS
+            ),
+            headers={"User-Agent": settings.INGEST_USER_AGENT},
+        )
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.session.close()
+
+    async def fetch_text(self, url: str) -> str:
+        """페이지 본문을 문자열로 가져옵니다.
+
+        Args:
+            url (str): 요청 URL
+
+        Returns:
+            str: 응답 본문
+
+        Raises:
+            CrawlingError: 요청 실패 또는 200 이외의 응답인 경우
+        """
+        return await self._request(
+            url, lambda response: response.text(errors="replace")
+        )
+
+    async def fetch_bytes(self, url: str) -> bytes:
+        """RSS 피드처럼 인코딩을 직접 해석할 응답을 바이트로 가져옵니다."""
+        return await self._request(url, lambda response: response.read())
+
+    async def _request(self, url: str, read):
+        host = urlsplit(url).hostname or ""
+        async with self.throttle.slot(host):
+            await self.throttle.wait(host)
+            try:
+                async with self.session.get(url) as response:
+                    if response.status != 200:
+                        raise CrawlingError(
+                            "페이지 요청 실패",
+                            details={"url": url, "status": response.status},
+                        )
+                    return await read(response)
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                raise CrawlingError(
+                    f"페이지 요청 실패: {str(e) or type(e).__name__}",
+                    details={"url": url},
+                )
@@ -0,0 +1,261 @@
+"""뉴스 기사 수집 파이프라인
+
+RSS 검색 → Google News URL 변환 → 도메인별 제한을 지킨 기사 요청 → 선택자 기반 본문 추출
+→ DB 일괄 upsert 순서로 실행합니다. 저장은 수집과 동시에 진행됩니다.
+
+    python -m app.ingest.pipeline                    # 전체 키워드 수집
+    python -m app.ingest.pipeline --keyword 경제     # 특정 키워드만 수집
+"""
+
+import argparse
+import asyncio
+import logging
+import sys
+import time
+from datetime import datetime, timezone
+from typing import List
+from urllib.parse import quote, urlsplit
+from zoneinfo import ZoneInfo
+import feedparser
+from app.config.logging_config import setup_logging
+from app.config.settings import settings
+from app.core.exceptions import CrawlingError
+from app.data.article_deduplicator import ArticleDeduplicator
+from app.data.news_data_manager import NewsDataManager
+from app.ingest.article_writer import ArticleWriter
+from app.ingest.fetcher import Fetcher
+from app.ingest.selector_registry import (
+    SelectorRegistry,
+    get_press_domains,
+    get_site_domain,
+)
+from app.models.dtos import FeedEntryDTO, NewsArticleDTO
+
+logger = logging.getLogger(__name__)
+
+KST = ZoneInfo("Asia/Seoul")
+GOOGLE_NEWS_HOST = "news.google.com"
+
+
+class IngestPipeline:
+    """키워드·언론사별 RSS에서 새 기사를 찾아 본문을 수집하고 저장합니다."""
+
+    def __init__(
+        self,
+        news_data_manager: NewsDataManager,
+        selector_registry: SelectorRegistry | None = None,
+    ):
+        self.news_data_manager = news_data_manager
+        self.selector_registry = selector_registry or SelectorRegistry()
+        self.article_deduplicator = ArticleDeduplicator(news_data_manager)
+        self.decode_semaphore = asyncio.Semaphore(settings.INGEST_DECODE_CONCURRENCY)
+
+    def build_feed_urls(self, keywords: List[str]) -> List[tuple]:
+        """(키워드, 언론사, RSS URL) 목록을 만듭니다."""
+        feeds = []
+        for keyword in keywords:
+            for press, structure in self.selector_registry.structures.items():
+                domain = get_site_domain(get_press_domains(structure))
+                url = settings.INGEST_RSS_URL_TEMPLATE.format(
+                    keyword=quote(keyword), domain=quote(domain)
+                )
+                feeds.append((keyword, press, url))
+        return feeds
+
+    @staticmethod
+    def parse_feed(data: bytes, keyword: str, press: str) -> List[FeedEntryDTO]:
+        """RSS 응답을 기사 항목 목록으로 변환합니다. 발행 시각은 KST로 저장합니다."""
+        feed = feedparser.parse(data)
+        entries = []
+        for entry in feed.entries:
+            if not entry.get("link") or not entry.get("published_parsed"):
+                continue
+            published_date = (
+                datetime(*entry.published_parsed[:6], tzinfo=timezone.utc)
+                .astimezone(KST)
+                .replace(tzinfo=None)
+            )
+            # Google News 제목은 "제목 - 언론사" 형식
+            title = entry.get("title", "").rsplit(f" - {press}", 1)[0]
+            entries.append(
+                FeedEntryDTO(
+                    url=entry.link,
+                    title=title,
+                    published_date=published_date,
+                    keyword=keyword,
+                    press=press,
+                )
+            )
+        return entries
+
+    async def discover(
+        self, fetcher: Fetcher, keywords: List[str]
+    ) -> List[FeedEntryDTO]:
+        """RSS 검색 결과에서 기사 항목을 찾습니다. 실패한 피드는 건너뜁니다."""
+
+        async def read_feed(keyword: str, press: str, url: str) -> List[FeedEntryDTO]:
+            try:
+                data = await fetcher.fetch_bytes(url)
+            except CrawlingError as e:
+                logger.warning(f"RSS 조회 실패: {str(e)}")
+                return []
+            return self.parse_feed(data, keyword, press)
+
+        results = await asyncio.gather(
+            *(read_feed(*feed) for feed in self.build_feed_urls(keywords))
+        )
+        return [entry for entries in results for entry in entries]
+
+    async def decode_url(self, url: str) -> str:
+        """Google News 중계 URL을 원문 URL로 변환합니다. 그 외 URL은 그대로 반환합니다.
+
+        Raises:
+            CrawlingError: 변환 실패 시
+        """
+        if urlsplit(url).hostname != GOOGLE_NEWS_HOST:
+            return url
+
+        # googlenewsdecoder는 Google News URL을 변환할 때만 불러옴
+        from googlenewsdecoder import new_decoderv1
+
+        async with self.decode_semaphore:
+            # 동기 HTTP 요청을 사용하므로 별도 스레드에서 실행
+            result = await asyncio.to_thread(
+                new_decoderv1, url, interval=settings.INGEST_DECODE_INTERVAL_SECONDS
+            )
+        if not result.get("status"):
+            raise CrawlingError(
+                "Google News URL 변환 실패",
+                details={"url": url, "message": result.get("message")},
+            )
+        return result["decoded_url"]
+
+    async def decode(self, entries: List[FeedEntryDTO]) -> List[FeedEntryDTO]:
+        """항목의 URL을 원문 URL로 바꾸고, 중복 URL과 변환 실패 항목을 제외합니다."""
+        results = await asyncio.gather(
+            *(self.decode_url(entry.url) for entry in entries), return_exceptions=True
+        )
+        decoded = {}
+        for entry, result in zip(entries, results):
+            if isinstance(result, Exception):
+                logger.warning(f"URL 변환 실패: {str(result)}")
+                continue
+            decoded.setdefault(result, entry.model_copy(update={"url": result}))
+        return list(decoded.values())
+
+    async def filter_new(self, entries: List[FeedEntryDTO]) -> List[FeedEntryDTO]:
+        """이미 저장된 기사를 제외합니다."""
+        loop = asyncio.get_running_loop()
+        existing = await loop.run_in_executor(
+            self.news_data_manager.db_executor,
+            self.news_data_manager.get_existing_urls,
+            [entry.url for entry in entries],
+        )
+        return [entry for entry in entries if entry.url not in existing]
+
+    async def fetch_article(
+        self, fetcher: Fetcher, entry: FeedEntryDTO
+    ) -> NewsArticleDTO:
+        """기사 페이지를 가져와 본문을 추출합니다.
+
+        Raises:
+            CrawlingError: 요청 또는 본문 추출 실패 시
+        """
+        html = await fetcher.fetch_text(entry.url)
+        # HTML 파싱은 CPU 작업이므로 이벤트 루프를 막지 않도록 스레드에서 실행
+        content, title = await asyncio.to_thread(
+            self.selector_registry.extract, entry.url, html
+        )
+        return NewsArticleDTO(
+            title=title or entry.title,
+            published_date=entry.published_date,
+            url=entry.url,
+            content=content,
+            keyword=entry.keyword,
+            press=entry.press,
+        )
+
+    async def fetch_articles(
+        self, fetcher: Fetcher, writer: ArticleWriter, entries: List[FeedEntryDTO]
+    ) -> List[NewsArticleDTO]:
+        """기사들을 동시에 수집해 저장 대기열에 넣습니다.
+
+        도메인별 동시 요청 수와 간격은 Fetcher가 제한합니다. 기사 하나를 수집하고
+        대기열에 넣을 때까지 슬롯을 잡고 있으므로, 저장이 밀려 대기열이 차면
+        새 기사 요청도 멈춥니다.
+        """
+        slots = asyncio.Semaphore(settings.INGEST_MAX_CONNECTIONS)
+
+        async def fetch_and_put(entry: FeedEntryDTO) -> NewsArticleDTO:
+            async with slots:
+                article = await self.fetch_article(fetcher, entry)
+                await writer.put(article)
+                return article
+
+        results = await asyncio.gather(
+            *(fetch_and_put(entry) for entry in entries),
+            return_exceptions=True,
+        )
+        articles = []
+        for result in results:
+            if isinstance(result, CrawlingError):
+                logger.warning(f"기사 수집 실패: {str(result)}")
+            elif isinstance(result, Exception):
+                logger.error(f"기사 수집 중 오류: {str(result)}", exc_info=result)
+            else:
+                articles.append(result)
+        return articles
+
+    async def run(self, keywords: List[str] | None = None) -> dict:
+        """수집 파이프라인 전체를 실행합니다.
+
+        Args:
+            keywords (List[str] | None): 수집할 키워드 (기본값: NEWS_KEYWORD 전체)
+
+        Returns:
+            dict: 단계별 처리 건수
+        """
+        keywords = keywords or settings.NEWS_KEYWORD
+        started_at = time.monotonic()
+
+        writer = ArticleWriter(self.news_data_manager)
+        async with Fetcher() as fetcher, writer:
+            entries = await self.discover(fetcher, keywords)
+            decoded = await self.decode(entries)
+            new_entries = await self.filter_new(decoded)
+            articles = await self.fetch_articles(fetcher, writer, new_entries)
+        # 요약 시 중복 기사 판별에 쓰는 서명을 미리 계산
+        await asyncio.to_thread(self.article_deduplicator.precompute, articles)
+
+        stats = {
+            "discovered": len(entries),
+            "decoded": len(decoded),
+            "new": len(new_entries),
+            "fetched": len(articles),
+            "written": writer.rows,
+            "rows_per_second": round(writer.rows_per_second, 1),
+        }
+        logger.info(f"기사 수집 완료 ({time.monotonic() - started_at:.1f}초): {stats}")
+        return stats
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="뉴스 기사 수집")
+    parser.add_argument(
+        "--keyword",
+        action="append",
+        help="수집할 키워드 (여러 번 지정 가능, 기본값: 전체 키워드)",
+    )
+    args = parser.parse_args()
+
+    setup_logging()
+    news_data_manager = NewsDataManager()
+    if news_data_manager.engine is None:
+        return 1
+
+    asyncio.run(IngestPipeline(news_data_manager).run(args.keyword))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
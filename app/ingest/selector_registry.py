@@ -0,0 +1,286 @@
+import json
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Tuple
+from urllib.parse import urlsplit
+from app.config.settings import settings
+from app.core.exceptions import CrawlingError
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_STRUCTURES_PATH = (
+    Path(__file__).resolve().parents[2] / "resources" / "news_site_structures.json"
+)
+
+# 본문에서 제외할 태그
+NOISE_SELECTOR = "script, style, figure"
+TITLE_SELECTOR = 'meta[property="og:title"]'
+
+
+def get_press_domains(structure: dict) -> List[str]:
+    domains = structure["domain"]
+    return [domains] if isinstance(domains, str) else list(domains)
+
+
+def get_site_domain(domains: List[str]) -> str:
+    """언론사 도메인들의 공통 상위 도메인을 반환합니다 (RSS 검색의 site: 조건용).
+
+    예) ["www.mk.co.kr", "stock.mk.co.kr"] -> "mk.co.kr", ["www.hankyung.com"] -> "hankyung.com"
+    """
+    labels = [domain.split(".")[::-1] for domain in domains]
+    common = []
+    for parts in zip(*labels):
+        if len(set(parts)) > 1:
+            break
+        common.append(parts[0])
+    if len(domains) == 1 and len(common) > 2 and common[-1] in ("www", "m"):
+        common.pop()
+    return ".".join(reversed(common))
+
+
+class SelectolaxBackend:
+    """selectolax(lexbor) 파서.
+
+    selectolax는 컴파일된 선택자 객체를 제공하지 않고 css_first 호출마다 선택자 문자열을
+    파싱합니다. 선택자가 짧아 문서 파싱에 비하면 비용이 작으므로 문자열을 그대로 쓰고,
+    compile에서는 문법만 미리 확인합니다.
+    """
+
+    name = "selectolax"
+
+    def __init__(self):
+        from selectolax.lexbor import LexborHTMLParser
+
+        self.parser = LexborHTMLParser
+
+    def compile(self, selector: str):
+        # 잘못된 선택자는 기사를 추출할 때가 아니라 정의 파일을 읽을 때 오류가 나도록 빈 문서에 적용해 봄
+        self.parser("<html></html>").css_first(selector)
+        return selector
+
+    def extract(self, html: str, selector) -> Tuple[str | None, str | None]:
+        tree = self.parser(html)
+        node = tree.css_first(selector)
+        if node is None:
+            return None, None
+        for noise in node.css(NOISE_SELECTOR):
+            noise.decompose()
+        content = node.text(separator="\n", strip=True)
+        title_node = tree.css_first(TITLE_SELECTOR)
+        title = title_node.attributes.get("content") if title_node else None
+        return content, title
+
+
+class LxmlBackend:
+    """lxml 파서. 선택자는 cssselect로 XPath로 미리 컴파일합니다."""
+
+    name = "lxml"
+
+    def __init__(self):
+        import lxml.html
+        from lxml.cssselect import CSSSelector
+
+        self.fromstring = lxml.html.fromstring
+        self.css_selector = CSSSelector
+        self.noise = CSSSelector(NOISE_SELECTOR)
+        self.title = CSSSelector(TITLE_SELECTOR)
+
+    def compile(self, selector: str):
+        return self.css_selector(selector)
+
+    def extract(self, html: str, selector) -> Tuple[str | None, str | None]:
+        tree = self.fromstring(html)
+        nodes = selector(tree)
+        if not nodes:
+            return None, None
+        node = nodes[0]
+        for noise in self.noise(node):
+            noise.drop_tree()
+        content = "\n".join(text.strip() for text in node.itertext() if text.strip())
+        title_nodes = self.title(tree)
+        title = title_nodes[0].get("content") if title_nodes else None
+        return content, title
+
+
+class BeautifulSoupBackend:
+    """BeautifulSoup 파서. 다른 파서가 없을 때 사용합니다."""
+
+    name = "bs4"
+
+    def __init__(self):
+        import soupsieve
+        from bs4 import BeautifulSoup
+
+        self.soup = BeautifulSoup
+        self.soupsieve = soupsieve
+        self.noise = soupsieve.compile(NOISE_SELECTOR)
+        self.title = soupsieve.compile(TITLE_SELECTOR)
+
+    def compile(self, selector: str):
+        return self.soupsieve.compile(selector)
+
+    def extract(self, html: str, selector) -> Tuple[str | None, str | None]:
+        soup = self.soup(html, "html.parser")
+        node = selector.select_one(soup)
+        if node is None:
+            return None, None
+        for noise in self.noise.select(node):
+            noise.decompose()
+        content = node.get_text("\n", strip=True)
+        title_node = self.title.select_one(soup)
+        title = title_node.get("content") if title_node else None
+        return content, title
+
+
+BACKENDS = {
+    "selectolax": SelectolaxBackend,
+    "lxml": LxmlBackend,
+    "bs4": BeautifulSoupBackend,
+}
+
+
+def load_backend(name: str):
+    """파서를 불러옵니다. auto면 selectolax, lxml, bs4 순으로 설치된 것을 사용합니다."""
+    if name != "auto":
+        return BACKENDS[name]()
+    for backend in BACKENDS.values():
+        try:
+            return backend()
+        except ImportError:
+            continue
+    raise ImportError("사용 가능한 HTML 파서가 없습니다.")
+
+
+class SelectorRegistry:
+    """news_site_structures.json을 호스트 → 언론사 → 컴파일된 선택자 색인으로 만듭니다.
+
+    domain과 selectors가 문자열/목록/도메인별/페이지 종류별로 섞여 있는 정의를
+    한 번만 해석해 두고, 기사마다 호스트의 상위 도메인을 차례로 찾아 선택자를 고릅니다
+    (예: "www.mk.co.kr"은 "www.mk.co.kr", "mk.co.kr" 순으로 확인).
+    파일이 바뀌면 다음 조회 시 다시 읽습니다.
+    """
+
+    def __init__(
+        self,
+        path: str | Path | None = None,
+        backend: str = settings.INGEST_PARSER_BACKEND,
+        reload_interval: float = settings.INGEST_SELECTOR_RELOAD_INTERVAL_SECONDS,
+    ):
+        self.path = Path(
+            path or settings.NEWS_SITE_STRUCTURES_PATH or DEFAULT_STRUCTURES_PATH
+        )
+        self.backend = load_backend(backend)
+        self.reload_interval = reload_interval
+        self.lock = threading.Lock()
+        self.mtime_ns = None
+        self.checked_at = 0.0
+        self.structures: dict = {}
+        # 호스트(또는 상위 도메인) -> (언론사, 기본 선택자, 페이지 종류별 선택자)
+        self.hosts: Dict[str, Tuple[str, object, Dict[str, object]]] = {}
+        self.load()
+        logger.info(f"기사 본문 파서: {self.backend.name}")
+
+    def load(self):
+        """정의 파일을 읽어 색인을 새로 만듭니다."""
+        mtime_ns = os.stat(self.path).st_mtime_ns
+        with open(self.path, encoding="utf-8") as f:
+            structures = json.load(f)
+
+        hosts = {}
+        for press, structure in structures.items():
+            selectors = structure["selectors"]
+            if isinstance(selectors, str):
+                compiled = self.backend.compile(selectors)
+                for domain in get_press_domains(structure):
+                    hosts[domain] = (press, compiled, {})
+                continue
+
+            for domain, selector in selectors.items():
+                if isinstance(selector, str):
+                    hosts[domain] = (press, self.backend.compile(selector), {})
+                else:
+                    page_selectors = {
+                        page_type: self.backend.compile(page_selector)
+                        for page_type, page_selector in selector.items()
+                    }
+                    hosts[domain] = (press, None, page_selectors)
+
+        # 색인을 한 번에 교체하므로 다른 스레드는 이전 또는 새 색인 중 하나만 봄
+        self.structures = structures
+        self.hosts = hosts
+        self.mtime_ns = mtime_ns
+
+    def reload_if_changed(self):
+        """reload_interval마다 파일 수정 시각을 확인해 바뀌었으면 다시 읽습니다."""
+        now = time.monotonic()
+        if now - self.checked_at < self.reload_interval:
+            return
+        with self.lock:
+            if now - self.checked_at < self.reload_interval:
+                return
+            self.checked_at = now
+            try:
+                if os.stat(self.path).st_mtime_ns != self.mtime_ns:
+                    self.load()
+                    logger.info(f"기사 선택자 정의를 다시 읽었습니다: {self.path}")
+            except Exception as e:
+                # 잘못된 파일이나 선택자로 교체된 경우 기존 색인을 계속 사용
+                # (선택자 문법 오류는 파서 라이브러리마다 다른 예외로 발생함)
+                logger.error(
+                    f"기사 선택자 정의 다시 읽기 실패: {str(e)}", exc_info=True
+                )
+
+    def resolve(self, url: str) -> Tuple[str, object]:
+        """URL에 맞는 언론사와 컴파일된 선택자를 찾습니다.
+
+        Args:
+            url (str): 기사 URL
+
+        Returns:
+            Tuple[str, object]: 언론사 이름, 컴파일된 선택자
+
+        Raises:
+            CrawlingError: 지원하지 않는 URL이거나 페이지 종류를 알 수 없는 경우
+        """
+        self.reload_if_changed()
+        parts = urlsplit(url)
+        labels = (parts.hostname or "").split(".")
+        hosts = self.hosts
+        for i in range(len(labels)):
+            rule = hosts.get(".".join(labels[i:]))
+            if rule is None:
+                continue
+            press, selector, page_selectors = rule
+            if selector is not None:
+                return press, selector
+            segments = parts.path.split("/")
+            for page_type, page_selector in page_selectors.items():
+                if page_type in segments:
+                    return press, page_selector
+            raise CrawlingError(
+                "페이지 종류를 알 수 없는 URL입니다.",
+                details={"url": url, "page_types": list(page_selectors)},
+            )
+        raise CrawlingError("지원하지 않는 언론사 URL입니다.", details={"url": url})
+
+    def extract(self, url: str, html: str) -> Tuple[str, str | None]:
+        """기사 HTML에서 본문과 제목(og:title)을 추출합니다.
+
+        Args:
+            url (str): 기사 URL
+            html (str): 기사 HTML
+
+        Returns:
+            Tuple[str, str | None]: 본문, 제목 (없으면 None)
+
+        Raises:
+            CrawlingError: 선택자에 맞는 본문이 없는 경우
+        """
+        _, selector = self.resolve(url)
+        content, title = self.backend.extract(html, selector)
+        if content is None:
+            raise CrawlingError("본문을 찾을 수 없습니다.", details={"url": url})
+        return content, title
@@ -1,10 +1,16 @@
+import json
 import logging
-from fastapi import FastAPI, APIRouter, HTTPException, Query
-from fastapi.responses import JSONResponse
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, APIRouter, HTTPException, Query, Request
+from fastapi.responses import JSONResponse, Response, StreamingResponse
+from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
 from fastapi.security import HTTPBearer
 from typing import List
 from app.config.eureka_client import eureka_lifespan
 from app.services.news_service import NewsService
+from app.services.cache_prewarmer import CachePrewarmer
+from app.services.headline_cache import HeadlineCache
+from app.services.partition_maintainer import PartitionMaintainer
 from app.config.settings import settings
 from app.models.enums import PressName
 from app.models.dtos import (
@@ -12,23 +18,48 @@ from app.models.dtos import (
     ApiResponseDTO,
 )
 from app.config.swagger_config import setup_swagger
+from app.config.logging_config import setup_logging
+from app.core.openai_client import close_openai_client
+from app.core.metrics import register_news_data_manager
 
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-    filename="app.log",
-    encoding="utf-8",
-    datefmt="%Y-%m-%d %H:%M:%S",
-)
+setup_logging()
 
 logger = logging.getLogger(__name__)
 
+news_service = NewsService()
+cache_prewarmer = CachePrewarmer(news_service)
+headline_cache = HeadlineCache(news_service)
+partition_maintainer = PartitionMaintainer(news_service.news_data_manager)
+register_news_data_manager(news_service.news_data_manager)
+# 새 기사가 수집되면 다음 헤드라인 조회 전에 다시 만듦
+news_service.news_data_manager.content_update_listeners.append(
+    headline_cache.invalidate
+)
+
+
+@asynccontextmanager
+async def lifespan(app_: FastAPI):
+    async with eureka_lifespan(app_):
+        news_service.news_data_manager.start_cache_invalidation_listener()
+        cache_prewarmer.start()
+        headline_cache.start()
+        partition_maintainer.start()
+        yield  # 애플리케이션 실행
+
+        # Shutdown
+        await partition_maintainer.stop()
+        await headline_cache.stop()
+        await cache_prewarmer.stop()
+        news_service.news_data_manager.stop_cache_invalidation_listener()
+    await close_openai_client()
+
+
 # FastAPI 인스턴스 생성
 app = FastAPI(
     docs_url="/api/news-service/swagger-ui.html",
     openapi_url="/api/news-service/openapi.json",
     title="AI News Controller",
-    lifespan=eureka_lifespan,
+    lifespan=lifespan,
 )
 
 
@@ -54,13 +85,19 @@ setup_swagger(app)
 
 security = HTTPBearer()
 
-news_router = APIRouter(prefix="/api/news-summary", tags=["news"])
 
-news_service = NewsService()
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    """Prometheus 수집용 지표를 반환합니다."""
+    return Response(generate_latest(), media_type=CONTENT_TYPE_LATEST)
+
+
+news_router = APIRouter(prefix="/api/news-summary", tags=["news"])
 
 
 @news_router.get("/", response_model=ApiResponseDTO)
 async def summarize(
+    request: Request,
     keyword: str = Query(...),
     press: List[PressName] = Query(
         default=["hk"],
@@ -79,10 +116,12 @@ async def summarize(
     try:
         request_dto = SummaryRequestDTO(keyword=keyword, press=press, period=period)
 
-        news_articles = await news_service.summarized_news(request_dto)
+        # 캐시된 응답 본문을 재검증/재직렬화 없이 반환 (If-None-Match가 일치하면 304)
+        rendered = await news_service.rendered_summarized_news(request_dto)
 
-        return ApiResponseDTO(
-            isSuccess=True, code="COMMON200", message="성공", result=news_articles
+        return rendered.to_response(
+            request.headers.get("if-none-match"),
+            max_age=settings.SUMMARY_CACHE_MAX_AGE_SECONDS,
         )
 
     except Exception as e:
@@ -90,20 +129,59 @@ async def summarize(
         raise HTTPException(status_code=500, detail=f"뉴스 요약 중 오류 발생: {str(e)}")
 
 
+@news_router.get("/stream")
+async def summarize_stream(
+    keyword: str = Query(...),
+    press: List[PressName] = Query(
+        default=["hk"],
+        description="한국경제: hk, 매일경제: mk, 서울경제: sed<br><i>여러 언론사 선택 가능(컨트롤+클릭 혹은 쉬프트+클릭)</i>",
+    ),
+    period: int = Query(default=1, description="기간(일)"),
+):
+    """
+    뉴스 요약을 SSE(text/event-stream)로 전송합니다. 파라미터는 요약 API와 같습니다.
+
+    - sources: 원문 기사 목록 (가장 먼저 전송)
+    - summary: 요약 항목 하나 (생성되는 대로 전송)
+    - done: 요약 완료
+    - error: 오류 발생 시 오류 응답
+    """
+    request_dto = SummaryRequestDTO(keyword=keyword, press=press, period=period)
+
+    async def event_stream():
+        try:
+            async for event, data in news_service.stream_summarized_news(request_dto):
+                payload = data.model_dump_json() if data is not None else "{}"
+                yield f"event: {event}\ndata: {payload}\n\n"
+        except Exception as e:
+            logging.error(f"Error occurred while streaming task: {str(e)}")
+            error = {
+                "isSuccess": False,
+                "code": "COMMON500",
+                "message": f"뉴스 요약 중 오류 발생: {str(e)}",
+            }
+            yield f"event: error\ndata: {json.dumps(error, ensure_ascii=False)}\n\n"
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @news_router.get("/todaynews", response_model=ApiResponseDTO)
-async def today_news():
+async def today_news(request: Request):
     """
     메인 페이지에 띄울 뉴스 헤드라인을 목록으로 띄웁니다.
     """
 
     try:
-        final_news_articles = await news_service.headline_news()
+        # 미리 직렬화된 응답을 그대로 반환 (If-None-Match가 일치하면 304)
+        rendered = await headline_cache.get()
 
-        return ApiResponseDTO(
-            isSuccess=True,
-            code="COMMON200",
-            message="성공",
-            result={"sources": final_news_articles},
+        return rendered.to_response(
+            request.headers.get("if-none-match"),
+            max_age=settings.HEADLINE_REFRESH_SECONDS,
         )
     except Exception as e:
         logging.error(f"Error occurred while processing task: {str(e)}")
@@ -20,6 +20,14 @@ class NewsArticleDTO(BaseModel):
     summary: Optional[str] = None
 
 
+class FeedEntryDTO(BaseModel):
+    url: str
+    title: str
+    published_date: datetime
+    keyword: str
+    press: str
+
+
 class NewsArticleSourceDTO(BaseModel):
     date: datetime
     title: str
@@ -0,0 +1,146 @@
+import asyncio
+import logging
+import socket
+from datetime import datetime, timedelta
+from itertools import combinations
+from typing import List
+from app.config.settings import settings
+from app.data.news_data_manager import NewsDataManager
+from app.models.dtos import SummaryRequestDTO
+from app.models.enums import PressName
+from app.services.news_service import NewsService
+
+logger = logging.getLogger(__name__)
+
+
+class CachePrewarmer:
+    """06:15 기준 시각이 바뀔 때 요약 캐시를 미리 채웁니다.
+
+    모든 키워드 × 언론사 조합 × 기간과, 1일만 제공하는 "종합" × 언론사 조합에 대해
+    요약을 생성합니다.
+    여러 인스턴스 중 Redis 락을 잡은 한 인스턴스만 작업을 수행합니다.
+    """
+
+    def __init__(self, news_service: NewsService):
+        self.news_service = news_service
+        self.instance_id = f"{socket.gethostname()}:{settings.INSTANCE_PORT}"
+        self._task: asyncio.Task | None = None
+
+    def start(self):
+        """백그라운드 스케줄러를 시작합니다."""
+        if settings.PREWARM_ENABLED and self._task is None:
+            self._task = asyncio.create_task(self.run())
+
+    async def stop(self):
+        """백그라운드 스케줄러를 중지합니다."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def run(self):
+        """기동 시 한 번, 이후 매일 기준 시각마다 캐시를 미리 채웁니다."""
+        while True:
+            try:
+                await self.prewarm()
+            except Exception as e:
+                logger.error(f"캐시 사전 생성 실패: {str(e)}", exc_info=True)
+
+            delay = self.seconds_until_next_rollover() + settings.PREWARM_DELAY_SECONDS
+            logger.info(f"다음 캐시 사전 생성까지 {delay:.0f}초 대기")
+            await asyncio.sleep(delay)
+
+    @staticmethod
+    def seconds_until_next_rollover() -> float:
+        """다음 06:15 기준 시각까지 남은 시간(초)을 반환합니다."""
+        next_rollover = NewsDataManager.get_target_date() + timedelta(days=1)
+        return max((next_rollover - datetime.now()).total_seconds(), 0.0)
+
+    @staticmethod
+    def press_combinations() -> List[List[PressName]]:
+        """요청 가능한 모든 언론사 조합을 반환합니다."""
+        presses = list(PressName)
+        return [
+            list(combination)
+            for count in range(1, len(presses) + 1)
+            for combination in combinations(presses, count)
+        ]
+
+    def build_requests(self) -> List[SummaryRequestDTO]:
+        """미리 생성할 요약 요청 목록을 만듭니다."""
+        press_combinations = self.press_combinations()
+        requests = [
+            SummaryRequestDTO(keyword=keyword, press=press, period=period)
+            for keyword in settings.NEWS_KEYWORD
+            for press in press_combinations
+            for period in settings.ARTICLES_PER_DAY_MATRIX
+        ]
+        # "종합"은 모든 키워드를 읽으므로 데이터가 많아 1일치만 제공함
+        requests.extend(
+            SummaryRequestDTO(keyword="종합", press=press, period=1)
+            for press in press_combinations
+        )
+        return requests
+
+    async def acquire_leader_lock(self) -> bool:
+        """오늘 기준 시각에 대한 사전 생성 락을 획득합니다.
+
+        락은 해제하지 않고 만료시켜, 늦게 깨어난 다른 인스턴스가
+        같은 작업을 반복하지 않도록 합니다.
+
+        Returns:
+            bool: 락 획득 여부
+        """
+        redis_client = self.news_service.news_data_manager.redis_client
+        if not redis_client:
+            logger.warning("Redis 연결이 없어 캐시 사전 생성을 건너뜁니다.")
+            return False
+
+        target_date = NewsDataManager.get_target_date()
+        lock_key = f"news:prewarm:lock:{target_date.strftime('%Y%m%d')}"
+        # Redis 호출은 동기 호출이므로 이벤트 루프 밖에서 실행
+        acquired = await asyncio.to_thread(
+            redis_client.set,
+            lock_key,
+            self.instance_id,
+            nx=True,
+            ex=settings.PREWARM_LOCK_TTL_SECONDS,
+        )
+        return bool(acquired)
+
+    async def prewarm(self) -> int:
+        """모든 요청 조합의 요약을 제한된 동시성으로 생성해 캐싱합니다.
+
+        Returns:
+            int: 캐싱에 성공한 요청 수
+        """
+        if not await self.acquire_leader_lock():
+            logger.info("다른 인스턴스가 캐시 사전 생성을 담당합니다.")
+            return 0
+
+        requests = self.build_requests()
+        semaphore = asyncio.Semaphore(settings.PREWARM_CONCURRENCY)
+
+        async def warm(request: SummaryRequestDTO) -> bool:
+            async with semaphore:
+                try:
+                    # 사용자 요청이 아니므로 캐시 적중률 지표에 포함하지 않음
+                    await self.news_service.summarized_news(
+                        request, record_metrics=False
+                    )
+                    return True
+                except Exception as e:
+                    logger.warning(
+                        f"캐시 사전 생성 실패 ({request.keyword}, {request.press}, {request.period}): {str(e)}"
+                    )
+                    return False
+
+        logger.info(f"캐시 사전 생성 시작: {len(requests)}건")
+        results = await asyncio.gather(*(warm(request) for request in requests))
+        succeeded = sum(results)
+        logger.info(f"캐시 사전 생성 완료: {succeeded}/{len(requests)}건")
+        return succeeded
@@ -0,0 +1,143 @@
+import asyncio
+import logging
+import time
+from app.config.settings import settings
+from app.core.rendered_response import RenderedResponse
+from app.models.dtos import ApiResponseDTO
+from app.services.news_service import NewsService
+
+logger = logging.getLogger(__name__)
+
+
+class HeadlineCache:
+    """메인 페이지 헤드라인 응답을 직렬화된 상태로 보관합니다.
+
+    짧은 주기로 백그라운드에서 갱신하며, 새 기사가 수집되면 invalidate()로
+    요청을 기다리지 않고 백그라운드에서 다시 만듭니다.
+    """
+
+    def __init__(self, news_service: NewsService):
+        self.news_service = news_service
+        self.rendered: RenderedResponse | None = None
+        self.refreshed_at = 0.0
+        self.stale = True
+        self._lock = asyncio.Lock()
+        self._task: asyncio.Task | None = None
+        self._refresh_task: asyncio.Task | None = None
+        # 백그라운드 갱신 도중 무효화되면 끝난 뒤 한 번 더 갱신
+        self._refresh_again = False
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    def start(self):
+        """백그라운드 갱신을 시작합니다."""
+        if self._task is None:
+            self._loop = asyncio.get_running_loop()
+            self._task = asyncio.create_task(self.run())
+
+    async def stop(self):
+        """백그라운드 갱신을 중지합니다."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        self._loop = None
+        if self._refresh_task is not None:
+            self._refresh_task.cancel()
+            self._refresh_task = None
+
+    async def run(self):
+        while True:
+            try:
+                await self.refresh(force=True)
+            except Exception as e:
+                logger.error(f"헤드라인 캐시 갱신 실패: {str(e)}", exc_info=True)
+            await asyncio.sleep(settings.HEADLINE_REFRESH_SECONDS)
+
+    def invalidate(self):
+        """새 기사가 수집되었을 때 헤드라인을 백그라운드에서 다시 만듭니다.
+
+        Redis Pub/Sub 수신 스레드에서 호출되므로 갱신은 이벤트 루프에 예약합니다.
+        """
+        self.stale = True
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(self.schedule_refresh)
+
+    def schedule_refresh(self):
+        """백그라운드 갱신을 시작합니다. 이미 진행 중이면 끝난 뒤 다시 갱신합니다."""
+        if self._refresh_task is not None and not self._refresh_task.done():
+            self._refresh_again = True
+            return
+        self._refresh_again = False
+        self._refresh_task = asyncio.create_task(self.refresh(force=True))
+        self._refresh_task.add_done_callback(self.finish_refresh)
+
+    def finish_refresh(self, task: asyncio.Task):
+        if not task.cancelled() and task.exception():
+            logger.error(f"헤드라인 캐시 갱신 실패: {str(task.exception())}")
+        if self._refresh_again and self._loop is not None:
+            self.schedule_refresh()
+
+    def is_fresh(self) -> bool:
+        return (
+            self.rendered is not None
+            and not self.stale
+            and time.monotonic() - self.refreshed_at
+            < settings.HEADLINE_REFRESH_SECONDS * 2
+        )
+
+    async def refresh(self, force: bool = False) -> RenderedResponse:
+        """헤드라인을 조회해 API 응답 형식으로 직렬화합니다.
+
+        Args:
+            force (bool): 캐시가 아직 유효해도 다시 만들지 여부 (주기적 갱신과 무효화에 사용)
+
+        Returns:
+            RenderedResponse: 직렬화된 응답 본문과 ETag
+        """
+        async with self._lock:
+            # 락을 기다리는 동안 다른 요청이 이미 갱신했을 수 있음
+            if not force and self.is_fresh():
+                return self.rendered
+
+            # invalidate()가 갱신 도중에 호출되면 stale이 다시 표시되어 한 번 더 갱신
+            self.stale = False
+            final_news_articles = await self.news_service.headline_news()
+            self.rendered = RenderedResponse.from_model(
+                ApiResponseDTO(
+                    isSuccess=True,
+                    code="COMMON200",
+                    message="성공",
+                    result={"sources": final_news_articles},
+                )
+            )
+            self.refreshed_at = time.monotonic()
+            logger.info(f"헤드라인 캐시 갱신: {len(final_news_articles)}건")
+            return self.rendered
+
+    async def get(self) -> RenderedResponse:
+        """직렬화된 헤드라인 응답을 반환합니다. 비어 있거나 오래되었으면 갱신합니다.
+
+        Returns:
+            RenderedResponse: 직렬화된 응답 본문과 ETag
+        """
+        if self.is_fresh():
+            return self.rendered
+        # 무효화 후 백그라운드 갱신이 진행 중이면 끝날 때까지 이전 헤드라인을 제공
+        if (
+            self.rendered is not None
+            and self._refresh_task is not None
+            and not self._refresh_task.done()
+        ):
+            return self.rendered
+        try:
+            return await self.refresh()
+        except Exception:
+            # 갱신에 실패해도 이전 헤드라인이 있으면 그대로 제공
+            if self.rendered is not None:
+                logger.warning("헤드라인 갱신 실패, 이전 캐시를 반환합니다.")
+                return self.rendered
+            raise
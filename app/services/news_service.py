@@ -1,33 +1,111 @@
-from typing import List
+from typing import AsyncIterator, Callable, Dict, List, Tuple
+from pydantic import BaseModel
 from app.models.dtos import (
     NewsArticleDTO,
     NewsArticleSourceDTO,
+    NewsListResponseDTO,
     SummaryItemDTO,
     SummaryRequestDTO,
     SummaryResponseDTO,
 )
 from app.summary.accumulated_summarizer import AccumulatedSummarizer
+from app.summary.incremental_summarizer import IncrementalSummarizer
 from app.data.news_data_manager import NewsDataManager
+from app.data.article_deduplicator import ArticleDeduplicator
 from app.core.exceptions import SummaryError
+from app.core.rendered_response import RenderedResponse
+from app.core.single_flight import SingleFlight
+from app.core.metrics import (
+    COMBINED_FANOUT_ARTICLES,
+    SUMMARY_CACHE_REQUESTS,
+    SUMMARY_STAGE_SECONDS,
+    keyword_label,
+)
+import asyncio
 import logging
 import re
+import time
 from app.config.settings import settings
 
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-    filename="app.log",
-    encoding="utf-8",
-    datefmt="%Y-%m-%d %H:%M:%S",
-)
-
 logger = logging.getLogger(__name__)
 
 
+# _parse_summary가 항목을 나누는 번호 표시 ("1. ")
+SUMMARY_NUMBER_PATTERN = re.compile(r"\d+\.\s")
+# 텍스트 끝에서 아직 완성되지 않았을 수 있는 번호 표시 ("1", "12.")
+PARTIAL_NUMBER_PATTERN = re.compile(r"\d+\.?\Z")
+
+
+class SummaryStreamParser:
+    """스트리밍으로 받은 요약 텍스트에서 완성된 번호 항목을 순서대로 꺼냅니다.
+
+    "1. 제목: 내용" 형식에서 다음 번호가 나타나야 이전 항목이 완성된 것으로 보고,
+    마지막 항목은 close()에서 반환합니다. 전체 텍스트를 한 번에 파싱한 결과와 같습니다.
+
+    새 조각이 들어오면 아직 확인하지 않은 부분에서만 번호를 찾고, 완성된 항목의 텍스트만
+    파싱한 뒤 버리므로 버퍼에는 생성 중인 마지막 항목만 남습니다.
+    """
+
+    def __init__(self, parse: Callable[[str], List[SummaryItemDTO]]):
+        self.parse = parse
+        # 생성 중인 항목의 번호부터 시작하는 텍스트 (첫 번호 전이면 확인하지 않은 꼬리)
+        self.buffer = ""
+        # buffer가 번호로 시작하는지 여부
+        self.in_item = False
+        # 다음 번호를 찾기 시작할 buffer 내 위치
+        self.scan_from = 0
+
+    def feed(self, chunk: str) -> List[SummaryItemDTO]:
+        """텍스트 조각을 추가하고 새로 완성된 항목을 반환합니다."""
+        self.buffer += chunk
+        new_items = []
+        item_start = 0
+        while True:
+            match = SUMMARY_NUMBER_PATTERN.search(self.buffer, self.scan_from)
+            if match is None:
+                break
+            # 다음 번호가 나타났으므로 이전 항목은 완성됨
+            if self.in_item:
+                new_items.extend(self.parse(self.buffer[item_start : match.start()]))
+            self.in_item = True
+            item_start = match.start()
+            self.scan_from = match.end()
+
+        # 첫 번호 전의 텍스트는 파싱 결과에 포함되지 않으므로 버림
+        if not self.in_item:
+            item_start = self.scan_from
+        # 번호가 조각 경계에서 잘렸을 수 있으므로 끝의 숫자부터 다시 확인
+        partial = PARTIAL_NUMBER_PATTERN.search(self.buffer, self.scan_from)
+        scan_from = partial.start() if partial else len(self.buffer)
+
+        self.buffer = self.buffer[item_start:]
+        self.scan_from = scan_from - item_start
+        return new_items
+
+    def close(self) -> List[SummaryItemDTO]:
+        """생성이 끝난 뒤 남은 항목을 반환합니다."""
+        new_items = self.parse(self.buffer) if self.in_item else []
+        self.buffer = ""
+        self.in_item = False
+        self.scan_from = 0
+        return new_items
+
+
 class NewsService:
     def __init__(self):
         self.accumulated_summarizer = AccumulatedSummarizer()
         self.news_data_manager = NewsDataManager()
+        self.article_deduplicator = ArticleDeduplicator(self.news_data_manager)
+        self.incremental_summarizer = IncrementalSummarizer(
+            self.accumulated_summarizer, self.news_data_manager
+        )
+        self.single_flight = SingleFlight(
+            lock_timeout=settings.SUMMARY_LOCK_TIMEOUT_SECONDS,
+            wait_timeout=settings.SUMMARY_LOCK_WAIT_SECONDS,
+            poll_interval=settings.SUMMARY_LOCK_POLL_INTERVAL_SECONDS,
+        )
+        # 이전 요약을 반환한 뒤 백그라운드에서 새 버전을 만드는 작업 (캐시 키별)
+        self.refresh_tasks: Dict[str, asyncio.Task] = {}
 
     async def get_news_articles(
         self, request: SummaryRequestDTO
@@ -44,18 +122,27 @@ class NewsService:
         """
         try:
             if request.keyword == "종합":
-                all_articles = []
-                for keyword in settings.NEWS_KEYWORD:
-                    modified_dto = SummaryRequestDTO(
-                        keyword=keyword, press=request.press, period=request.period
-                    )
-                    articles = self.news_data_manager.retrieve_news_articles(
-                        modified_dto, is_combined=True
+                # 키워드별 쿼리를 동시에 실행 (동시 실행 수는 DB 스레드 풀 크기로 제한)
+                results = await asyncio.gather(
+                    *(
+                        self.news_data_manager.retrieve_news_articles_async(
+                            SummaryRequestDTO(
+                                keyword=keyword,
+                                press=request.press,
+                                period=request.period,
+                            ),
+                            is_combined=True,
+                        )
+                        for keyword in settings.NEWS_KEYWORD
                     )
-                    all_articles.extend(articles)
-                return all_articles
+                )
+                for articles in results:
+                    COMBINED_FANOUT_ARTICLES.observe(len(articles))
+                return [article for articles in results for article in articles]
             else:
-                articles = self.news_data_manager.retrieve_news_articles(request)
+                articles = await self.news_data_manager.retrieve_news_articles_async(
+                    request
+                )
             if not articles:
                 raise SummaryError(
                     "저장된 뉴스 기사가 없습니다.",
@@ -74,6 +161,31 @@ class NewsService:
                 },
             )
 
+    async def deduplicate_articles(
+        self, articles: List[NewsArticleDTO]
+    ) -> Tuple[List[NewsArticleDTO], List[NewsArticleDTO]]:
+        """여러 언론사의 거의 같은 기사를 하나로 묶습니다.
+
+        서명 조회/저장(Redis)과 MinHash 계산(NumPy)은 이벤트 루프를 막지 않도록 스레드에서 실행합니다.
+
+        Args:
+            articles (List[NewsArticleDTO]): DB 조회로 얻은 뉴스 기사 목록
+
+        Returns:
+            Tuple[List[NewsArticleDTO], List[NewsArticleDTO]]:
+                요약에 사용할 기사 목록, sources로 반환할 기사 목록
+        """
+        if not settings.ARTICLE_DEDUP_ENABLED:
+            return articles, articles
+
+        with SUMMARY_STAGE_SECONDS.labels(stage="dedup").time():
+            unique_articles = await asyncio.to_thread(
+                self.article_deduplicator.dedupe, articles
+            )
+        if settings.ARTICLE_DEDUP_COLLAPSE_SOURCES:
+            return unique_articles, unique_articles
+        return unique_articles, articles
+
     def convert_news_articles(
         self, articles: List[NewsArticleDTO]
     ) -> List[NewsArticleSourceDTO]:
@@ -94,10 +206,12 @@ class NewsService:
         return self.news_data_manager.convert_articles(articles)
 
     async def summarize_news(
-        self, news_articles: List[NewsArticleDTO], keyword: str
+        self, news_articles: List[NewsArticleDTO], keyword: str, period: int = 1
     ) -> List[SummaryItemDTO]:
         """뉴스 기사 요약
 
+        여러 날에 걸친 기간은 일별·언론사별 부분 요약을 재사용해 합칩니다.
+
         Args:
             news_articles (List[NewsArticleDTO]): 뉴스 기사 리스트
             keyword (str): 요약할 키워드
@@ -106,10 +220,18 @@ class NewsService:
             List[SummaryItemDTO]: 요약된 뉴스 기사 리스트
         """
         try:
-            accumulated_summary = await self.accumulated_summarizer.accumulated_summary(
-                keyword, news_articles
-            )
-            return self._parse_summary(accumulated_summary)
+            if self.incremental_summarizer.supports(period):
+                accumulated_summary = await self.incremental_summarizer.summarize(
+                    keyword, news_articles
+                )
+            else:
+                accumulated_summary = (
+                    await self.accumulated_summarizer.accumulated_summary(
+                        keyword, news_articles
+                    )
+                )
+            with SUMMARY_STAGE_SECONDS.labels(stage="parse").time():
+                return self._parse_summary(accumulated_summary)
         except Exception as e:
             error_message = f"기사 요약 실패: {str(e)}"
             logger.error(error_message, exc_info=True)
@@ -155,43 +277,52 @@ class NewsService:
 
         return summaries
 
-    async def summarized_news(self, request: SummaryRequestDTO) -> SummaryResponseDTO:
+    async def summarized_news(
+        self, request: SummaryRequestDTO, record_metrics: bool = True
+    ) -> SummaryResponseDTO:
         """Redis에 캐싱된 기사가 있으면 반환하고, 없으면 OpenAI로 요약한 걸 반환합니다.
 
+        캐시 키에는 요청이 읽는 기사의 버전이 들어가므로, 새 기사가 수집되면 캐시가
+        적중하지 않습니다. 이때 이전 버전의 요약이 있으면 먼저 반환하고
+        새 버전은 백그라운드에서 만듭니다.
+
         Args:
             request (SummaryRequestDTO): 요청 DTO
+            record_metrics (bool): 캐시 조회 지표 기록 여부
+                (rendered_summarized_news가 이미 기록한 경우 False)
 
         Returns:
             SummaryResponseDTO: 요약된 뉴스 기사 리스트
         """
         try:
+            version = await self.news_data_manager.get_content_version_async(
+                request.keyword, request.press
+            )
+            started = time.perf_counter()
             cached_response = self.get_from_redis(
-                request.keyword, request.press, request.period
+                request.keyword,
+                request.press,
+                request.period,
+                version,
+                record_stats=record_metrics,
             )
+            stale_response = None
+            if not cached_response and settings.SUMMARY_SERVE_STALE:
+                stale_response = self.lookup_cached_summary(request)
+            if record_metrics:
+                self.record_cache_lookup(
+                    request, started, cached_response, stale_response
+                )
             if cached_response:
                 logger.info(
                     f" {', '.join(request.press)}의 {request.keyword}에 대한 캐싱된 결과 반환"
                 )
                 return cached_response
+            if stale_response:
+                self.refresh_in_background(request, version)
+                return stale_response
 
-            news_articles = await self.get_news_articles(request)
-            summary_items = await self.summarize_news(news_articles, request.keyword)
-
-            summary_text = [
-                SummaryItemDTO(title=item.title, content=item.content)
-                for item in summary_items
-            ]
-
-            article_dto = self.convert_news_articles(news_articles)
-
-            logger.info(f"summaries: {summary_text}")
-            logger.info(f"articles_dto: {article_dto}")
-
-            response = SummaryResponseDTO(summaries=summary_text, sources=article_dto)
-
-            self.push_to_redis(request.keyword, request.press, request.period, response)
-
-            return response
+            return await self.create_summary_once(request, version)
         except Exception as e:
             error_message = f"기사 요약 실패: {str(e)}"
             logger.error(error_message, exc_info=True)
@@ -202,8 +333,307 @@ class NewsService:
                 },
             )
 
+    async def create_summary_once(
+        self, request: SummaryRequestDTO, version: int
+    ) -> SummaryResponseDTO:
+        """같은 키·버전의 동시 요청은 한 번만 요약하고 결과를 공유합니다."""
+        key = self.news_data_manager.get_cache_key(
+            request.keyword, request.press, request.period, version=version
+        )
+        return await self.single_flight.do(
+            key,
+            lambda: self.create_summary(request, version),
+            lookup=lambda: self.lookup_cached_summary(request, version),
+            redis_client=self.news_data_manager.redis_client,
+        )
+
+    @staticmethod
+    def record_cache_lookup(request: SummaryRequestDTO, started: float, cached, stale):
+        """요청 하나의 캐시 조회 시간과 결과(hit/stale/miss)를 기록합니다.
+
+        Args:
+            request (SummaryRequestDTO): 요청 DTO
+            started (float): 조회를 시작한 time.perf_counter() 값
+            cached: 현재 버전의 캐시 조회 결과
+            stale: 이전 버전의 캐시 조회 결과
+        """
+        SUMMARY_STAGE_SECONDS.labels(stage="cache_lookup").observe(
+            time.perf_counter() - started
+        )
+        SUMMARY_CACHE_REQUESTS.labels(
+            keyword=keyword_label(request.keyword),
+            period=str(request.period),
+            result="hit" if cached else "stale" if stale else "miss",
+        ).inc()
+
+    def refresh_in_background(self, request: SummaryRequestDTO, version: int):
+        """새 버전의 요약을 백그라운드에서 만듭니다. 이미 진행 중이면 건너뜁니다."""
+        key = self.news_data_manager.get_cache_key(
+            request.keyword, request.press, request.period, version=version
+        )
+        if key in self.refresh_tasks or self.single_flight.get_pending(key):
+            return
+
+        logger.info(f"이전 요약을 반환하고 새 버전 요약 생성: {key}")
+        task = asyncio.create_task(self.create_summary_once(request, version))
+        self.refresh_tasks[key] = task
+        task.add_done_callback(lambda task: self.finish_refresh(key, task))
+
+    def finish_refresh(self, key: str, task: asyncio.Task):
+        self.refresh_tasks.pop(key, None)
+        if not task.cancelled() and task.exception():
+            logger.error(f"새 버전 요약 생성 실패: {str(task.exception())}")
+
+    async def rendered_summarized_news(
+        self, request: SummaryRequestDTO
+    ) -> RenderedResponse:
+        """캐싱된 최종 API 응답 본문이 있으면 그대로 반환하고, 없으면 요약 후 직렬화합니다.
+
+        Args:
+            request (SummaryRequestDTO): 요청 DTO
+
+        Returns:
+            RenderedResponse: 직렬화된 응답 본문과 ETag
+        """
+        started = time.perf_counter()
+        version = await self.news_data_manager.get_content_version_async(
+            request.keyword, request.press
+        )
+        rendered = self.news_data_manager.get_rendered_results(
+            request.keyword, request.press, request.period, version, record_stats=True
+        )
+        stale = None
+        if not rendered and settings.SUMMARY_SERVE_STALE:
+            stale = self.news_data_manager.get_rendered_results(
+                request.keyword, request.press, request.period
+            )
+        self.record_cache_lookup(request, started, rendered, stale)
+        if rendered:
+            return rendered
+        if stale:
+            # 이전 버전의 응답 본문을 먼저 반환하고 새 버전은 백그라운드에서 생성
+            self.refresh_in_background(request, version)
+            return stale
+
+        response = await self.summarized_news(request, record_metrics=False)
+        return self.news_data_manager.render_response(response)
+
+    async def create_summary(
+        self, request: SummaryRequestDTO, version: int = 0
+    ) -> SummaryResponseDTO:
+        """뉴스 기사를 조회해 OpenAI로 요약하고 Redis에 캐싱합니다.
+
+        Args:
+            request (SummaryRequestDTO): 요청 DTO
+            version (int): 기사를 조회하기 전에 읽은 기사 버전
+
+        Returns:
+            SummaryResponseDTO: 요약된 뉴스 기사 리스트
+
+        Raises:
+            SummaryError: 기사 조회, 요약, 캐싱 중 오류 발생 시
+        """
+        news_articles = await self.get_news_articles(request)
+        summary_articles, source_articles = await self.deduplicate_articles(
+            news_articles
+        )
+        summary_items = await self.summarize_news(
+            summary_articles, request.keyword, request.period
+        )
+
+        summary_text = [
+            SummaryItemDTO(title=item.title, content=item.content)
+            for item in summary_items
+        ]
+
+        with SUMMARY_STAGE_SECONDS.labels(stage="dto_conversion").time():
+            article_dto = self.convert_news_articles(source_articles)
+
+        logger.info(
+            "요약 생성 완료: keyword=%s, summaries=%d, sources=%d",
+            request.keyword,
+            len(summary_text),
+            len(article_dto),
+        )
+        # 기사 본문은 기록하지 않고 URL만 남김
+        logger.debug("summaries: %s", summary_text)
+        logger.debug("sources: %s", [article.url for article in article_dto])
+
+        response = SummaryResponseDTO(summaries=summary_text, sources=article_dto)
+
+        with SUMMARY_STAGE_SECONDS.labels(stage="cache_write").time():
+            self.push_to_redis(
+                request.keyword, request.press, request.period, response, version
+            )
+
+        return response
+
+    async def stream_summarized_news(
+        self, request: SummaryRequestDTO
+    ) -> AsyncIterator[Tuple[str, BaseModel | None]]:
+        """요약 결과를 SSE 이벤트 단위로 반환합니다.
+
+        원문 기사 목록(sources)을 먼저 보내고, OpenAI가 생성하는 대로 완성된
+        요약 항목(summary)을 하나씩 보냅니다. 생성이 끝나면 전체 결과를 Redis에 캐싱합니다.
+        캐시가 없으면 일반 요약 요청과 같은 SingleFlight를 거치므로, 같은 키를 다른 요청이나
+        인스턴스가 요약 중이면 그 결과를 기다렸다가 한 번에 보냅니다.
+
+        Args:
+            request (SummaryRequestDTO): 요청 DTO
+
+        Yields:
+            Tuple[str, BaseModel | None]: 이벤트 이름과 데이터
+        """
+        version = await self.news_data_manager.get_content_version_async(
+            request.keyword, request.press
+        )
+        key = self.news_data_manager.get_cache_key(
+            request.keyword, request.press, request.period, version=version
+        )
+        cached_response = self.lookup_cached_summary(
+            request, version, record_stats=True
+        )
+        if (
+            cached_response is None
+            and settings.SUMMARY_SERVE_STALE
+            and self.single_flight.get_pending(key) is None
+        ):
+            cached_response = self.lookup_cached_summary(request)
+            if cached_response is not None:
+                self.refresh_in_background(request, version)
+
+        if cached_response is not None:
+            for event in self._cached_stream_events(cached_response):
+                yield event
+            return
+
+        # 이 요청이 요약을 맡으면 생성되는 이벤트를 큐로 받아 바로 전송
+        events: asyncio.Queue = asyncio.Queue()
+        flight = asyncio.create_task(
+            self.single_flight.do(
+                key,
+                lambda: self.create_streamed_summary(request, version, events),
+                lookup=lambda: self.lookup_cached_summary(request, version),
+                redis_client=self.news_data_manager.redis_client,
+            )
+        )
+        streamed = False
+        try:
+            while True:
+                next_event = asyncio.create_task(events.get())
+                done, _ = await asyncio.wait(
+                    {next_event, flight}, return_when=asyncio.FIRST_COMPLETED
+                )
+                if next_event not in done:
+                    next_event.cancel()
+                    break
+                streamed = True
+                yield next_event.result()
+            while not events.empty():
+                streamed = True
+                yield events.get_nowait()
+        finally:
+            next_event.cancel()
+
+        # 다른 요청이 요약했으면 완성된 결과를 한 번에 전송
+        response = flight.result()
+        if not streamed:
+            for event in self._cached_stream_events(response):
+                yield event
+            return
+        yield "done", None
+
+    @staticmethod
+    def _cached_stream_events(
+        response: SummaryResponseDTO,
+    ) -> List[Tuple[str, BaseModel | None]]:
+        """완성된 요약 결과를 SSE 이벤트 목록으로 변환합니다."""
+        return [
+            ("sources", NewsListResponseDTO(sources=response.sources or [])),
+            *(("summary", item) for item in response.summaries or []),
+            ("done", None),
+        ]
+
+    async def create_streamed_summary(
+        self, request: SummaryRequestDTO, version: int, events: asyncio.Queue
+    ) -> SummaryResponseDTO:
+        """요약을 스트리밍으로 생성하며 완성된 항목을 이벤트 큐에 넣고 Redis에 캐싱합니다.
+
+        Args:
+            request (SummaryRequestDTO): 요청 DTO
+            version (int): 기사를 조회하기 전에 읽은 기사 버전
+            events (asyncio.Queue): (이벤트 이름, 데이터)를 넣을 큐
+
+        Returns:
+            SummaryResponseDTO: 요약된 뉴스 기사 리스트
+        """
+        news_articles = await self.get_news_articles(request)
+        summary_articles, source_articles = await self.deduplicate_articles(
+            news_articles
+        )
+        article_dto = self.convert_news_articles(source_articles)
+        events.put_nowait(("sources", NewsListResponseDTO(sources=article_dto)))
+
+        parser = SummaryStreamParser(self._parse_summary)
+        if self.incremental_summarizer.supports(request.period):
+            chunks = self.incremental_summarizer.stream_summarize(
+                request.keyword, summary_articles
+            )
+        else:
+            chunks = self.accumulated_summarizer.stream_accumulated_summary(
+                request.keyword, summary_articles
+            )
+        async for chunk in chunks:
+            for item in parser.feed(chunk):
+                events.put_nowait(("summary", item))
+        for item in parser.close():
+            events.put_nowait(("summary", item))
+
+        response = SummaryResponseDTO(
+            summaries=self._parse_summary(parser.text), sources=article_dto
+        )
+        self.push_to_redis(
+            request.keyword, request.press, request.period, response, version
+        )
+        return response
+
+    def lookup_cached_summary(
+        self,
+        request: SummaryRequestDTO,
+        version: int | None = None,
+        record_stats: bool = False,
+    ) -> SummaryResponseDTO | None:
+        """다른 요청이 저장한 요약 결과를 조회합니다. 조회 실패 시 None을 반환합니다.
+
+        Args:
+            request (SummaryRequestDTO): 요청 DTO
+            version (int | None): 기사 버전 (None이면 가장 최근에 저장된 결과)
+            record_stats (bool): Redis 적중/미적중 횟수 기록 여부 (요청당 한 번)
+
+        Returns:
+            SummaryResponseDTO | None: 캐싱된 결과 DTO
+        """
+        try:
+            cached_response = self.get_from_redis(
+                request.keyword,
+                request.press,
+                request.period,
+                version,
+                record_stats=record_stats,
+            )
+        except SummaryError:
+            return None
+        if cached_response and cached_response.summaries:
+            return cached_response
+        return None
+
     def push_to_redis(
-        self, keyword: str, press: List[str], period: int, response: SummaryResponseDTO
+        self,
+        keyword: str,
+        press: List[str],
+        period: int,
+        response: SummaryResponseDTO,
+        version: int = 0,
     ):
         """뉴스 기사를 Redis에 캐싱합니다.
 
@@ -212,12 +642,15 @@ class NewsService:
             press (List[str]): 검색 언론사
             period (int): 검색 기간
             response (SummaryResponseDTO): 요약 결과 DTO
+            version (int): 요약에 사용한 기사 버전
 
         Raises:
             Exception: 캐시 중 오류 발생 시
         """
         try:
-            self.news_data_manager.caching_results(keyword, press, period, response)
+            self.news_data_manager.caching_results(
+                keyword, press, period, response, version
+            )
         except Exception as e:
             error_message = f"Redis 캐싱 실패: {str(e)}"
             logger.error(error_message, exc_info=True)
@@ -231,20 +664,29 @@ class NewsService:
             )
 
     def get_from_redis(
-        self, keyword: str, press: List[str], period: int
-    ) -> SummaryResponseDTO:
+        self,
+        keyword: str,
+        press: List[str],
+        period: int,
+        version: int | None = None,
+        record_stats: bool = False,
+    ) -> SummaryResponseDTO | None:
         """Redis에서 캐싱된 뉴스 기사를 가져옵니다.
 
         Args:
             keyword (str): 검색 키워드
             press (List[str]): 검색 언론사
             period (int): 검색 기간
+            version (int | None): 기사 버전 (None이면 가장 최근에 저장된 결과)
+            record_stats (bool): Redis 적중/미적중 횟수 기록 여부 (요청당 한 번)
 
         Returns:
-            SummaryResponseDTO: 캐싱된 결과 DTO
+            SummaryResponseDTO | None: 캐싱된 결과 DTO (없으면 None)
         """
         try:
-            return self.news_data_manager.get_cached_results(keyword, press, period)
+            return self.news_data_manager.get_cached_results(
+                keyword, press, period, version, record_stats=record_stats
+            )
         except Exception as e:
             error_message = f"Redis 캐싱 조회 실패: {str(e)}"
             logger.error(error_message, exc_info=True)
@@ -265,12 +707,14 @@ class NewsService:
         """
         try:
             keywords = ["국내주식", "해외주식", "환율"]
-            news_articles = []
-            for request in [
-                SummaryRequestDTO(keyword=keyword, press=["hk", "mk", "sed"])
-                for keyword in keywords
-            ]:
-                news_articles.append(await self.get_news_articles(request))
+            news_articles = await asyncio.gather(
+                *(
+                    self.get_news_articles(
+                        SummaryRequestDTO(keyword=keyword, press=["hk", "mk", "sed"])
+                    )
+                    for keyword in keywords
+                )
+            )
 
             news_articles = [
                 self.convert_news_articles(news_article)
@@ -0,0 +1,81 @@
+import asyncio
+import logging
+import socket
+from app.config.settings import settings
+from app.data.news_data_manager import NewsDataManager
+from app.data.partitions import maintain_partitions
+
+logger = logging.getLogger(__name__)
+
+
+class PartitionMaintainer:
+    """news_articles의 날짜 파티션을 주기적으로 추가하고 보관 기간이 지난 파티션을 삭제합니다.
+
+    여러 인스턴스 중 Redis 락을 잡은 한 인스턴스만 DDL을 실행합니다.
+    """
+
+    def __init__(self, news_data_manager: NewsDataManager):
+        self.news_data_manager = news_data_manager
+        self.instance_id = f"{socket.gethostname()}:{settings.INSTANCE_PORT}"
+        self._task: asyncio.Task | None = None
+
+    def start(self):
+        """백그라운드 유지 작업을 시작합니다."""
+        if settings.PARTITION_MAINTENANCE_ENABLED and self._task is None:
+            self._task = asyncio.create_task(self.run())
+
+    async def stop(self):
+        """백그라운드 유지 작업을 중지합니다."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def run(self):
+        """기동 시 한 번, 이후 PARTITION_MAINTENANCE_INTERVAL_SECONDS마다 유지 작업을 실행합니다."""
+        while True:
+            try:
+                await self.maintain()
+            except Exception as e:
+                logger.error(f"파티션 유지 작업 실패: {str(e)}", exc_info=True)
+            await asyncio.sleep(settings.PARTITION_MAINTENANCE_INTERVAL_SECONDS)
+
+    def acquire_leader_lock(self) -> bool:
+        """유지 작업 락을 획득합니다. 작업 후 해제하지 않고 만료시킵니다.
+
+        Returns:
+            bool: 락 획득 여부
+        """
+        redis_client = self.news_data_manager.redis_client
+        if not redis_client:
+            logger.warning("Redis 연결이 없어 파티션 유지 작업을 건너뜁니다.")
+            return False
+
+        return bool(
+            redis_client.set(
+                "news:partition:lock",
+                self.instance_id,
+                nx=True,
+                ex=settings.PARTITION_MAINTENANCE_LOCK_TTL_SECONDS,
+            )
+        )
+
+    async def maintain(self) -> tuple:
+        """락을 잡은 경우 DB 스레드 풀에서 파티션 유지 작업을 실행합니다.
+
+        Returns:
+            tuple: 추가된 파티션, 삭제된 파티션
+        """
+        if self.news_data_manager.engine is None or not self.acquire_leader_lock():
+            return [], []
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self.news_data_manager.db_executor,
+            maintain_partitions,
+            self.news_data_manager.engine,
+        )
@@ -1,56 +1,212 @@
+import asyncio
 import openai
-from typing import List
+from typing import AsyncIterator, List
+from openai import AsyncOpenAI
 from app.config.settings import settings
 from app.core.exceptions import SummaryError
+from app.core.metrics import OPENAI_ERRORS, SUMMARY_STAGE_SECONDS, record_openai_usage
+from app.core.openai_client import get_openai_client
 from app.models.dtos import NewsArticleDTO
+from app.summary.prompt_packer import PromptPacker
 import logging
 
 logger = logging.getLogger(__name__)
 
+PERSONA_DATA = """당신은 금융 전문 분석가입니다. 키워드와 요약 기사를 바탕으로 주요 정보를 나열하십시오. 각 항목은 간결하고 사실적으로 기술하며 격식체를 사용하십시오. 예시:
+            "1. 코스피 급락: 코스피 지수가 전 거래일 대비 8.77% 하락한 2,441.55로 마감했습니다.
+            2. 코스닥 폭락: 코스닥 지수는 11.30% 하락한 691.28로 마감하며 700선이 무너졌습니다.
+            3. 시가총액 감소: 하루 만에 235조 원의 시가총액이 증발했습니다.
+            4. 주요 기업 주가 하락: 삼성전자는 10.30%, SK하이닉스는 9.87% 하락했습니다.
+            5. 시장 조치 발동: '사이드카'와 '서킷브레이커'가 4년 5개월 만에 발동되었습니다"
+            중복 없이 간결하게 요약 내용만 기술하십시오. 부연 설명은 생략하십시오."""
+
+# 프롬프트에서 요약할 텍스트 종류를 설명하는 문구
+ARTICLE_SUBJECT = "동일 주제 복수의 기사"
+PARTIAL_SUBJECT = "동일 주제 일별 요약"
+BATCH_SUBJECT = "동일 주제 부분 요약"
+
 
 class AccumulatedSummarizer:
-    def __init__(self):
-        self.openai_api_key = settings.OPENAI_API_KEY
+    def __init__(
+        self, client: AsyncOpenAI | None = None, packer: PromptPacker | None = None
+    ):
+        self.client = client or get_openai_client()
+        self.packer = packer or PromptPacker()
+
+    def build_messages(
+        self, keyword: str, requests: List[NewsArticleDTO]
+    ) -> List[dict]:
+        """기사 요약들을 하나의 프롬프트로 묶습니다."""
+        raw_summaries = [request.summary for request in requests]
+        summaries = [summary for summary in raw_summaries if summary is not None]
+        return self.build_text_messages(keyword, summaries)
+
+    def build_text_messages(
+        self, keyword: str, texts: List[str], subject: str = ARTICLE_SUBJECT
+    ) -> List[dict]:
+        """요약할 텍스트들을 하나의 프롬프트로 묶습니다.
+
+        Args:
+            keyword (str): 요약할 키워드
+            texts (List[str]): 기사 요약 또는 부분 요약 목록
+            subject (str): 텍스트 종류 설명
+
+        Returns:
+            List[dict]: OpenAI 메시지 목록
+        """
+        summaries_str = "\n".join(texts)
+
+        messages = f"""{subject}, 주제: {keyword}
+            {summaries_str}"""
+
+        return [
+            {
+                "role": "system",
+                "content": PERSONA_DATA,
+            },
+            {
+                "role": "user",
+                "content": messages,
+            },
+        ]
 
     async def accumulated_summary(
         self, keyword: str, requests: List[NewsArticleDTO]
     ) -> str:
+        summaries = self.packer.prepare_articles(requests)
+        return await self.summarize_packed(keyword, summaries)
+
+    async def summarize_packed(
+        self, keyword: str, texts: List[str], subject: str = ARTICLE_SUBJECT
+    ) -> str:
+        """텍스트를 입력 토큰 예산에 맞춰 요약합니다.
+
+        예산을 넘으면 묶음별로 나눠 요약한 뒤(map) 그 결과를 다시 합칩니다(reduce).
+
+        Args:
+            keyword (str): 요약할 키워드
+            texts (List[str]): 우선순위 순으로 정렬된 텍스트 목록
+            subject (str): 텍스트 종류 설명
+
+        Returns:
+            str: 번호가 매겨진 종합 요약 텍스트
+        """
+        batches = self.packer.pack(texts)
+        if len(batches) == 1:
+            return await self.summarize_texts(keyword, batches[0], subject)
+
+        partials = await self.map_batches(keyword, batches, subject)
+        return await self.summarize_texts(keyword, partials, BATCH_SUBJECT)
+
+    async def map_batches(
+        self, keyword: str, batches: List[List[str]], subject: str
+    ) -> List[str]:
+        """묶음별 요약을 동시에 생성합니다."""
+        logger.info(f"입력 토큰 예산 초과로 {len(batches)}개 묶음으로 나눠 요약합니다.")
+        return await asyncio.gather(
+            *(self.summarize_texts(keyword, batch, subject) for batch in batches)
+        )
+
+    async def summarize_texts(
+        self, keyword: str, texts: List[str], subject: str = ARTICLE_SUBJECT
+    ) -> str:
+        """텍스트 목록을 하나의 종합 요약으로 만듭니다.
+
+        Args:
+            keyword (str): 요약할 키워드
+            texts (List[str]): 기사 요약 또는 부분 요약 목록
+            subject (str): 텍스트 종류 설명
+
+        Returns:
+            str: 번호가 매겨진 종합 요약 텍스트
+
+        Raises:
+            SummaryError: OpenAI 호출 실패 시
+        """
         try:
-            openai.api_key = self.openai_api_key
+            with SUMMARY_STAGE_SECONDS.labels(stage="openai").time():
+                response = await self.client.chat.completions.create(
+                    model=settings.OPENAI_MODEL,
+                    messages=self.build_text_messages(keyword, texts, subject),
+                    max_tokens=250,
+                    temperature=1.0,
+                )
+            record_openai_usage(response.usage)
 
-            raw_summaries = [request.summary for request in requests]
-            summaries = [summary for summary in raw_summaries if summary is not None]
-            summaries_str = "\n".join(summaries)
+            return response.choices[0].message.content
+        except openai.APIError as e:
+            OPENAI_ERRORS.labels(error=type(e).__name__).inc()
+            error_msg = f"OpenAI API 오류: {str(e)}"
+            logger.error(error_msg, exc_info=True)
+            raise SummaryError(error_msg, details={"keyword": keyword})
+        except Exception as e:
+            error_msg = f"종합 요약 생성 실패: {str(e)}"
+            logger.error(error_msg, exc_info=True)
+            raise SummaryError(
+                error_msg, details={"keyword": keyword, "summary_count": len(texts)}
+            )
 
-            messages = f"""동일 주제 복수의 기사, 주제: {keyword}
-            {summaries_str}"""
+    async def stream_accumulated_summary(
+        self, keyword: str, requests: List[NewsArticleDTO]
+    ) -> AsyncIterator[str]:
+        """종합 요약을 생성되는 토큰 단위로 반환합니다.
 
-            persona_data = """당신은 금융 전문 분석가입니다. 키워드와 요약 기사를 바탕으로 주요 정보를 나열하십시오. 각 항목은 간결하고 사실적으로 기술하며 격식체를 사용하십시오. 예시:
-            "1. 코스피 급락: 코스피 지수가 전 거래일 대비 8.77% 하락한 2,441.55로 마감했습니다.
-            2. 코스닥 폭락: 코스닥 지수는 11.30% 하락한 691.28로 마감하며 700선이 무너졌습니다.
-            3. 시가총액 감소: 하루 만에 235조 원의 시가총액이 증발했습니다.
-            4. 주요 기업 주가 하락: 삼성전자는 10.30%, SK하이닉스는 9.87% 하락했습니다.
-            5. 시장 조치 발동: '사이드카'와 '서킷브레이커'가 4년 5개월 만에 발동되었습니다"
-            중복 없이 간결하게 요약 내용만 기술하십시오. 부연 설명은 생략하십시오."""
+        Args:
+            keyword (str): 요약할 키워드
+            requests (List[NewsArticleDTO]): 요약이 포함된 뉴스 기사 리스트
+
+        Yields:
+            str: 새로 생성된 텍스트 조각
+        """
+        summaries = self.packer.prepare_articles(requests)
+        async for chunk in self.stream_summarize_packed(keyword, summaries):
+            yield chunk
 
-            response = openai.chat.completions.create(
-                model="gpt-4o-mini",
-                messages=[
-                    {
-                        "role": "system",
-                        "content": persona_data,
-                    },
-                    {
-                        "role": "user",
-                        "content": messages,
-                    },
-                ],
+    async def stream_summarize_packed(
+        self, keyword: str, texts: List[str], subject: str = ARTICLE_SUBJECT
+    ) -> AsyncIterator[str]:
+        """summarize_packed와 같지만 마지막 요약을 토큰 단위로 반환합니다."""
+        batches = self.packer.pack(texts)
+        if len(batches) == 1:
+            texts = batches[0]
+        else:
+            texts = await self.map_batches(keyword, batches, subject)
+            subject = BATCH_SUBJECT
+
+        async for chunk in self.stream_summarize_texts(keyword, texts, subject):
+            yield chunk
+
+    async def stream_summarize_texts(
+        self, keyword: str, texts: List[str], subject: str = ARTICLE_SUBJECT
+    ) -> AsyncIterator[str]:
+        """텍스트 목록의 종합 요약을 생성되는 토큰 단위로 반환합니다.
+
+        Args:
+            keyword (str): 요약할 키워드
+            texts (List[str]): 기사 요약 또는 부분 요약 목록
+            subject (str): 텍스트 종류 설명
+
+        Yields:
+            str: 새로 생성된 텍스트 조각
+        """
+        try:
+            stream = await self.client.chat.completions.create(
+                model=settings.OPENAI_MODEL,
+                messages=self.build_text_messages(keyword, texts, subject),
                 max_tokens=250,
                 temperature=1.0,
+                stream=True,
+                # 마지막 청크로 토큰 사용량을 받음
+                stream_options={"include_usage": True},
             )
 
-            return response.choices[0].message.content
+            async for chunk in stream:
+                if chunk.usage:
+                    record_openai_usage(chunk.usage)
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
         except openai.APIError as e:
+            OPENAI_ERRORS.labels(error=type(e).__name__).inc()
             error_msg = f"OpenAI API 오류: {str(e)}"
             logger.error(error_msg, exc_info=True)
             raise SummaryError(error_msg, details={"keyword": keyword})
@@ -58,5 +214,5 @@ class AccumulatedSummarizer:
             error_msg = f"종합 요약 생성 실패: {str(e)}"
             logger.error(error_msg, exc_info=True)
             raise SummaryError(
-                error_msg, details={"keyword": keyword, "summary_count": len(summaries)}
+                error_msg, details={"keyword": keyword, "summary_count": len(texts)}
             )
@@ -0,0 +1,180 @@
+"""news_articles.summary가 비어 있는 기사 일괄 요약
+
+요약이 없는 기사를 (url, 발행 시각) 순으로 나눠 조회하고, 개별 요약을 동시에 생성해 일괄 저장합니다.
+처리한 마지막 url과 발행 시각을 체크포인트 파일에 기록하므로 중단 후 다시 실행하면 이어서 진행합니다.
+
+    python -m app.summary.backfill                       # 이어서 실행
+    python -m app.summary.backfill --reset               # 처음부터 다시 실행
+    OPENAI_BASE_URL=http://localhost:18080/v1 \\
+        python -m app.summary.backfill --dry-run --limit 100  # 테스트용 LLM 서버로 저장 없이 실행
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+from app.config.logging_config import setup_logging
+from app.core.exceptions import SummaryError
+from app.data.news_data_manager import NewsDataManager
+from app.summary.individual_summarizer import IndividualSummarizer
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHECKPOINT_PATH = Path("backfill_checkpoint.json")
+
+
+def load_checkpoint(path: Path) -> dict:
+    """체크포인트를 읽습니다. 파일이 없으면 처음부터 시작합니다."""
+    if not path.exists():
+        return {
+            "last_url": "",
+            "last_published_date": None,
+            "processed": 0,
+            "updated": 0,
+        }
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def get_last_published_date(checkpoint: dict) -> datetime | None:
+    """체크포인트의 마지막 발행 시각을 반환합니다. url만 기록된 이전 체크포인트는 None입니다."""
+    last_published_date = checkpoint.get("last_published_date")
+    if last_published_date is None:
+        return None
+    return datetime.fromisoformat(last_published_date)
+
+
+def save_checkpoint(path: Path, checkpoint: dict):
+    """중간에 종료되어도 파일이 깨지지 않도록 임시 파일에 쓴 뒤 교체합니다."""
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(checkpoint, f, ensure_ascii=False)
+    os.replace(tmp_path, path)
+
+
+async def backfill(
+    news_data_manager: NewsDataManager,
+    summarizer: IndividualSummarizer,
+    checkpoint_path: Path,
+    batch_size: int,
+    limit: int | None = None,
+    dry_run: bool = False,
+) -> dict:
+    """요약이 없는 기사를 batch_size씩 요약해 저장합니다.
+
+    일부 기사 요약에 실패하면 해당 기사는 비워 둔 채 다음으로 넘어가고,
+    한 묶음 전체가 실패하면(LLM 장애 등) 체크포인트를 남기고 중단합니다.
+
+    Args:
+        news_data_manager (NewsDataManager): DB 접근 객체
+        summarizer (IndividualSummarizer): 개별 기사 요약기
+        checkpoint_path (Path): 체크포인트 파일 경로
+        batch_size (int): 한 번에 조회할 기사 수
+        limit (int | None): 이번 실행에서 처리할 최대 기사 수
+        dry_run (bool): True면 DB와 체크포인트에 저장하지 않음
+
+    Returns:
+        dict: 마지막 체크포인트 (last_url, last_published_date, processed, updated)
+
+    Raises:
+        SummaryError: 한 묶음의 모든 기사 요약에 실패한 경우
+    """
+    checkpoint = load_checkpoint(checkpoint_path)
+    loop = asyncio.get_running_loop()
+    started_at = time.monotonic()
+    processed = 0
+
+    while limit is None or processed < limit:
+        size = batch_size if limit is None else min(batch_size, limit - processed)
+        articles = await loop.run_in_executor(
+            news_data_manager.db_executor,
+            news_data_manager.retrieve_articles_without_summary,
+            checkpoint["last_url"],
+            get_last_published_date(checkpoint),
+            size,
+        )
+        if not articles:
+            break
+
+        batch_started_at = time.monotonic()
+        updated = await summarizer.populate_summaries(articles, dry_run=dry_run)
+
+        processed += len(articles)
+        checkpoint["last_url"] = articles[-1].url
+        checkpoint["last_published_date"] = articles[-1].published_date.isoformat()
+        checkpoint["processed"] += len(articles)
+        checkpoint["updated"] += updated
+        if not dry_run:
+            save_checkpoint(checkpoint_path, checkpoint)
+
+        batch_elapsed = time.monotonic() - batch_started_at
+        total_elapsed = time.monotonic() - started_at
+        logger.info(
+            f"{len(articles)}건 처리, {updated}건 저장 ({len(articles) / batch_elapsed:.1f}건/초), "
+            f"누적 {processed}건 ({processed / total_elapsed:.1f}건/초), 마지막 url: {checkpoint['last_url']}"
+        )
+
+    return checkpoint
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="비어 있는 기사 요약 일괄 생성")
+    parser.add_argument(
+        "--batch-size", type=int, default=200, help="한 번에 조회할 기사 수"
+    )
+    parser.add_argument("--limit", type=int, help="이번 실행에서 처리할 최대 기사 수")
+    parser.add_argument(
+        "--checkpoint",
+        type=Path,
+        default=DEFAULT_CHECKPOINT_PATH,
+        help="체크포인트 파일 경로",
+    )
+    parser.add_argument(
+        "--reset", action="store_true", help="체크포인트를 지우고 처음부터 실행합니다."
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="요약만 하고 DB, 요약 캐시, 체크포인트에는 저장하지 않습니다.",
+    )
+    args = parser.parse_args()
+
+    setup_logging()
+    news_data_manager = NewsDataManager()
+    if news_data_manager.engine is None:
+        return 1
+
+    if args.reset and args.checkpoint.exists():
+        args.checkpoint.unlink()
+
+    summarizer = IndividualSummarizer(
+        news_data_manager=news_data_manager, cache_results=not args.dry_run
+    )
+    try:
+        checkpoint = asyncio.run(
+            backfill(
+                news_data_manager,
+                summarizer,
+                args.checkpoint,
+                args.batch_size,
+                limit=args.limit,
+                dry_run=args.dry_run,
+            )
+        )
+    except SummaryError as e:
+        logger.error(f"요약 일괄 생성 중단: {str(e)}")
+        return 1
+
+    logger.info(
+        f"완료: 누적 {checkpoint['processed']}건 처리, {checkpoint['updated']}건 저장"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
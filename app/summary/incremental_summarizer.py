@@ -0,0 +1,178 @@
+import asyncio
+import hashlib
+import logging
+from collections import defaultdict
+from datetime import date
+from typing import AsyncIterator, Dict, List, Tuple
+from app.config.settings import settings
+from app.core.metrics import PARTIAL_SUMMARY_REQUESTS
+from app.data.news_data_manager import NewsDataManager
+from app.models.dtos import NewsArticleDTO
+from app.summary.accumulated_summarizer import AccumulatedSummarizer, PARTIAL_SUBJECT
+
+logger = logging.getLogger(__name__)
+
+PARTIAL_KEY_PREFIX = "news:partial"
+
+
+class IncrementalSummarizer:
+    """기간 요약을 일별·키워드별·언론사별 부분 요약으로 나눠 만들고 합칩니다.
+
+    부분 요약은 포함된 기사(URL, 기사 요약)의 해시와 함께 Redis에 저장되므로,
+    지난 날짜의 부분 요약은 다음 날 요청에서도 그대로 재사용됩니다.
+    기간 요약마다 새로 만드는 것은 새 기사가 들어온 날의 부분 요약과 최종 병합뿐입니다.
+    """
+
+    def __init__(
+        self,
+        accumulated_summarizer: AccumulatedSummarizer,
+        news_data_manager: NewsDataManager,
+    ):
+        self.accumulated_summarizer = accumulated_summarizer
+        self.news_data_manager = news_data_manager
+        self.semaphore = asyncio.Semaphore(settings.PARTIAL_SUMMARY_CONCURRENCY)
+
+    @staticmethod
+    def supports(period: int) -> bool:
+        """증분 요약을 사용하는 기간인지 확인합니다."""
+        return (
+            settings.INCREMENTAL_SUMMARY_ENABLED
+            and period in settings.INCREMENTAL_SUMMARY_PERIODS
+        )
+
+    @staticmethod
+    def group_articles(
+        articles: List[NewsArticleDTO],
+    ) -> Dict[Tuple[date, str, str], List[NewsArticleDTO]]:
+        """요약이 있는 기사를 (날짜, 키워드, 언론사) 단위로 묶습니다."""
+        groups = defaultdict(list)
+        for article in articles:
+            if article.summary is None:
+                continue
+            day = article.published_date.date()
+            groups[(day, article.keyword, article.press)].append(article)
+        return groups
+
+    @staticmethod
+    def get_partial_key(
+        day: date, keyword: str, press: str, articles: List[NewsArticleDTO]
+    ) -> str:
+        """부분 요약 캐시 키를 생성합니다. 기사 구성이 바뀌면 키도 바뀝니다."""
+        digest = hashlib.sha1()
+        for article in sorted(articles, key=lambda article: article.url):
+            digest.update(article.url.encode("utf-8"))
+            digest.update(b"\0")
+            digest.update(article.summary.encode("utf-8"))
+            digest.update(b"\0")
+        return f"{PARTIAL_KEY_PREFIX}:{day:%Y%m%d}:{keyword}:{press}:{digest.hexdigest()[:16]}"
+
+    def load_partials(self, keys: List[str]) -> List[str | None]:
+        """저장된 부분 요약을 조회합니다. 조회 실패 시 모두 없는 것으로 처리합니다."""
+        redis_client = self.news_data_manager.redis_client
+        if redis_client is None or not keys:
+            return [None] * len(keys)
+        try:
+            values = redis_client.mget(keys)
+        except Exception as e:
+            logger.warning(f"부분 요약 조회 실패: {str(e)}")
+            return [None] * len(keys)
+        return [value.decode("utf-8") if value else None for value in values]
+
+    def save_partials(self, partials: Dict[str, str]):
+        """새로 만든 부분 요약을 저장합니다. 저장에 실패해도 요약은 계속 진행합니다."""
+        redis_client = self.news_data_manager.redis_client
+        if redis_client is None or not partials:
+            return
+        try:
+            pipe = redis_client.pipeline(transaction=False)
+            for key, text in partials.items():
+                pipe.setex(key, settings.PARTIAL_SUMMARY_TTL_SECONDS, text)
+            pipe.execute()
+        except Exception as e:
+            logger.warning(f"부분 요약 저장 실패: {str(e)}")
+
+    async def create_partial(self, keyword: str, articles: List[NewsArticleDTO]) -> str:
+        """한 날짜·언론사의 기사 요약들로 부분 요약을 만듭니다."""
+        async with self.semaphore:
+            return await self.accumulated_summarizer.summarize_packed(
+                keyword, self.accumulated_summarizer.packer.prepare_articles(articles)
+            )
+
+    async def build_partials(
+        self, keyword: str, articles: List[NewsArticleDTO]
+    ) -> List[str]:
+        """기간 내 기사를 부분 요약 목록으로 바꿉니다.
+
+        기사가 하나뿐인 묶음은 기사 요약을 그대로 사용하고, 저장된 부분 요약이 없는
+        묶음만 OpenAI로 요약합니다.
+
+        Args:
+            keyword (str): 요청 키워드
+            articles (List[NewsArticleDTO]): 기간 내 뉴스 기사 목록
+
+        Returns:
+            List[str]: 날짜 내림차순으로 정렬된 부분 요약 목록
+
+        Raises:
+            SummaryError: 부분 요약 생성 실패 시
+        """
+        groups = sorted(
+            self.group_articles(articles).items(),
+            key=lambda item: item[0],
+            reverse=True,
+        )
+        keys = [
+            self.get_partial_key(day, group_keyword, press, group)
+            for (day, group_keyword, press), group in groups
+        ]
+        # Redis 조회/저장은 동기 호출이므로 이벤트 루프를 막지 않도록 스레드에서 실행
+        texts = await asyncio.to_thread(self.load_partials, keys)
+
+        missing = []
+        for index, ((day, group_keyword, press), group) in enumerate(groups):
+            if texts[index] is not None:
+                PARTIAL_SUMMARY_REQUESTS.labels(result="hit").inc()
+            elif len(group) == 1:
+                PARTIAL_SUMMARY_REQUESTS.labels(result="single").inc()
+                texts[index] = group[0].summary
+            else:
+                PARTIAL_SUMMARY_REQUESTS.labels(result="miss").inc()
+                missing.append(index)
+
+        if missing:
+            created = await asyncio.gather(
+                *(
+                    self.create_partial(groups[index][0][1], groups[index][1])
+                    for index in missing
+                )
+            )
+            for index, text in zip(missing, created):
+                texts[index] = text
+            await asyncio.to_thread(
+                self.save_partials, {keys[index]: texts[index] for index in missing}
+            )
+
+        logger.info(
+            f"부분 요약 준비 완료: keyword={keyword}, groups={len(groups)}, created={len(missing)}"
+        )
+        return [
+            f"[{day:%Y-%m-%d} {group_keyword} {press}]\n{text}"
+            for ((day, group_keyword, press), _), text in zip(groups, texts)
+        ]
+
+    async def summarize(self, keyword: str, articles: List[NewsArticleDTO]) -> str:
+        """부분 요약들을 합쳐 기간 전체의 종합 요약을 만듭니다."""
+        partials = await self.build_partials(keyword, articles)
+        return await self.accumulated_summarizer.summarize_packed(
+            keyword, partials, subject=PARTIAL_SUBJECT
+        )
+
+    async def stream_summarize(
+        self, keyword: str, articles: List[NewsArticleDTO]
+    ) -> AsyncIterator[str]:
+        """부분 요약을 준비한 뒤 최종 병합 요약을 토큰 단위로 반환합니다."""
+        partials = await self.build_partials(keyword, articles)
+        async for chunk in self.accumulated_summarizer.stream_summarize_packed(
+            keyword, partials, subject=PARTIAL_SUBJECT
+        ):
+            yield chunk
@@ -1,28 +1,81 @@
-import json
+import hashlib
+import random
 from typing import List
 from app.config.settings import settings
 from app.summary.accumulated_summarizer import AccumulatedSummarizer
+from app.summary.prompt_packer import load_token_counter
+from app.summary.rate_limiter import RateLimiter
+from app.data.news_data_manager import NewsDataManager
 from app.models.dtos import NewsArticleDTO
 from app.core.exceptions import SummaryError
+from app.core.metrics import OPENAI_ERRORS, record_openai_usage
 import logging
 import asyncio
-import aiohttp
 import openai
+from openai import AsyncOpenAI
+from app.core.openai_client import get_openai_client
 
 logger = logging.getLogger(__name__)
 
+INDIVIDUAL_PERSONA_DATA = """
+            뉴스 기사를 분야별 핵심 정보 중심으로 3문장 이내로 요약해주세요.
+
+            공통 요약 규칙:
+            - '~했다'로 문장 종결
+            - 객관적 사실만 포함 (분석/전망/해석 제외)
+            - 구체적 날짜와 수치 유지
+
+            분야별 포함할 핵심 정보:
+            금융/증권: 지수 변동(등락폭/비율), 거래 주체별 매매 동향, 주요 거래 금액
+            산업/기업: 기업명, 핵심 사건, 규모/금액
+            정치/정책: 정책/법안 내용, 관련 기관/인물, 시행 시기
+            국제/글로벌: 발생 국가/지역, 핵심 당사자, 국내 영향
+            """
+
+SUMMARY_MAX_TOKENS = 250
+
+# 직접 재시도하는 오류. 클라이언트 자체 재시도를 끄므로 클라이언트가 재시도하던
+# 요청 한도 초과, 연결 오류(타임아웃 포함), 5xx 응답을 모두 포함
+RETRYABLE_ERRORS = (
+    openai.RateLimitError,
+    openai.APIConnectionError,
+    openai.InternalServerError,
+)
+ARTICLE_SUMMARY_KEY_PREFIX = "news:article-summary"
+
 
 class IndividualSummarizer:
-    def __init__(self):
-        self.openai_api_key = settings.openai_api_key
-        self.accumulated_summarizer = AccumulatedSummarizer()
+    """기사별 요약을 동시 실행 수와 분당 요청/토큰 한도 안에서 일괄 생성합니다.
+
+    같은 본문의 요약 결과는 본문 해시로 Redis에 저장해 다시 요청하지 않으며,
+    429 응답과 연결 오류, 5xx 응답은 지터를 준 지수 백오프로 재시도합니다.
+    """
+
+    def __init__(
+        self,
+        client: AsyncOpenAI | None = None,
+        news_data_manager: NewsDataManager | None = None,
+        rate_limiter: RateLimiter | None = None,
+        cache_results: bool = True,
+    ):
+        # 재시도는 rate limiter와 함께 직접 처리하므로 클라이언트 자체 재시도는 끔
+        self.client = (client or get_openai_client()).with_options(max_retries=0)
+        self.accumulated_summarizer = AccumulatedSummarizer(client)
+        self.news_data_manager = news_data_manager or NewsDataManager()
+        self.rate_limiter = rate_limiter or RateLimiter(
+            settings.OPENAI_REQUESTS_PER_MINUTE, settings.OPENAI_TOKENS_PER_MINUTE
+        )
+        self.semaphore = asyncio.Semaphore(settings.INDIVIDUAL_SUMMARY_CONCURRENCY)
+        self.count_tokens = load_token_counter(settings.OPENAI_MODEL)
+        # 테스트용 LLM 서버로 실행할 때는 결과가 캐시에 섞이지 않도록 끔
+        self.cache_results = cache_results
 
     async def summarize(self, articles: List[NewsArticleDTO], keyword: str) -> str:
         try:
             individual_summaries = await self._generate_individual_summary(
                 articles, keyword
             )
-            accumulated_summary = self.accumulated_summarizer.accumulated_summary(
+            accumulated_summary = await self.accumulated_summarizer.accumulated_summary(
                 keyword, individual_summaries
             )
             return accumulated_summary
@@ -37,75 +90,214 @@ class IndividualSummarizer:
                 },
             )
 
+    async def populate_summaries(
+        self, articles: List[NewsArticleDTO], keyword: str = "", dry_run: bool = False
+    ) -> int:
+        """요약이 없는 기사를 요약해 news_articles.summary에 일괄 저장합니다.
+
+        Args:
+            articles (List[NewsArticleDTO]): 뉴스 기사 목록
+            keyword (str): 검색 키워드 (오류 기록용)
+            dry_run (bool): True면 요약만 하고 DB에 저장하지 않음
+
+        Returns:
+            int: 갱신된(dry_run이면 갱신할) 행 수
+
+        Raises:
+            SummaryError: 모든 기사 요약에 실패한 경우
+        """
+        targets = [article for article in articles if article.summary is None]
+        if not targets:
+            return 0
+
+        summarized = await self._generate_individual_summary(targets, keyword)
+        if dry_run:
+            logger.info(f"[dry-run] 기사 요약 {len(summarized)}건 저장 생략")
+            return len(summarized)
+
+        loop = asyncio.get_running_loop()
+        updated = await loop.run_in_executor(
+            self.news_data_manager.db_executor,
+            self.news_data_manager.update_article_summaries,
+            [
+                (article.url, article.published_date, article.summary)
+                for article in summarized
+            ],
+        )
+        logger.info(f"기사 요약 {updated}건 저장 (대상 {len(targets)}건)")
+        return updated
+
     async def _generate_individual_summary(
         self, articles: List[NewsArticleDTO], keyword: str
-    ) -> List[str]:
+    ) -> List[NewsArticleDTO]:
+        """기사별 요약을 생성해 summary가 채워진 기사 목록을 반환합니다.
+
+        요약에 실패한 기사는 제외합니다.
+
+        Args:
+            articles (List[NewsArticleDTO]): 뉴스 기사 목록
+            keyword (str): 검색 키워드
+
+        Returns:
+            List[NewsArticleDTO]: summary가 채워진 기사 목록
+
+        Raises:
+            SummaryError: 기사 목록이 비어 있거나 모든 기사 요약에 실패한 경우
+        """
         if not articles:
             error_message = "기사 목록이 비어 있습니다."
             logger.error(error_message)
             raise SummaryError(error_message, details={"keyword": keyword})
 
-        async with aiohttp.ClientSession() as session:
-            tasks = [
-                self._summarize_article(session, article, keyword)
-                for article in articles
-            ]
-            summaries = await asyncio.gather(*tasks, return_exceptions=True)
+        keys = [self.get_summary_key(article.content) for article in articles]
+        summaries = self.load_summaries(keys)
+
+        # 본문이 같은 기사는 한 번만 요약
+        missing = {}
+        for index, summary in enumerate(summaries):
+            if summary is None:
+                missing.setdefault(keys[index], index)
+        results = await asyncio.gather(
+            *(
+                self._summarize_article(articles[index], keyword)
+                for index in missing.values()
+            ),
+            return_exceptions=True,
+        )
+        created = {
+            key: result
+            for key, result in zip(missing, results)
+            if isinstance(result, str)
+        }
+        self.save_summaries(created)
+        summaries = [
+            summary if summary is not None else created.get(key)
+            for key, summary in zip(keys, summaries)
+        ]
 
-        valid_summaries = [summary for summary in summaries if isinstance(summary, str)]
+        valid_articles = [
+            article.model_copy(update={"summary": summary})
+            for article, summary in zip(articles, summaries)
+            if summary is not None
+        ]
 
-        if not valid_summaries:
+        if not valid_articles:
             error_message = "모든 기사 요약 실패"
             logger.error(error_message)
             raise SummaryError(error_message, details={"article_count": len(articles)})
 
-        logger.info(f"Generated {len(valid_summaries)} individual summaries")
-        return valid_summaries
+        logger.info(
+            f"Generated {len(created)} individual summaries "
+            f"({len(missing) - len(created)} failed, {len(valid_articles)} articles)"
+        )
+        return valid_articles
 
-    async def _summarize_article(
-        self, session: aiohttp.ClientSession, article: NewsArticleDTO, keyword: str
-    ) -> str:
+    @staticmethod
+    def get_summary_key(content: str) -> str:
+        """본문 해시로 요약 캐시 키를 생성합니다."""
+        digest = hashlib.sha1(content.encode("utf-8")).hexdigest()
+        return f"{ARTICLE_SUMMARY_KEY_PREFIX}:{settings.OPENAI_MODEL}:{digest}"
 
+    def load_summaries(self, keys: List[str]) -> List[str | None]:
+        """저장된 기사 요약을 조회합니다. 조회 실패 시 모두 없는 것으로 처리합니다."""
+        redis_client = self.news_data_manager.redis_client
+        if redis_client is None or not self.cache_results:
+            return [None] * len(keys)
         try:
-            openai.api_key = self.openai_api_key
-
-            persona_data = """
-            뉴스 기사를 분야별 핵심 정보 중심으로 3문장 이내로 요약해주세요.
+            values = redis_client.mget(keys)
+        except Exception as e:
+            logger.warning(f"기사 요약 캐시 조회 실패: {str(e)}")
+            return [None] * len(keys)
+        return [value.decode("utf-8") if value else None for value in values]
 
-            공통 요약 규칙:
-            - '~했다'로 문장 종결
-            - 객관적 사실만 포함 (분석/전망/해석 제외)
-            - 구체적 날짜와 수치 유지
+    def save_summaries(self, summaries: dict):
+        """새로 만든 기사 요약을 저장합니다."""
+        redis_client = self.news_data_manager.redis_client
+        if redis_client is None or not self.cache_results or not summaries:
+            return
+        try:
+            pipe = redis_client.pipeline(transaction=False)
+            for key, summary in summaries.items():
+                pipe.setex(key, settings.INDIVIDUAL_SUMMARY_CACHE_TTL_SECONDS, summary)
+            pipe.execute()
+        except Exception as e:
+            logger.warning(f"기사 요약 캐시 저장 실패: {str(e)}")
 
-            분야별 포함할 핵심 정보:
-            금융/증권: 지수 변동(등락폭/비율), 거래 주체별 매매 동향, 주요 거래 금액
-            산업/기업: 기업명, 핵심 사건, 규모/금액
-            정치/정책: 정책/법안 내용, 관련 기관/인물, 시행 시기
-            국제/글로벌: 발생 국가/지역, 핵심 당사자, 국내 영향
-            """
+    @staticmethod
+    def get_retry_delay(attempt: int, error: openai.APIError) -> float:
+        """재시도 대기 시간. Retry-After 헤더가 있으면 그 이상 기다립니다."""
+        backoff = min(
+            settings.INDIVIDUAL_SUMMARY_RETRY_MAX_SECONDS,
+            settings.INDIVIDUAL_SUMMARY_RETRY_BASE_SECONDS * 2**attempt,
+        )
+        delay = random.uniform(backoff / 2, backoff)
+        # 연결 오류에는 응답이 없음
+        response = getattr(error, "response", None)
+        try:
+            retry_after = float(response.headers.get("retry-after", 0))
+        except (AttributeError, TypeError, ValueError):
+            retry_after = 0
+        return max(delay, retry_after)
 
-            response = openai.chat.completions.create(
-                model="gpt-4o-mini",
-                messages=[
-                    {
-                        "role": "system",
-                        "content": persona_data,
-                    },
-                    {
-                        "role": "user",
-                        "content": article.content,
-                    },
-                ],
-                max_tokens=250,
-                temperature=1.0,
-            )
+    async def _summarize_article(self, article: NewsArticleDTO, keyword: str) -> str:
+        messages = [
+            {
+                "role": "system",
+                "content": INDIVIDUAL_PERSONA_DATA,
+            },
+            {
+                "role": "user",
+                "content": article.content,
+            },
+        ]
+        estimated_tokens = (
+            self.count_tokens(INDIVIDUAL_PERSONA_DATA)
+            + self.count_tokens(article.content)
+            + SUMMARY_MAX_TOKENS
+        )
 
-            return response.choices[0].message.content
-        except openai.APIError as e:
-            error_msg = f"OpenAI API 오류: {str(e)}"
-            logger.error(error_msg, exc_info=True)
-            return SummaryError(error_msg)
-        except Exception as e:
-            error_msg = f"단문 요약 생성 실패: {str(e)}"
-            logger.error(error_msg, exc_info=True)
-            raise SummaryError(error_msg, details={"keyword": keyword})
+        async with self.semaphore:
+            for attempt in range(settings.INDIVIDUAL_SUMMARY_MAX_RETRIES + 1):
+                await self.rate_limiter.acquire(estimated_tokens)
+                try:
+                    response = await asyncio.wait_for(
+                        self.client.chat.completions.create(
+                            model=settings.OPENAI_MODEL,
+                            messages=messages,
+                            max_tokens=SUMMARY_MAX_TOKENS,
+                            temperature=1.0,
+                        ),
+                        timeout=settings.INDIVIDUAL_SUMMARY_TIMEOUT_SECONDS,
+                    )
+                    record_openai_usage(response.usage)
+                    return response.choices[0].message.content
+                except RETRYABLE_ERRORS as e:
+                    OPENAI_ERRORS.labels(error=type(e).__name__).inc()
+                    reason = (
+                        "OpenAI 요청 한도 초과"
+                        if isinstance(e, openai.RateLimitError)
+                        else "OpenAI 연결/서버 오류"
+                    )
+                    if attempt == settings.INDIVIDUAL_SUMMARY_MAX_RETRIES:
+                        error_msg = f"{reason}: {str(e)}"
+                        logger.error(error_msg)
+                        raise SummaryError(error_msg, details={"url": article.url})
+                    delay = self.get_retry_delay(attempt, e)
+                    logger.warning(
+                        f"{reason}, {delay:.1f}초 후 재시도 ({attempt + 1}회)"
+                    )
+                    await asyncio.sleep(delay)
+                except asyncio.TimeoutError:
+                    OPENAI_ERRORS.labels(error="Timeout").inc()
+                    error_msg = "단문 요약 시간 초과"
+                    logger.error(f"{error_msg}: {article.url}")
+                    raise SummaryError(error_msg, details={"url": article.url})
+                except openai.APIError as e:
+                    OPENAI_ERRORS.labels(error=type(e).__name__).inc()
+                    error_msg = f"OpenAI API 오류: {str(e)}"
+                    logger.error(error_msg, exc_info=True)
+                    raise SummaryError(error_msg, details={"url": article.url})
+                except Exception as e:
+                    error_msg = f"단문 요약 생성 실패: {str(e)}"
+                    logger.error(error_msg, exc_info=True)
+                    raise SummaryError(error_msg, details={"keyword": keyword})
@@ -0,0 +1,139 @@
+import logging
+import re
+from collections import OrderedDict
+from typing import Callable, List, Set
+from app.config.settings import settings
+from app.core.metrics import PROMPT_PACKING_ITEMS
+from app.models.dtos import NewsArticleDTO
+
+logger = logging.getLogger(__name__)
+
+WHITESPACE_PATTERN = re.compile(r"\s+")
+
+
+def load_token_counter(model: str) -> Callable[[str], int]:
+    """tiktoken이 설치되어 있으면 모델 토크나이저를, 없으면 근사치 계산을 사용합니다."""
+    try:
+        import tiktoken
+    except ImportError:
+        logger.info("tiktoken이 없어 토큰 수를 근사치로 계산합니다.")
+        return estimate_tokens
+
+    try:
+        encoding = tiktoken.encoding_for_model(model)
+    except KeyError:
+        encoding = tiktoken.get_encoding("o200k_base")
+    return lambda text: len(encoding.encode(text))
+
+
+def estimate_tokens(text: str) -> int:
+    """토큰 수 근사치. 한글 등 비ASCII 문자는 1자당 1토큰, ASCII는 4자당 1토큰으로 계산합니다."""
+    non_ascii = sum(1 for char in text if ord(char) > 127)
+    return non_ascii + (len(text) - non_ascii + 3) // 4
+
+
+class PromptPacker:
+    """기사 요약을 입력 토큰 예산에 맞춰 프롬프트에 담습니다.
+
+    거의 같은 요약(다른 언론사의 같은 기사 등)은 하나만 남기고, 최신순으로
+    키워드·언론사를 번갈아 배치해 예산이 부족해도 다양한 출처가 포함되도록 합니다.
+    예산을 넘으면 여러 묶음으로 나누며(map-reduce), 묶음 수 제한을 넘는 뒷순위 요약은 제외합니다.
+    """
+
+    def __init__(
+        self,
+        token_budget: int = settings.PROMPT_INPUT_TOKEN_BUDGET,
+        max_batches: int = settings.PROMPT_MAX_MAP_BATCHES,
+        dedup_threshold: float = settings.PROMPT_DEDUP_THRESHOLD,
+        model: str = settings.OPENAI_MODEL,
+    ):
+        self.token_budget = token_budget
+        self.max_batches = max_batches
+        self.dedup_threshold = dedup_threshold
+        self.count_tokens = load_token_counter(model)
+
+    @staticmethod
+    def shingles(text: str, size: int = 3) -> Set[str]:
+        """공백을 정규화한 문자 n-gram 집합을 반환합니다."""
+        normalized = WHITESPACE_PATTERN.sub(" ", text).strip()
+        if len(normalized) <= size:
+            return {normalized}
+        return {normalized[i : i + size] for i in range(len(normalized) - size + 1)}
+
+    @staticmethod
+    def jaccard(a: Set[str], b: Set[str]) -> float:
+        if not a or not b:
+            return 0.0
+        return len(a & b) / len(a | b)
+
+    def rank_articles(self, articles: List[NewsArticleDTO]) -> List[NewsArticleDTO]:
+        """최신순으로 정렬한 뒤 (키워드, 언론사) 묶음을 번갈아 가며 배치합니다."""
+        buckets = OrderedDict()
+        for article in sorted(
+            articles, key=lambda article: article.published_date, reverse=True
+        ):
+            buckets.setdefault((article.keyword, article.press), []).append(article)
+
+        ranked = []
+        queues = list(buckets.values())
+        depth = 0
+        while len(ranked) < len(articles):
+            for queue in queues:
+                if depth < len(queue):
+                    ranked.append(queue[depth])
+            depth += 1
+        return ranked
+
+    def dedupe(self, texts: List[str]) -> List[str]:
+        """앞선 텍스트와 거의 같은 텍스트를 제외합니다."""
+        kept = []
+        kept_shingles = []
+        for text in texts:
+            text_shingles = self.shingles(text)
+            if any(
+                self.jaccard(text_shingles, other) >= self.dedup_threshold
+                for other in kept_shingles
+            ):
+                PROMPT_PACKING_ITEMS.labels(result="duplicate").inc()
+                continue
+            kept.append(text)
+            kept_shingles.append(text_shingles)
+        return kept
+
+    def prepare_articles(self, articles: List[NewsArticleDTO]) -> List[str]:
+        """요약이 있는 기사를 우선순위대로 정렬하고 중복을 제거한 요약 목록을 반환합니다."""
+        ranked = self.rank_articles(
+            [article for article in articles if article.summary is not None]
+        )
+        return self.dedupe([article.summary for article in ranked])
+
+    def pack(self, texts: List[str]) -> List[List[str]]:
+        """텍스트를 순서대로 토큰 예산 이내의 묶음으로 나눕니다.
+
+        예산보다 큰 텍스트는 단독 묶음이 되며, max_batches를 넘는 텍스트는 제외합니다.
+
+        Args:
+            texts (List[str]): 우선순위 순으로 정렬된 텍스트 목록
+
+        Returns:
+            List[List[str]]: 묶음 목록 (예산 이내면 한 개)
+        """
+        batches = [[]]
+        used = 0
+        for index, text in enumerate(texts):
+            # 프롬프트에서 줄바꿈으로 이어 붙이므로 1토큰을 더함
+            tokens = self.count_tokens(text) + 1
+            if batches[-1] and used + tokens > self.token_budget:
+                if len(batches) == self.max_batches:
+                    dropped = len(texts) - index
+                    PROMPT_PACKING_ITEMS.labels(result="over_budget").inc(dropped)
+                    logger.warning(
+                        f"입력 토큰 예산 초과로 요약 {dropped}개를 제외합니다."
+                    )
+                    break
+                batches.append([])
+                used = 0
+            batches[-1].append(text)
+            used += tokens
+            PROMPT_PACKING_ITEMS.labels(result="kept").inc()
+        return batches
@@ -0,0 +1,52 @@
+import asyncio
+import time
+
+
+class RateLimiter:
+    """분당 요청 수(RPM)와 분당 토큰 수(TPM)를 함께 제한하는 토큰 버킷입니다.
+
+    버킷은 1분 동안 한도만큼 일정하게 채워지며, 두 버킷 모두 여유가 있을 때만
+    요청을 보냅니다. 한 번에 한 요청씩 순서대로 기다리므로 먼저 온 요청이 먼저 나갑니다.
+    """
+
+    def __init__(self, requests_per_minute: int, tokens_per_minute: int):
+        self.request_capacity = float(requests_per_minute)
+        self.token_capacity = float(tokens_per_minute)
+        self.request_rate = requests_per_minute / 60.0
+        self.token_rate = tokens_per_minute / 60.0
+        self.available_requests = self.request_capacity
+        self.available_tokens = self.token_capacity
+        self.updated_at = time.monotonic()
+        self.lock = asyncio.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        elapsed = now - self.updated_at
+        self.updated_at = now
+        self.available_requests = min(
+            self.request_capacity,
+            self.available_requests + elapsed * self.request_rate,
+        )
+        self.available_tokens = min(
+            self.token_capacity, self.available_tokens + elapsed * self.token_rate
+        )
+
+    async def acquire(self, tokens: int):
+        """요청 1건과 토큰을 사용할 수 있을 때까지 기다립니다.
+
+        Args:
+            tokens (int): 요청에 사용할 예상 토큰 수 (TPM 한도를 넘으면 한도로 계산)
+        """
+        tokens = min(float(tokens), self.token_capacity)
+        async with self.lock:
+            while True:
+                self._refill()
+                if self.available_requests >= 1 and self.available_tokens >= tokens:
+                    self.available_requests -= 1
+                    self.available_tokens -= tokens
+                    return
+                wait = max(
+                    (1 - self.available_requests) / self.request_rate,
+                    (tokens - self.available_tokens) / self.token_rate,
+                )
+                await asyncio.sleep(wait)
@@ -0,0 +1,172 @@
+import asyncio
+import json
+import os
+import threading
+import time
+import tracemalloc
+from typing import Tuple
+import pytest
+from aiohttp import web
+
+# app.config.settings는 import 시점에 필수 환경 변수를 검증하므로 테스트용 값을 먼저 채움
+TEST_SETTINGS = {
+    "EUREKA_URL": "http://localhost:8761/eureka",
+    "APP_NAME": "news-service-test",
+    "INSTANCE_HOST": "localhost",
+    "INSTANCE_PORT": "8000",
+    "OPENAI_API_KEY": "test",
+    "DATABASE_HOST": "localhost",
+    "DATABASE_PORT": "3306",
+    "DATABASE_USERNAME": "test",
+    "DATABASE_PASSWORD": "test",
+    "DATABASE_SCHEMA": "test",
+    "REDIS_HOST": "localhost",
+    "REDIS_PORT": "6379",
+    "REDIS_PASSWORD": "",
+    "REDIS_DB": "0",
+}
+
+for name, value in TEST_SETTINGS.items():
+    os.environ.setdefault(name, value)
+
+
+@pytest.fixture
+def http_server():
+    """aiohttp 앱을 별도 스레드의 이벤트 루프에서 실행하고 기본 URL을 돌려주는 함수
+
+    테스트 본문은 asyncio.run이나 동기 클라이언트를 그대로 사용할 수 있습니다.
+    """
+    servers = []
+
+    def start(app: web.Application) -> str:
+        loop = asyncio.new_event_loop()
+        runner = web.AppRunner(app)
+        loop.run_until_complete(runner.setup())
+        loop.run_until_complete(web.TCPSite(runner, "127.0.0.1", 0).start())
+        thread = threading.Thread(target=loop.run_forever, daemon=True)
+        thread.start()
+        servers.append((loop, runner, thread))
+        host, port = runner.addresses[0][:2]
+        return f"http://{host}:{port}"
+
+    yield start
+
+    for loop, runner, thread in servers:
+        asyncio.run_coroutine_threadsafe(runner.cleanup(), loop).result(timeout=5)
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join(timeout=5)
+        loop.close()
+
+
+class FakeOpenAIServer:
+    """OpenAI 호환 /v1/chat/completions를 흉내 내는 테스트 서버
+
+    failures에 넣은 (상태 코드, 헤더)를 요청마다 하나씩 돌려준 뒤 reply로 응답합니다.
+    상태 코드 대신 "disconnect"를 넣으면 응답하지 않고 연결을 끊습니다.
+    stream 요청에는 reply를 stream_chunk_size 글자씩 나눈 SSE로 응답합니다.
+    """
+
+    def __init__(self, reply: str = "1. 요약: 요약했다.", stream_chunk_size: int = 3):
+        self.reply = reply
+        self.stream_chunk_size = stream_chunk_size
+        self.failures = []
+        self.requests = []
+        self.requested_at = []
+        self.base_url = None
+
+    async def chat_completions(self, request: web.Request) -> web.StreamResponse:
+        body = await request.json()
+        self.requests.append(body)
+        self.requested_at.append(time.monotonic())
+
+        if self.failures:
+            status, headers = self.failures.pop(0)
+            if status == "disconnect":
+                request.transport.close()
+                return web.Response()
+            return web.json_response(
+                {"error": {"message": "fake error", "type": "fake", "code": None}},
+                status=status,
+                headers=headers,
+            )
+
+        usage = {"prompt_tokens": 10, "completion_tokens": 5, "total_tokens": 15}
+        if not body.get("stream"):
+            return web.json_response(
+                {
+                    "id": "chatcmpl-fake",
+                    "object": "chat.completion",
+                    "created": 0,
+                    "model": body["model"],
+                    "choices": [
+                        {
+                            "index": 0,
+                            "message": {"role": "assistant", "content": self.reply},
+                            "finish_reason": "stop",
+                        }
+                    ],
+                    "usage": usage,
+                }
+            )
+
+        response = web.StreamResponse(headers={"Content-Type": "text/event-stream"})
+        await response.prepare(request)
+        pieces = [
+            self.reply[i : i + self.stream_chunk_size]
+            for i in range(0, len(self.reply), self.stream_chunk_size)
+        ]
+        chunks = [
+            {"choices": [{"index": 0, "delta": {"content": piece}}]} for piece in pieces
+        ]
+        # stream_options.include_usage를 요청하면 마지막 청크로 사용량을 보냄
+        if (body.get("stream_options") or {}).get("include_usage"):
+            chunks.append({"choices": [], "usage": usage})
+        for chunk in chunks:
+            chunk.update(
+                id="chatcmpl-fake",
+                object="chat.completion.chunk",
+                created=0,
+                model=body["model"],
+            )
+            await response.write(f"data: {json.dumps(chunk)}\n\n".encode("utf-8"))
+        await response.write(b"data: [DONE]\n\n")
+        await response.write_eof()
+        return response
+
+    def app(self) -> web.Application:
+        app = web.Application()
+        app.router.add_post("/v1/chat/completions", self.chat_completions)
+        return app
+
+
+@pytest.fixture
+def fake_openai(http_server) -> FakeOpenAIServer:
+    """OpenAI 클라이언트의 base_url로 사용할 가짜 서버"""
+    server = FakeOpenAIServer()
+    server.base_url = http_server(server.app()) + "/v1"
+    return server
+
+
+@pytest.fixture
+def measure():
+    """함수를 repeat번 실행해 가장 빠른 실행 시간(초)과 최대 메모리 할당량(바이트)을 반환하는 함수
+
+    메모리는 시간 측정과 섞이지 않도록 tracemalloc을 켠 별도 실행으로 잽니다.
+    """
+
+    def run(function, repeat: int = 5) -> Tuple[float, int]:
+        best = float("inf")
+        for _ in range(repeat):
+            started = time.perf_counter()
+            function()
+            best = min(best, time.perf_counter() - started)
+
+        tracemalloc.start()
+        try:
+            function()
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        return best, peak
+
+    return run
@@ -0,0 +1,54 @@
+from datetime import datetime
+from types import SimpleNamespace
+from app.data.article_deduplicator import ArticleDeduplicator
+from app.models.dtos import NewsArticleDTO
+
+BODY = (
+    "한국은행이 기준금리를 연 3.25%로 0.25%포인트 인하했다. "
+    "금융통화위원회는 물가 상승률 둔화와 내수 부진을 고려했다고 밝혔다. "
+) * 3
+
+
+def make_article(url, press, hour, content=BODY, summary=None, keyword="금리"):
+    return NewsArticleDTO(
+        title="한은 기준금리 인하",
+        published_date=datetime(2024, 11, 5, hour),
+        url=url,
+        content=content,
+        keyword=keyword,
+        press=press,
+        summary=summary,
+    )
+
+
+def make_deduplicator():
+    # redis_client가 없으면 서명을 저장하지 않고 매번 계산
+    return ArticleDeduplicator(SimpleNamespace(redis_client=None))
+
+
+def test_keeps_newest_copy_of_near_duplicates():
+    older = make_article("https://a/1", "한국경제", 8)
+    newer = make_article("https://b/1", "매일경제", 10, content=BODY + "추가 문장.")
+    other = make_article("https://c/1", "서울경제", 9, content="환율이 하락했다. " * 20)
+
+    unique = make_deduplicator().dedupe([older, other, newer])
+
+    assert [article.url for article in unique] == ["https://b/1", "https://c/1"]
+
+
+def test_prefers_copy_with_summary():
+    newest = make_article("https://a/1", "한국경제", 10)
+    summarized = make_article("https://b/1", "매일경제", 8, summary="금리를 인하했다.")
+
+    unique = make_deduplicator().dedupe([newest, summarized])
+
+    assert [article.url for article in unique] == ["https://b/1"]
+
+
+def test_distinct_articles_are_kept_in_order():
+    first = make_article("https://a/1", "한국경제", 8)
+    second = make_article(
+        "https://b/1", "매일경제", 9, content="환율이 하락했다. " * 20
+    )
+
+    assert make_deduplicator().dedupe([first, second]) == [first, second]
@@ -0,0 +1,142 @@
+import hashlib
+from contextlib import contextmanager
+from datetime import datetime
+from types import SimpleNamespace
+from app.data.news_data_manager import NewsDataManager
+from app.models.dtos import NewsArticleDTO
+
+PUBLISHED = datetime(2024, 11, 5, 8)
+
+
+class FakeEngine:
+    """SELECT에는 저장된 행을 돌려주고, DELETE·INSERT 호출은 기록하는 엔진"""
+
+    def __init__(self, rows=()):
+        self.rows = [SimpleNamespace(**row) for row in rows]
+        self.statements = []
+
+    @contextmanager
+    def begin(self):
+        yield self
+
+    def exec_driver_sql(self, statement, params):
+        statement = " ".join(statement.split())
+        self.statements.append((statement, params))
+        if statement.startswith("SELECT"):
+            return [row for row in self.rows if row.url in params]
+        return SimpleNamespace(rowcount=0)
+
+    def executed(self, verb):
+        return [
+            (statement, params)
+            for statement, params in self.statements
+            if statement.startswith(verb)
+        ]
+
+
+def make_article(url, content="본문", keyword="금리", press="한국경제", **kwargs):
+    return NewsArticleDTO(
+        title=kwargs.pop("title", "제목"),
+        published_date=kwargs.pop("published_date", PUBLISHED),
+        url=url,
+        content=content,
+        keyword=keyword,
+        press=press,
+        **kwargs,
+    )
+
+
+def stored_row(article, **overrides):
+    row = {
+        "url": article.url,
+        "published_date": article.published_date,
+        "content_hash": NewsDataManager.get_content_hash(article),
+    }
+    row.update(overrides)
+    return row
+
+
+def make_news_data_manager(engine):
+    news_data_manager = NewsDataManager.__new__(NewsDataManager)
+    news_data_manager._engine = engine
+    return news_data_manager
+
+
+def test_content_hash_covers_title_and_content():
+    article = make_article("https://a/1", content="코스피 상승", title="증시")
+
+    assert NewsDataManager.get_content_hash(article) == (
+        hashlib.sha1("증시\n코스피 상승".encode("utf-8")).hexdigest()
+    )
+    assert NewsDataManager.get_content_hash(
+        make_article("https://a/1", content="코스피 하락", title="증시")
+    ) != NewsDataManager.get_content_hash(article)
+
+
+def test_unchanged_articles_are_not_written():
+    article = make_article("https://a/1")
+    engine = FakeEngine([stored_row(article)])
+
+    assert make_news_data_manager(engine).upsert_articles([article]) == {}
+    assert engine.executed("DELETE") == []
+    assert engine.executed("INSERT") == []
+
+
+def test_new_and_changed_articles_are_counted_by_keyword_and_press():
+    unchanged = make_article("https://a/1")
+    changed = make_article("https://a/2", content="정정된 본문")
+    new = make_article("https://b/1", press="매일경제")
+    other_keyword = make_article("https://a/3", keyword="환율")
+    engine = FakeEngine(
+        [stored_row(unchanged), stored_row(changed, content_hash="old")]
+    )
+
+    affected = make_news_data_manager(engine).upsert_articles(
+        [unchanged, changed, new, other_keyword]
+    )
+
+    assert affected == {
+        ("금리", "한국경제"): 1,
+        ("금리", "매일경제"): 1,
+        ("환율", "한국경제"): 1,
+    }
+    ((_, params),) = engine.executed("INSERT")
+    # 행마다 7개 컬럼, 첫 컬럼이 url
+    assert params[::7] == ("https://a/2", "https://b/1", "https://a/3")
+
+
+def test_duplicate_urls_in_batch_keep_last_article():
+    first = make_article("https://a/1", content="첫 본문")
+    last = make_article("https://a/1", content="마지막 본문")
+    engine = FakeEngine()
+
+    affected = make_news_data_manager(engine).upsert_articles([first, last])
+
+    assert affected == {("금리", "한국경제"): 1}
+    ((_, params),) = engine.executed("INSERT")
+    assert params[2] == "마지막 본문"
+    assert params[6] == NewsDataManager.get_content_hash(last)
+
+
+def test_corrected_published_date_deletes_previous_row():
+    article = make_article("https://a/1", published_date=datetime(2024, 11, 5, 9))
+    engine = FakeEngine([stored_row(article, published_date=PUBLISHED)])
+
+    affected = make_news_data_manager(engine).upsert_articles([article])
+
+    # 고유 키에 published_date가 포함되므로 발행 시각이 바뀌면 새 행으로 보고 이전 행을 지움
+    assert affected == {("금리", "한국경제"): 1}
+    ((statement, params),) = engine.executed("DELETE")
+    assert "published_date <> %s" in statement
+    assert params == [("https://a/1", datetime(2024, 11, 5, 9))]
+    assert len(engine.executed("INSERT")) == 1
+
+
+def test_stored_published_date_is_compared_without_microseconds():
+    article = make_article(
+        "https://a/1", published_date=datetime(2024, 11, 5, 8, 0, 0, 123456)
+    )
+    engine = FakeEngine([stored_row(article, published_date=PUBLISHED)])
+
+    # DB에는 초 단위로 저장되므로 마이크로초 차이는 바뀐 기사로 보지 않음
+    assert make_news_data_manager(engine).upsert_articles([article]) == {}
@@ -0,0 +1,78 @@
+"""기사 조회 방식별(커서 스트리밍 / pandas DataFrame) 지연 시간과 메모리 할당 비교
+
+    pytest -m bench -s tests/test_bench_article_retrieval.py
+
+DB 왕복 시간을 빼고 행을 NewsArticleDTO로 바꾸는 비용만 비교하도록 메모리 SQLite를 사용합니다.
+"""
+
+from datetime import datetime, timedelta
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.pool import StaticPool
+from app.data.news_data_manager import NewsDataManager
+
+pytestmark = pytest.mark.bench
+
+ROW_COUNTS = [10, 100, 1000]
+CONTENT = "한국은행이 기준금리를 연 3.25%로 0.25%포인트 인하했다. " * 60
+
+QUERY = """
+    SELECT url, title, content, published_date, press, keyword, summary
+    FROM news_articles
+    ORDER BY published_date DESC
+    LIMIT ?
+"""
+
+
+@pytest.fixture(scope="module")
+def news_data_manager():
+    pytest.importorskip("pandas")
+    engine = create_engine("sqlite://", poolclass=StaticPool)
+    started = datetime(2024, 11, 5, 6, 15)
+    with engine.begin() as conn:
+        conn.exec_driver_sql("""
+            CREATE TABLE news_articles (
+                url TEXT, title TEXT, content TEXT, published_date TEXT,
+                press TEXT, keyword TEXT, summary TEXT
+            )
+            """)
+        conn.exec_driver_sql(
+            "INSERT INTO news_articles VALUES (?, ?, ?, ?, ?, ?, ?)",
+            [
+                (
+                    f"https://www.hankyung.com/article/{i}",
+                    f"기준금리 인하 {i}",
+                    CONTENT,
+                    (started - timedelta(minutes=i)).isoformat(sep=" "),
+                    "한국경제",
+                    "금리",
+                    None,
+                )
+                for i in range(max(ROW_COUNTS))
+            ],
+        )
+
+    # 쿼리 실행에는 engine만 필요하므로 Redis 연결 없이 생성
+    news_data_manager = NewsDataManager.__new__(NewsDataManager)
+    news_data_manager._engine = engine
+    yield news_data_manager
+    engine.dispose()
+
+
+@pytest.mark.parametrize("rows", ROW_COUNTS)
+def test_stream_vs_dataframe(news_data_manager, measure, rows):
+    stream = news_data_manager.fetch_articles_stream(QUERY, (rows,))
+    dataframe = news_data_manager.fetch_articles_dataframe(QUERY, (rows,))
+    assert stream == dataframe and len(stream) == rows
+
+    stream_seconds, stream_peak = measure(
+        lambda: news_data_manager.fetch_articles_stream(QUERY, (rows,))
+    )
+    dataframe_seconds, dataframe_peak = measure(
+        lambda: news_data_manager.fetch_articles_dataframe(QUERY, (rows,))
+    )
+
+    print(
+        f"\n{rows:>5}행  stream {stream_seconds * 1000:8.2f}ms {stream_peak / 1024:9.0f}KiB"
+        f"  | dataframe {dataframe_seconds * 1000:8.2f}ms {dataframe_peak / 1024:9.0f}KiB"
+    )
@@ -0,0 +1,88 @@
+"""ArticleWriter를 통한 기사 저장 처리량 (rows/sec)
+
+    NEWS_TEST_MYSQL_DSN=mysql+pymysql://user:pw@localhost/news_test \\
+        pytest -m bench -s tests/test_bench_article_writer.py
+
+마이그레이션(python -m app.data.migrations)이 적용된 news_articles 테이블이 있는 테스트용 DB를
+지정해야 합니다. 새 기사 저장과, 같은 기사를 다시 수집했을 때(내용이 같아 쓰기를 건너뜀)의
+처리량을 묶음 크기별로 측정하고, 측정에 사용한 행은 지웁니다.
+"""
+
+import asyncio
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+import pytest
+from sqlalchemy import create_engine
+from app.data.news_data_manager import NewsDataManager
+from app.ingest.article_writer import ArticleWriter
+from app.models.dtos import NewsArticleDTO
+
+pytestmark = pytest.mark.bench
+
+MYSQL_DSN = os.environ.get("NEWS_TEST_MYSQL_DSN")
+URL_PREFIX = "https://bench.invalid/article/"
+ROWS = 2000
+CONTENT = "한국은행이 기준금리를 연 3.25%로 0.25%포인트 인하했다. " * 60
+
+
+@pytest.fixture(scope="module")
+def news_data_manager():
+    if MYSQL_DSN is None:
+        pytest.skip("NEWS_TEST_MYSQL_DSN이 설정되지 않음")
+
+    # Redis 없이 DB 저장만 측정 (기사 버전 갱신은 건너뜀)
+    news_data_manager = NewsDataManager.__new__(NewsDataManager)
+    news_data_manager._engine = create_engine(MYSQL_DSN)
+    news_data_manager._redis_client = None
+    now = time.monotonic()
+    news_data_manager._last_connect_attempt = {"engine": now, "redis": now}
+    news_data_manager.db_executor = ThreadPoolExecutor(max_workers=1)
+    yield news_data_manager
+
+    with news_data_manager.engine.begin() as conn:
+        conn.exec_driver_sql(
+            "DELETE FROM news_articles WHERE url LIKE %s", (URL_PREFIX + "%",)
+        )
+    news_data_manager.db_executor.shutdown()
+    news_data_manager.engine.dispose()
+
+
+def make_articles(batch_size: int):
+    published_date = datetime.now().replace(microsecond=0)
+    return [
+        NewsArticleDTO(
+            title=f"기준금리 인하 {i}",
+            published_date=published_date - timedelta(seconds=i),
+            url=f"{URL_PREFIX}{batch_size}/{i}",
+            content=CONTENT,
+            keyword="금리",
+            press="한국경제",
+        )
+        for i in range(ROWS)
+    ]
+
+
+async def write(news_data_manager, articles, batch_size):
+    async with ArticleWriter(
+        news_data_manager, batch_size=batch_size, flush_interval=0.5
+    ) as writer:
+        for article in articles:
+            await writer.put(article)
+    return writer
+
+
+@pytest.mark.parametrize("batch_size", [1, 50, 200])
+def test_writer_throughput(news_data_manager, batch_size):
+    articles = make_articles(batch_size)
+
+    inserted = asyncio.run(write(news_data_manager, articles, batch_size))
+    unchanged = asyncio.run(write(news_data_manager, articles, batch_size))
+
+    assert inserted.affected == ROWS
+    assert unchanged.affected == 0
+    print(
+        f"\nbatch {batch_size:>4}  insert {inserted.rows_per_second:8.1f}rows/s"
+        f"  unchanged {unchanged.rows_per_second:8.1f}rows/s"
+    )
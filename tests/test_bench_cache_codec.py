@@ -0,0 +1,101 @@
+"""캐시 직렬화/압축 방식별 인코딩·디코딩 시간과 Redis 키당 메모리 비교
+
+    pytest -m bench -s tests/test_bench_cache_codec.py
+
+NEWS_TEST_REDIS_URL(예: redis://localhost:6379/15)을 설정하면 MEMORY USAGE로 키당 메모리를,
+없으면 저장되는 값의 크기만 출력합니다. 설치되지 않은 라이브러리의 조합은 건너뜁니다.
+"""
+
+import json
+import os
+from datetime import datetime, timedelta
+import pytest
+from app.core.cache_codec import COMPRESSORS, SERIALIZERS, CacheCodec
+from app.models.dtos import NewsArticleSourceDTO, SummaryItemDTO, SummaryResponseDTO
+
+pytestmark = pytest.mark.bench
+
+REDIS_URL = os.environ.get("NEWS_TEST_REDIS_URL")
+
+RESPONSE = SummaryResponseDTO(
+    summaries=[
+        SummaryItemDTO(
+            title=f"{i}. 기준금리 인하",
+            content="한국은행이 기준금리를 연 3.25%로 0.25%포인트 인하했습니다.",
+        )
+        for i in range(1, 6)
+    ],
+    sources=[
+        NewsArticleSourceDTO(
+            date=datetime(2024, 11, 5, 6, 15) - timedelta(hours=i),
+            title=f"한은, 기준금리 0.25%p 인하 {i}",
+            content="금융통화위원회는 물가 상승률 둔화와 내수 부진을 고려했다. " * 40,
+            url=f"https://www.hankyung.com/article/{i}",
+            press="한국경제",
+        )
+        for i in range(12)
+    ],
+)
+
+
+@pytest.fixture(scope="module")
+def redis_client():
+    if REDIS_URL is None:
+        yield None
+        return
+    from redis import Redis
+
+    client = Redis.from_url(REDIS_URL)
+    yield client
+    client.delete("bench:cache-codec")
+    client.close()
+
+
+def memory_usage(redis_client, value: bytes) -> str:
+    if redis_client is None:
+        return "-"
+    redis_client.set("bench:cache-codec", value)
+    return f"{redis_client.memory_usage('bench:cache-codec', samples=0)}B"
+
+
+def test_legacy_json(measure, redis_client):
+    """코덱 도입 전 방식: json.dumps 후 조회 시 전체 검증"""
+    value = json.dumps(RESPONSE.model_dump(mode="json"), ensure_ascii=False)
+    assert SummaryResponseDTO(**json.loads(value)) == RESPONSE
+
+    encode_seconds, _ = measure(
+        lambda: json.dumps(RESPONSE.model_dump(mode="json"), ensure_ascii=False), 50
+    )
+    decode_seconds, _ = measure(lambda: SummaryResponseDTO(**json.loads(value)), 50)
+
+    size = len(value.encode("utf-8"))
+    print(
+        f"\n{'legacy json':<16} encode {encode_seconds * 1e6:8.1f}us"
+        f"  decode {decode_seconds * 1e6:8.1f}us"
+        f"  value {size:7d}B  redis {memory_usage(redis_client, value)}"
+    )
+
+
+@pytest.mark.parametrize("compression", list(COMPRESSORS))
+@pytest.mark.parametrize("serializer", list(SERIALIZERS))
+def test_codec(measure, redis_client, serializer, compression):
+    try:
+        codec = CacheCodec(serializer, compression, compression_min_bytes=0)
+    except ImportError as e:
+        pytest.skip(f"{serializer}/{compression} 미설치: {e.name}")
+
+    value = codec.encode(RESPONSE.model_dump(mode="json"))
+    assert SummaryResponseDTO.model_validate(codec.decode(value)) == RESPONSE
+
+    encode_seconds, _ = measure(
+        lambda: codec.encode(RESPONSE.model_dump(mode="json")), 50
+    )
+    decode_seconds, _ = measure(
+        lambda: SummaryResponseDTO.model_validate(codec.decode(value)), 50
+    )
+
+    print(
+        f"\n{serializer + '/' + compression:<16} encode {encode_seconds * 1e6:8.1f}us"
+        f"  decode {decode_seconds * 1e6:8.1f}us"
+        f"  value {len(value):7d}B  redis {memory_usage(redis_client, value)}"
+    )
@@ -0,0 +1,92 @@
+"""언론사별 기사 본문 추출 처리량 (파서 백엔드별)
+
+    pytest -m bench -s tests/test_bench_selector_extraction.py
+
+resources/news_site_structures.json의 선택자에 맞춘 기사 페이지를 만들어, 메뉴·스크립트 등
+본문 밖 요소가 많은 실제 페이지와 비슷한 크기로 추출합니다. 설치되지 않은 백엔드는 건너뜁니다.
+"""
+
+import time
+import pytest
+from app.ingest.selector_registry import BACKENDS, SelectorRegistry
+
+pytestmark = pytest.mark.bench
+
+# (언론사, 기사 URL, 본문 요소)
+PAGES = [
+    (
+        "한국경제",
+        "https://www.hankyung.com/article/2024110512345",
+        '<div id="articletxt">',
+    ),
+    (
+        "서울경제",
+        "https://www.sedaily.com/NewsView/2DGKXXXXXX",
+        '<div class="article_view">',
+    ),
+    (
+        "서울경제",
+        "https://m.sedaily.com/NewsView/2DGKXXXXXX",
+        '<div class="article">',
+    ),
+    (
+        "서울경제",
+        "https://m.sedaily.com/NewsViewAmp/2DGKXXXXXX",
+        '<div class="view_con first_view_con">',
+    ),
+    (
+        "매일경제",
+        "https://www.mk.co.kr/news/economy/11161234",
+        '<div class="news_cnt_detail_wrap">',
+    ),
+    (
+        "매일경제",
+        "https://stock.mk.co.kr/news/view/123456",
+        '<div class="news_detail_wrap">',
+    ),
+]
+
+PARAGRAPH = "<p>한국은행이 기준금리를 연 3.25%로 0.25%포인트 인하했다. 금융통화위원회는 물가 상승률 둔화와 내수 부진을 고려했다.</p>"
+NAVIGATION = "".join(
+    f'<li><a href="/section/{i}">섹션 {i}</a></li>' for i in range(300)
+)
+SCRIPT = (
+    "<script>var tracking = {"
+    + ",".join(f"k{i}: {i}" for i in range(500))
+    + "};</script>"
+)
+
+
+def build_page(body_tag: str) -> str:
+    return (
+        '<html><head><meta property="og:title" content="한은, 기준금리 인하">'
+        f"{SCRIPT}</head><body><ul>{NAVIGATION}</ul>"
+        f"{body_tag}{PARAGRAPH * 20}<figure>사진</figure>{SCRIPT}</div>"
+        f"<ul>{NAVIGATION}</ul></body></html>"
+    )
+
+
+@pytest.mark.parametrize("backend", list(BACKENDS))
+def test_extraction_throughput(backend):
+    try:
+        registry = SelectorRegistry(backend=backend)
+    except ImportError as e:
+        pytest.skip(f"{backend} 미설치: {e.name}")
+
+    repeat = 50
+    print()
+    for press, url, body_tag in PAGES:
+        html = build_page(body_tag)
+        assert registry.resolve(url)[0] == press
+        content, title = registry.extract(url, html)
+        assert content.count("기준금리") == 20 and title == "한은, 기준금리 인하"
+
+        started = time.perf_counter()
+        for _ in range(repeat):
+            registry.extract(url, html)
+        elapsed = time.perf_counter() - started
+
+        print(
+            f"{backend:<10} {press} {url.split('//')[1][:28]:<28}"
+            f" {repeat / elapsed:8.1f}건/초 ({len(html) / 1024:.0f}KiB)"
+        )
@@ -0,0 +1,96 @@
+import json
+import sys
+import pytest
+from app.core.cache_codec import FORMAT_VERSION, MAGIC, CacheCodec
+
+SUMMARY = {
+    "summaries": [{"title": "1. 코스피", "content": "코스피가 1% 상승했다."}],
+    "sources": [
+        {
+            "date": "2024-11-01T06:15:00",
+            "title": "코스피 상승",
+            "content": "본문 " * 100,
+            "url": "https://www.hankyung.com/article/1",
+            "press": "한국경제",
+        }
+    ],
+}
+
+
+@pytest.mark.parametrize("compression", ["none", "zlib"])
+def test_round_trip(compression):
+    codec = CacheCodec("json", compression, compression_min_bytes=0)
+
+    encoded = codec.encode(SUMMARY)
+
+    assert encoded.startswith(MAGIC)
+    assert encoded[1] == FORMAT_VERSION
+    assert not codec.is_legacy(encoded)
+    assert codec.decode(encoded) == SUMMARY
+
+
+def test_small_values_are_not_compressed():
+    codec = CacheCodec("json", "zlib", compression_min_bytes=1_000_000)
+
+    encoded = codec.encode(SUMMARY)
+
+    assert encoded[3] == 0
+    assert codec.decode(encoded) == SUMMARY
+
+
+def test_reads_values_written_with_other_settings():
+    compressed = CacheCodec("json", "zlib", compression_min_bytes=0).encode(SUMMARY)
+
+    assert CacheCodec("json", "none", 0).decode(compressed) == SUMMARY
+
+
+@pytest.mark.parametrize(
+    "legacy",
+    [
+        json.dumps(SUMMARY, ensure_ascii=False),
+        json.dumps(SUMMARY, ensure_ascii=False).encode("utf-8"),
+    ],
+)
+def test_legacy_json_fallback(legacy):
+    codec = CacheCodec("json", "zlib", compression_min_bytes=0)
+
+    assert codec.is_legacy(legacy)
+    assert codec.decode(legacy) == SUMMARY
+
+
+def test_unknown_format_version_is_rejected():
+    codec = CacheCodec("json", "none", 0)
+    encoded = codec.encode(SUMMARY)
+
+    with pytest.raises(ValueError):
+        codec.decode(MAGIC + bytes((FORMAT_VERSION + 1,)) + encoded[2:])
+
+
+def test_unknown_codec_id_is_rejected():
+    codec = CacheCodec("json", "none", 0)
+
+    with pytest.raises(ValueError):
+        codec.decode(MAGIC + bytes((FORMAT_VERSION, 99, 0)) + b"{}")
+
+
+def test_unsupported_settings_are_rejected():
+    with pytest.raises(ValueError):
+        CacheCodec("pickle", "none", 0)
+    with pytest.raises(ValueError):
+        CacheCodec("json", "lz4", 0)
+
+
+@pytest.mark.parametrize(
+    "serializer, compression, module",
+    [("msgpack", "none", "msgpack"), ("json", "zstd", "zstandard")],
+)
+def test_missing_optional_package_fails_with_clear_error(
+    monkeypatch, serializer, compression, module
+):
+    # sys.modules에 None을 넣으면 import 시 ImportError 발생
+    monkeypatch.setitem(sys.modules, module, None)
+
+    with pytest.raises(ImportError, match="requirements-optional.txt") as error:
+        CacheCodec(serializer, compression, 0)
+
+    assert error.value.name == module
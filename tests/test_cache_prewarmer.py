@@ -0,0 +1,51 @@
+import asyncio
+from types import SimpleNamespace
+import fakeredis
+from app.config.settings import settings
+from app.services.cache_prewarmer import CachePrewarmer
+
+
+class FakeNewsService:
+    def __init__(self, redis_client):
+        self.news_data_manager = SimpleNamespace(redis_client=redis_client)
+        self.calls = []
+
+    async def summarized_news(self, request, record_metrics=True):
+        self.calls.append((request, record_metrics))
+
+
+def test_build_requests_includes_combined_keyword_for_one_day_only():
+    requests = CachePrewarmer(FakeNewsService(None)).build_requests()
+
+    combined = [request for request in requests if request.keyword == "종합"]
+    press_count = len(CachePrewarmer.press_combinations())
+    assert len(combined) == press_count
+    assert {request.period for request in combined} == {1}
+    assert len(requests) == press_count * (
+        len(settings.NEWS_KEYWORD) * len(settings.ARTICLES_PER_DAY_MATRIX) + 1
+    )
+
+
+def test_prewarm_runs_once_per_target_date_without_recording_metrics():
+    server = fakeredis.FakeServer()
+    leader = FakeNewsService(fakeredis.FakeRedis(server=server))
+    follower = FakeNewsService(fakeredis.FakeRedis(server=server))
+
+    async def run():
+        return (
+            await CachePrewarmer(leader).prewarm(),
+            await CachePrewarmer(follower).prewarm(),
+        )
+
+    warmed, skipped = asyncio.run(run())
+
+    assert warmed == len(leader.calls) > 0
+    assert skipped == 0 and follower.calls == []
+    assert all(record_metrics is False for _, record_metrics in leader.calls)
+
+
+def test_prewarm_is_skipped_without_redis():
+    news_service = FakeNewsService(None)
+
+    assert asyncio.run(CachePrewarmer(news_service).prewarm()) == 0
+    assert news_service.calls == []
@@ -0,0 +1,111 @@
+import asyncio
+import time
+import pytest
+from aiohttp import web
+from app.core.exceptions import CrawlingError
+from app.ingest.fetcher import DomainThrottle, Fetcher
+
+
+class PageServer:
+    """요청 시각과 동시 처리 수를 기록하는 테스트 서버"""
+
+    def __init__(self, latency: float = 0.0):
+        self.latency = latency
+        self.requested_at = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def page(self, request: web.Request) -> web.Response:
+        self.requested_at.append(time.monotonic())
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.latency)
+        finally:
+            self.in_flight -= 1
+        return web.Response(text=f"page {request.match_info['id']}")
+
+    async def missing(self, request: web.Request) -> web.Response:
+        return web.Response(status=404)
+
+    def app(self) -> web.Application:
+        app = web.Application()
+        app.router.add_get("/page/{id}", self.page)
+        app.router.add_get("/missing", self.missing)
+        return app
+
+
+async def fetch_all(fetcher_factory, urls):
+    async with fetcher_factory() as fetcher:
+        return await asyncio.gather(*(fetcher.fetch_text(url) for url in urls))
+
+
+def test_fetch_text_and_bytes(http_server):
+    base_url = http_server(PageServer().app())
+
+    async def run():
+        async with Fetcher(concurrency=2, delay=0) as fetcher:
+            return (
+                await fetcher.fetch_text(f"{base_url}/page/1"),
+                await fetcher.fetch_bytes(f"{base_url}/page/2"),
+            )
+
+    assert asyncio.run(run()) == ("page 1", b"page 2")
+
+
+def test_non_200_response_raises_crawling_error(http_server):
+    base_url = http_server(PageServer().app())
+
+    with pytest.raises(CrawlingError) as error:
+        asyncio.run(fetch_all(lambda: Fetcher(delay=0), [f"{base_url}/missing"]))
+
+    assert error.value.details == {"url": f"{base_url}/missing", "status": 404}
+
+
+def test_connection_error_raises_crawling_error(http_server):
+    base_url = http_server(PageServer().app())
+    # 서버를 띄운 포트가 아닌 닫힌 포트
+    closed_url = base_url.rsplit(":", 1)[0] + ":1/page/1"
+
+    with pytest.raises(CrawlingError):
+        asyncio.run(fetch_all(lambda: Fetcher(delay=0), [closed_url]))
+
+
+def test_requests_to_same_domain_are_spaced_by_delay(http_server):
+    server = PageServer()
+    base_url = http_server(server.app())
+    urls = [f"{base_url}/page/{i}" for i in range(3)]
+
+    pages = asyncio.run(fetch_all(lambda: Fetcher(concurrency=3, delay=0.1), urls))
+
+    assert pages == ["page 0", "page 1", "page 2"]
+    gaps = [b - a for a, b in zip(server.requested_at, server.requested_at[1:])]
+    assert all(gap >= 0.09 for gap in gaps)
+
+
+def test_concurrent_requests_per_domain_are_limited(http_server):
+    server = PageServer(latency=0.05)
+    base_url = http_server(server.app())
+    urls = [f"{base_url}/page/{i}" for i in range(6)]
+
+    asyncio.run(fetch_all(lambda: Fetcher(concurrency=1, delay=0), urls))
+
+    assert server.max_in_flight == 1
+
+
+def test_throttle_is_per_domain():
+    throttle = DomainThrottle(concurrency=1, delay=0.2)
+
+    async def run():
+        await throttle.wait("www.hankyung.com")
+        started = time.monotonic()
+        await throttle.wait("www.mk.co.kr")
+        other_domain = time.monotonic() - started
+        await throttle.wait("www.hankyung.com")
+        same_domain = time.monotonic() - started
+        return other_domain, same_domain
+
+    other_domain, same_domain = asyncio.run(run())
+
+    assert other_domain < 0.1
+    assert same_domain >= 0.15
@@ -0,0 +1,136 @@
+import asyncio
+import json
+from datetime import datetime
+import pytest
+from app.config.settings import settings
+from app.models.dtos import NewsArticleSourceDTO
+from app.services.headline_cache import HeadlineCache
+
+
+class FakeNewsService:
+    """호출마다 제목에 순번이 붙은 헤드라인을 돌려주며, gate가 열릴 때까지 응답을 미룸"""
+
+    def __init__(self):
+        self.calls = 0
+        self.gate = asyncio.Event()
+        self.gate.set()
+        self.fail = False
+
+    async def headline_news(self):
+        self.calls += 1
+        call = self.calls
+        await self.gate.wait()
+        if self.fail:
+            raise RuntimeError("db down")
+        return [
+            NewsArticleSourceDTO(
+                date=datetime(2024, 11, 5, 6, 15),
+                title=f"헤드라인 {call}",
+                content="본문",
+                url="https://www.hankyung.com/article/1",
+                press="한국경제",
+            )
+        ]
+
+
+def headline_title(rendered):
+    return json.loads(rendered.body)["result"]["sources"][0]["title"]
+
+
+async def settle():
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+@pytest.fixture(autouse=True)
+def slow_periodic_refresh(monkeypatch):
+    # 테스트 중에는 주기적 갱신이 다시 실행되지 않도록 함
+    monkeypatch.setattr(settings, "HEADLINE_REFRESH_SECONDS", 3600)
+
+
+def test_get_builds_once_and_reuses_fresh_body():
+    news_service = FakeNewsService()
+    headline_cache = HeadlineCache(news_service)
+
+    async def run():
+        first = await headline_cache.get()
+        second = await headline_cache.get()
+        return first, second
+
+    first, second = asyncio.run(run())
+
+    assert second is first
+    assert headline_title(first) == "헤드라인 1"
+    assert news_service.calls == 1
+
+
+def test_invalidate_serves_previous_body_until_refresh_finishes():
+    news_service = FakeNewsService()
+    headline_cache = HeadlineCache(news_service)
+
+    async def run():
+        headline_cache.start()
+        await settle()
+        before = headline_title(await headline_cache.get())
+
+        news_service.gate.clear()
+        headline_cache.invalidate()
+        await settle()
+        # 새 헤드라인을 만드는 동안에는 요청을 기다리게 하지 않고 이전 헤드라인 제공
+        during = headline_title(await headline_cache.get())
+
+        news_service.gate.set()
+        await settle()
+        after = headline_title(await headline_cache.get())
+        await headline_cache.stop()
+        return before, during, after
+
+    assert asyncio.run(run()) == ("헤드라인 1", "헤드라인 1", "헤드라인 2")
+    assert news_service.calls == 2
+
+
+def test_invalidate_during_refresh_refreshes_again():
+    news_service = FakeNewsService()
+    headline_cache = HeadlineCache(news_service)
+
+    async def run():
+        headline_cache.start()
+        await settle()
+        news_service.gate.clear()
+        headline_cache.invalidate()
+        await settle()
+        # 갱신 중에 들어온 무효화는 진행 중인 갱신이 끝난 뒤 한 번 더 반영
+        headline_cache.invalidate()
+        await settle()
+        news_service.gate.set()
+        await settle()
+        title = headline_title(await headline_cache.get())
+        await headline_cache.stop()
+        return title
+
+    assert asyncio.run(run()) == "헤드라인 3"
+    assert news_service.calls == 3
+
+
+def test_refresh_failure_serves_previous_body():
+    news_service = FakeNewsService()
+    headline_cache = HeadlineCache(news_service)
+
+    async def run():
+        first = await headline_cache.get()
+        headline_cache.stale = True
+        news_service.fail = True
+        return first, await headline_cache.get()
+
+    first, second = asyncio.run(run())
+
+    assert second is first
+    assert news_service.calls == 2
+
+
+def test_refresh_failure_without_previous_body_raises():
+    news_service = FakeNewsService()
+    news_service.fail = True
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(HeadlineCache(news_service).get())
@@ -0,0 +1,152 @@
+import asyncio
+import json
+from datetime import datetime
+from types import SimpleNamespace
+import pytest
+from aiohttp import web
+from app.config.settings import settings
+from app.ingest.fetcher import Fetcher
+from app.ingest.selector_registry import SelectorRegistry
+from app.models.dtos import FeedEntryDTO
+
+pytest.importorskip("feedparser")
+
+from app.ingest.pipeline import IngestPipeline  # noqa: E402
+
+RSS = """<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0"><channel><title>{keyword}</title>
+<item>
+  <title>코스피 상승 마감 - 한국경제</title>
+  <link>{base_url}/article/1</link>
+  <pubDate>Mon, 04 Nov 2024 22:30:00 GMT</pubDate>
+</item>
+<item>
+  <title>링크 없는 기사 - 한국경제</title>
+  <pubDate>Mon, 04 Nov 2024 23:00:00 GMT</pubDate>
+</item>
+</channel></rss>"""
+
+ARTICLE = """<html><head>
+<meta property="og:title" content="코스피, 외국인 순매수에 상승">
+</head><body>
+<div id="articletxt">코스피가 1% 상승했다.<script>track()</script>
+<figure>사진 설명</figure><p>외국인이 순매수했다.</p></div>
+</body></html>"""
+
+
+class NewsSiteServer:
+    """Google News RSS와 언론사 기사 페이지를 흉내 내는 테스트 서버"""
+
+    def __init__(self):
+        self.base_url = None
+
+    async def rss(self, request: web.Request) -> web.Response:
+        # 실패하도록 지정한 언론사의 피드는 500 응답
+        if request.query["site"] == "fail.example":
+            return web.Response(status=500)
+        return web.Response(
+            text=RSS.format(keyword=request.query["q"], base_url=self.base_url),
+            content_type="application/rss+xml",
+        )
+
+    async def article(self, request: web.Request) -> web.Response:
+        if request.match_info["id"] == "empty":
+            return web.Response(text="<html><body>본문 없음</body></html>")
+        return web.Response(text=ARTICLE, content_type="text/html")
+
+    def app(self) -> web.Application:
+        app = web.Application()
+        app.router.add_get("/rss", self.rss)
+        app.router.add_get("/article/{id}", self.article)
+        return app
+
+
+class FakeWriter:
+    def __init__(self):
+        self.articles = []
+
+    async def put(self, article):
+        self.articles.append(article)
+
+
+@pytest.fixture
+def news_site(http_server, tmp_path, monkeypatch):
+    server = NewsSiteServer()
+    server.base_url = http_server(server.app())
+    monkeypatch.setattr(
+        settings,
+        "INGEST_RSS_URL_TEMPLATE",
+        server.base_url + "/rss?q={keyword}&site={domain}",
+    )
+
+    structures = {
+        "한국경제": {"domain": "127.0.0.1", "selectors": "#articletxt"},
+        "매일경제": {"domain": "fail.example", "selectors": "div.news"},
+    }
+    path = tmp_path / "news_site_structures.json"
+    path.write_text(json.dumps(structures, ensure_ascii=False), encoding="utf-8")
+
+    pipeline = IngestPipeline(
+        SimpleNamespace(redis_client=None), SelectorRegistry(path, backend="auto")
+    )
+    return server.base_url, pipeline
+
+
+def make_entry(url):
+    return FeedEntryDTO(
+        url=url,
+        title="RSS 제목",
+        published_date=datetime(2024, 11, 5, 7, 30),
+        keyword="경제",
+        press="한국경제",
+    )
+
+
+def test_discover_parses_rss_and_skips_failed_feeds(news_site):
+    base_url, pipeline = news_site
+
+    async def run():
+        async with Fetcher(concurrency=2, delay=0) as fetcher:
+            return await pipeline.discover(fetcher, ["경제"])
+
+    entries = asyncio.run(run())
+
+    # 링크가 없는 항목과 500 응답을 준 매일경제 피드는 제외
+    assert entries == [
+        FeedEntryDTO(
+            url=f"{base_url}/article/1",
+            title="코스피 상승 마감",
+            published_date=datetime(2024, 11, 5, 7, 30),
+            keyword="경제",
+            press="한국경제",
+        )
+    ]
+
+
+def test_fetch_articles_extracts_body_and_skips_crawling_errors(news_site):
+    base_url, pipeline = news_site
+    writer = FakeWriter()
+    entries = [
+        make_entry(f"{base_url}/article/1"),
+        make_entry(f"{base_url}/missing"),
+        make_entry(f"{base_url}/article/empty"),
+        # 선택자 정의에 없는 호스트
+        make_entry(base_url.replace("127.0.0.1", "localhost") + "/article/1"),
+    ]
+
+    async def run():
+        async with Fetcher(concurrency=2, delay=0) as fetcher:
+            return await pipeline.fetch_articles(fetcher, writer, entries)
+
+    articles = asyncio.run(run())
+
+    assert writer.articles == articles
+    assert len(articles) == 1
+    article = articles[0]
+    assert article.url == f"{base_url}/article/1"
+    assert article.title == "코스피, 외국인 순매수에 상승"
+    # script, figure는 제외 (빈 줄 처리는 파서마다 다름)
+    assert (
+        article.content.split() == "코스피가 1% 상승했다. 외국인이 순매수했다.".split()
+    )
+    assert (article.keyword, article.press) == ("경제", "한국경제")
@@ -0,0 +1,101 @@
+from datetime import datetime
+from types import SimpleNamespace
+import pytest
+from app.core import local_cache
+from app.core.local_cache import LocalCache
+from app.data.news_data_manager import RESPONSE_KEY_PREFIX, NewsDataManager
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(local_cache, "time", SimpleNamespace(monotonic=clock.monotonic))
+    return clock
+
+
+def test_entry_expires_after_ttl(clock):
+    cache = LocalCache(max_size=10, ttl=30)
+    cache.set("key", "value")
+
+    clock.now += 29
+    assert cache.get("key") == "value"
+    clock.now += 2
+    assert cache.get("key") is None
+    assert cache.stats() == {"hits": 1, "misses": 1, "size": 0}
+
+
+def test_least_recently_used_entry_is_evicted(clock):
+    cache = LocalCache(max_size=2, ttl=30)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    # 조회한 항목은 가장 최근에 사용한 것으로 이동
+    assert cache.get("a") == 1
+
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert (cache.get("a"), cache.get("c")) == (1, 3)
+
+
+def test_set_refreshes_ttl_and_recency(clock):
+    cache = LocalCache(max_size=2, ttl=30)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    clock.now += 20
+    cache.set("a", 10)
+    cache.set("c", 3)
+
+    clock.now += 20
+    assert cache.get("a") == 10
+    assert cache.get("b") is None
+
+
+def test_delete_and_delete_if(clock):
+    cache = LocalCache(max_size=10, ttl=30)
+    for key in ("news:summary:1", "news:summary:2", "news:response:1"):
+        cache.set(key, key)
+
+    cache.delete("news:summary:1")
+    assert cache.delete_if(lambda key: key.endswith(":1")) == 1
+    assert cache.stats()["size"] == 1
+    assert cache.get("news:summary:2") == "news:summary:2"
+
+
+def make_news_data_manager(target_date):
+    news_data_manager = NewsDataManager.__new__(NewsDataManager)
+    news_data_manager.local_cache = LocalCache(max_size=10, ttl=60)
+    news_data_manager.local_cache_date = None
+    news_data_manager.get_target_date = lambda: target_date
+    return news_data_manager
+
+
+def test_date_rollover_drops_previous_day_entries():
+    news_data_manager = make_news_data_manager(datetime(2024, 11, 4, 6, 15))
+    yesterday_keys = [
+        news_data_manager.get_cache_key("금리", ["hk"], 1),
+        news_data_manager.get_cache_key(
+            "금리", ["hk"], 1, prefix=RESPONSE_KEY_PREFIX, version=3
+        ),
+    ]
+    for key in yesterday_keys:
+        news_data_manager.local_cache.set(key, "yesterday")
+    news_data_manager.sync_local_cache_date()
+    assert news_data_manager.local_cache.stats()["size"] == 2
+
+    # 06:15 기준 시각이 다음 날로 바뀜
+    news_data_manager.get_target_date = lambda: datetime(2024, 11, 5, 6, 15)
+    today_key = news_data_manager.get_cache_key("금리", ["hk"], 1)
+    news_data_manager.local_cache.set(today_key, "today")
+    news_data_manager.sync_local_cache_date()
+
+    assert news_data_manager.local_cache_date == "20241105"
+    assert all(news_data_manager.local_cache.get(key) is None for key in yesterday_keys)
+    assert news_data_manager.local_cache.get(today_key) == "today"
@@ -0,0 +1,126 @@
+from contextlib import contextmanager
+from datetime import date
+from app.data.partitions import (
+    build_partition_definition,
+    get_partition_name,
+    maintain_partitions,
+    parse_partition_name,
+    plan_partition_changes,
+)
+
+TODAY = date(2024, 11, 5)
+
+
+class FakeResult(list):
+    pass
+
+
+class FakeConnection:
+    def __init__(self, partitions, statements):
+        self.partitions = partitions
+        self.statements = statements
+
+    def exec_driver_sql(self, statement, params=None):
+        if "information_schema.PARTITIONS" in statement:
+            return FakeResult((name,) for name in self.partitions)
+        self.statements.append(" ".join(statement.split()))
+        return FakeResult()
+
+
+class FakeEngine:
+    """파티션 조회 결과를 돌려주고 실행된 ALTER 문을 기록하는 엔진"""
+
+    def __init__(self, partitions):
+        self.partitions = partitions
+        self.statements = []
+
+    @contextmanager
+    def connect(self):
+        yield FakeConnection(self.partitions, self.statements)
+
+    begin = connect
+
+
+def test_partition_name_round_trip():
+    assert get_partition_name(date(2024, 1, 9)) == "p20240109"
+    assert parse_partition_name("p20240109") == date(2024, 1, 9)
+    assert parse_partition_name("pmax") is None
+    assert parse_partition_name("p_legacy") is None
+
+
+def test_partition_upper_bound_is_next_day():
+    assert build_partition_definition(date(2024, 12, 31)) == (
+        "PARTITION p20241231 VALUES LESS THAN (TO_DAYS('2025-01-01'))"
+    )
+
+
+def test_plan_precreates_days_after_today():
+    partitions = ["p20241104", "p20241105", "pmax"]
+
+    new_days, expired = plan_partition_changes(partitions, TODAY, 8, 2)
+
+    assert new_days == [date(2024, 11, 6), date(2024, 11, 7)]
+    assert expired == []
+
+
+def test_plan_fills_missed_days():
+    partitions = ["p20241101", "pmax"]
+
+    new_days, _ = plan_partition_changes(partitions, TODAY, 8, 1)
+
+    assert new_days == [date(2024, 11, d) for d in range(2, 7)]
+
+
+def test_plan_keeps_partition_on_retention_boundary():
+    partitions = [
+        "p20241027",
+        "p20241028",
+        "p20241029",
+        "p20241105",
+        "p20241106",
+        "pmax",
+    ]
+
+    new_days, expired = plan_partition_changes(partitions, TODAY, 8, 1)
+
+    # 오늘 - 8일(10/28)까지 보관하고 그 이전만 삭제
+    assert expired == ["p20241027"]
+    assert new_days == []
+
+
+def test_plan_without_date_partitions_starts_today():
+    new_days, expired = plan_partition_changes(["pmax"], TODAY, 8, 1)
+
+    assert new_days == [date(2024, 11, 5), date(2024, 11, 6)]
+    assert expired == []
+
+
+def test_maintain_partitions_reorganizes_pmax_and_drops_expired():
+    engine = FakeEngine(["p20241026", "p20241027", "p20241105", "pmax"])
+
+    added, expired = maintain_partitions(
+        engine, retention_days=8, precreate_days=1, today=TODAY
+    )
+
+    assert added == ["p20241106"]
+    assert expired == ["p20241026", "p20241027"]
+    assert engine.statements == [
+        "ALTER TABLE news_articles REORGANIZE PARTITION pmax INTO ("
+        "PARTITION p20241106 VALUES LESS THAN (TO_DAYS('2024-11-07')), "
+        "PARTITION pmax VALUES LESS THAN MAXVALUE)",
+        "ALTER TABLE news_articles DROP PARTITION p20241026, p20241027",
+    ]
+
+
+def test_maintain_partitions_is_noop_when_up_to_date():
+    engine = FakeEngine(["p20241105", "p20241106", "pmax"])
+
+    assert maintain_partitions(engine, 8, 1, today=TODAY) == ([], [])
+    assert engine.statements == []
+
+
+def test_maintain_partitions_skips_unpartitioned_table():
+    engine = FakeEngine([])
+
+    assert maintain_partitions(engine, 8, 1, today=TODAY) == ([], [])
+    assert engine.statements == []
@@ -0,0 +1,75 @@
+from datetime import datetime
+from app.models.dtos import NewsArticleDTO
+from app.summary.prompt_packer import PromptPacker, estimate_tokens
+
+
+def make_packer(token_budget=100, max_batches=4):
+    packer = PromptPacker(
+        token_budget=token_budget, max_batches=max_batches, dedup_threshold=0.8
+    )
+    # tiktoken 설치 여부와 관계없이 같은 결과가 나오도록 글자 수를 토큰 수로 사용
+    packer.count_tokens = len
+    return packer
+
+
+def make_article(summary, press="한국경제", hour=8, keyword="금리"):
+    return NewsArticleDTO(
+        title="제목",
+        published_date=datetime(2024, 11, 5, hour),
+        url=f"https://a/{press}/{hour}",
+        content="본문",
+        keyword=keyword,
+        press=press,
+        summary=summary,
+    )
+
+
+def test_estimate_tokens_counts_non_ascii_per_character():
+    assert estimate_tokens("금리") == 2
+    assert estimate_tokens("abcdefgh") == 2
+    assert estimate_tokens("금리 rate") == 2 + 2
+
+
+def test_texts_within_budget_form_one_batch():
+    assert make_packer().pack(["a" * 40, "b" * 40]) == [["a" * 40, "b" * 40]]
+
+
+def test_texts_over_budget_are_split_in_order():
+    texts = ["a" * 60, "b" * 30, "c" * 60, "d" * 10]
+
+    # 줄바꿈 1토큰을 포함해 묶음당 100토큰 이내
+    assert make_packer().pack(texts) == [["a" * 60, "b" * 30], ["c" * 60, "d" * 10]]
+
+
+def test_oversized_text_gets_its_own_batch():
+    assert make_packer().pack(["a" * 150, "b" * 10]) == [["a" * 150], ["b" * 10]]
+
+
+def test_texts_beyond_max_batches_are_dropped():
+    texts = ["a" * 90, "b" * 90, "c" * 90]
+
+    assert make_packer(max_batches=2).pack(texts) == [["a" * 90], ["b" * 90]]
+
+
+def test_near_duplicate_texts_are_dropped():
+    summary = "한국은행이 기준금리를 연 3.25%로 0.25%포인트 인하했다."
+    texts = [summary, summary + " ", "원·달러 환율이 1,380원으로 하락했다."]
+
+    assert make_packer().dedupe(texts) == [texts[0], texts[2]]
+
+
+def test_prepare_articles_interleaves_presses_newest_first_and_dedupes():
+    duplicate = "한국은행이 기준금리를 연 3.25%로 0.25%포인트 인하했다."
+    articles = [
+        make_article("한경 8시 요약: 코스피 상승", hour=8),
+        make_article("한경 10시 요약: 환율 하락", hour=10),
+        make_article(duplicate, press="매일경제", hour=9),
+        make_article(duplicate, press="서울경제", hour=7),
+        make_article(None, press="서울경제", hour=11),
+    ]
+
+    assert make_packer().prepare_articles(articles) == [
+        "한경 10시 요약: 환율 하락",
+        duplicate,
+        "한경 8시 요약: 코스피 상승",
+    ]
@@ -0,0 +1,90 @@
+import os
+from datetime import datetime
+import pytest
+from sqlalchemy import create_engine
+from app.config.settings import settings
+from app.data.migrations import check_query_plans
+from app.data.news_data_manager import PRESS_NAMES, NewsDataManager
+from app.models.dtos import SummaryRequestDTO
+from app.models.enums import PressName
+
+TARGET_DATE = datetime(2024, 11, 5, 6, 15)
+
+# 실제 MySQL에서 실행 계획을 점검할 때만 설정 (예: mysql+pymysql://user:pw@host/db)
+MYSQL_DSN = os.environ.get("NEWS_TEST_MYSQL_DSN")
+
+PRESSES = list(PressName)
+
+CASES = [
+    (period, press_count, is_combined)
+    for period, press_counts in settings.ARTICLES_PER_DAY_MATRIX.items()
+    for press_count in press_counts
+    for is_combined in (False, True)
+]
+
+
+def make_news_data_manager(engine=None):
+    # 쿼리 생성에는 DB/Redis 연결이 필요 없으므로 __init__을 거치지 않고 생성
+    news_data_manager = NewsDataManager.__new__(NewsDataManager)
+    news_data_manager._engine = engine
+    news_data_manager.get_target_date = lambda: TARGET_DATE
+    return news_data_manager
+
+
+def normalize(query):
+    return " ".join(query.split())
+
+
+@pytest.mark.parametrize("period, press_count, is_combined", CASES)
+def test_query_shape(period, press_count, is_combined):
+    request = SummaryRequestDTO(
+        keyword="금리", press=PRESSES[:press_count], period=period
+    )
+
+    query, params, target_date = make_news_data_manager().get_query_and_params(
+        request, is_combined=is_combined
+    )
+    query = normalize(query)
+    ranked, outer = query.split(") SELECT ", 1)
+
+    # WITH 절은 순위 계산에 필요한 좁은 컬럼만 읽음
+    assert "WITH RankedNews AS ( SELECT url, published_date, ROW_NUMBER()" in ranked
+    assert "content" not in ranked and "summary" not in ranked
+    # 모든 기간에 published_date 하한이 있어야 파티션 프루닝이 됨
+    assert "WHERE published_date >= DATE_SUB(%s, INTERVAL %s DAY)" in ranked
+    assert "AND press IN (" + ", ".join(["%s"] * press_count) + ")" in ranked
+    assert outer.startswith("n.url, n.title, n.content,")
+
+    articles_per_press = settings.ARTICLES_PER_DAY_MATRIX[period][press_count]
+    row_limit = 1 if is_combined and period != 7 else articles_per_press
+    assert f"WHERE r.row_num <= {row_limit} " in outer
+
+    press_names = [PRESS_NAMES[press.value] for press in PRESSES[:press_count]]
+    assert params == (TARGET_DATE, period, "금리", *press_names, "금리")
+    assert query.count("%s") == len(params)
+    assert target_date == TARGET_DATE
+
+
+@pytest.mark.parametrize(
+    "period, partition_by",
+    [
+        (1, "PARTITION BY press ORDER"),
+        (3, "PARTITION BY press, DATE(published_date) ORDER"),
+        (7, "PARTITION BY press, DATE(published_date) ORDER"),
+    ],
+)
+def test_query_partition_by(period, partition_by):
+    request = SummaryRequestDTO(keyword="금리", press=PRESSES[:1], period=period)
+
+    query, _, _ = make_news_data_manager().get_query_and_params(request)
+
+    assert partition_by in normalize(query)
+
+
+@pytest.mark.skipif(MYSQL_DSN is None, reason="NEWS_TEST_MYSQL_DSN이 설정되지 않음")
+def test_query_plans_use_indexes():
+    engine = create_engine(MYSQL_DSN)
+    try:
+        assert check_query_plans(make_news_data_manager(engine)) == []
+    finally:
+        engine.dispose()
@@ -0,0 +1,89 @@
+import asyncio
+from types import SimpleNamespace
+import pytest
+from app.summary import rate_limiter
+from app.summary.rate_limiter import RateLimiter
+
+
+class Clock:
+    """asyncio.sleep을 호출하면 실제로 기다리지 않고 시간만 흐르게 하는 시계"""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    real_sleep = asyncio.sleep
+
+    async def sleep(delay):
+        clock.sleeps.append(delay)
+        clock.now += delay
+        await real_sleep(0)
+
+    monkeypatch.setattr(
+        rate_limiter, "time", SimpleNamespace(monotonic=clock.monotonic)
+    )
+    monkeypatch.setattr(asyncio, "sleep", sleep)
+    return clock
+
+
+def test_burst_up_to_requests_per_minute_then_waits(clock):
+    limiter = RateLimiter(requests_per_minute=3, tokens_per_minute=10_000)
+
+    async def run():
+        for _ in range(4):
+            await limiter.acquire(10)
+
+    asyncio.run(run())
+
+    # 3건은 바로 보내고, 4번째는 1건이 다시 채워지는 20초를 기다림
+    assert clock.sleeps == [pytest.approx(20)]
+
+
+def test_waits_for_token_budget(clock):
+    limiter = RateLimiter(requests_per_minute=1000, tokens_per_minute=600)
+
+    async def run():
+        await limiter.acquire(500)
+        await limiter.acquire(300)
+
+    asyncio.run(run())
+
+    # 남은 100토큰에서 300토큰까지 초당 10토큰씩 채워지는 20초를 기다림
+    assert clock.sleeps == [pytest.approx(20)]
+
+
+def test_request_larger_than_token_limit_waits_for_full_bucket(clock):
+    limiter = RateLimiter(requests_per_minute=1000, tokens_per_minute=600)
+
+    async def run():
+        await limiter.acquire(600)
+        await limiter.acquire(5000)
+
+    asyncio.run(run())
+
+    # 한도보다 큰 요청은 한도만큼으로 계산해 무한히 기다리지 않음
+    assert sum(clock.sleeps) == pytest.approx(60)
+
+
+def test_waiting_requests_are_served_in_order(clock):
+    limiter = RateLimiter(requests_per_minute=1, tokens_per_minute=10_000)
+    served = []
+
+    async def acquire(name):
+        await limiter.acquire(1)
+        served.append(name)
+
+    async def run():
+        await asyncio.gather(*(acquire(name) for name in "abcd"))
+
+    asyncio.run(run())
+
+    assert served == ["a", "b", "c", "d"]
+    assert clock.now == pytest.approx(180)
@@ -0,0 +1,69 @@
+import hashlib
+import json
+import pytest
+from app.core.rendered_response import RenderedResponse
+from app.data.news_data_manager import NewsDataManager
+from app.models.dtos import SummaryItemDTO, SummaryResponseDTO
+
+RESPONSE = SummaryResponseDTO(
+    summaries=[SummaryItemDTO(title="1. 코스피", content="코스피가 1% 상승했다.")],
+    sources=[],
+)
+
+
+def test_etag_is_quoted_body_hash():
+    body = b'{"a":1}'
+    rendered = RenderedResponse(body)
+
+    assert rendered.etag == f'"{hashlib.sha1(body).hexdigest()}"'
+    assert RenderedResponse(body).etag == rendered.etag
+    assert RenderedResponse(b'{"a":2}').etag != rendered.etag
+
+
+@pytest.mark.parametrize(
+    "if_none_match, expected",
+    [
+        (None, False),
+        ("", False),
+        ("{etag}", True),
+        ("W/{etag}", True),
+        ('"other", {etag}', True),
+        ("*", True),
+        ('"other"', False),
+    ],
+)
+def test_matches_if_none_match(if_none_match, expected):
+    rendered = RenderedResponse(b"{}")
+    header = if_none_match.format(etag=rendered.etag) if if_none_match else None
+
+    assert rendered.matches(header) is expected
+
+
+def test_to_response_returns_body_with_cache_headers():
+    rendered = NewsDataManager.render_response(RESPONSE)
+
+    response = rendered.to_response(None, max_age=60)
+
+    assert response.status_code == 200
+    assert response.body == rendered.body
+    assert response.headers["etag"] == rendered.etag
+    assert response.headers["cache-control"] == "public, max-age=60"
+    assert response.media_type == "application/json"
+    assert json.loads(response.body)["result"] == RESPONSE.model_dump(mode="json")
+
+
+def test_to_response_returns_304_when_etag_matches():
+    rendered = NewsDataManager.render_response(RESPONSE)
+
+    response = rendered.to_response(rendered.etag, max_age=60)
+
+    assert response.status_code == 304
+    assert response.body == b""
+    assert response.headers["etag"] == rendered.etag
+
+
+def test_etag_survives_redis_round_trip():
+    rendered = NewsDataManager.render_response(RESPONSE)
+
+    # Redis에서 읽은 본문으로 다시 만들어도 ETag가 같아야 인스턴스 간 304가 유지됨
+    assert RenderedResponse(bytes(rendered.body)).etag == rendered.etag
@@ -0,0 +1,70 @@
+import json
+import os
+import pytest
+from app.core.exceptions import CrawlingError
+from app.ingest.selector_registry import BACKENDS, SelectorRegistry, get_site_domain
+
+
+def make_registry(backend, tmp_path, structures):
+    path = tmp_path / "news_site_structures.json"
+    path.write_text(json.dumps(structures, ensure_ascii=False), encoding="utf-8")
+    try:
+        return SelectorRegistry(path, backend=backend, reload_interval=0)
+    except ImportError as e:
+        pytest.skip(f"{backend} 미설치: {e.name}")
+
+
+def test_site_domain_is_common_parent():
+    assert get_site_domain(["www.mk.co.kr", "stock.mk.co.kr"]) == "mk.co.kr"
+    assert get_site_domain(["www.hankyung.com"]) == "hankyung.com"
+
+
+@pytest.mark.parametrize(
+    "url, press",
+    [
+        ("https://www.hankyung.com/article/1", "한국경제"),
+        ("https://www.sedaily.com/NewsView/1", "서울경제"),
+        ("https://m.sedaily.com/NewsViewAmp/1", "서울경제"),
+        ("https://www.mk.co.kr/news/economy/1", "매일경제"),
+        ("https://stock.mk.co.kr/news/view/1", "매일경제"),
+    ],
+)
+def test_resolve_bundled_structures(url, press):
+    assert SelectorRegistry(backend="bs4").resolve(url)[0] == press
+
+
+@pytest.mark.parametrize(
+    "url",
+    ["https://m.sedaily.com/Other/1", "https://www.example.com/article/1"],
+)
+def test_resolve_rejects_unknown_urls(url):
+    with pytest.raises(CrawlingError):
+        SelectorRegistry(backend="bs4").resolve(url)
+
+
+@pytest.mark.parametrize("backend", list(BACKENDS))
+def test_invalid_selector_fails_on_load(backend, tmp_path):
+    make_registry(backend, tmp_path, {"한국경제": {"domain": "a.kr", "selectors": "p"}})
+
+    with pytest.raises(Exception):
+        make_registry(
+            backend, tmp_path, {"한국경제": {"domain": "a.kr", "selectors": "div["}}
+        )
+
+
+@pytest.mark.parametrize("backend", list(BACKENDS))
+def test_reload_keeps_previous_index_on_invalid_selector(backend, tmp_path):
+    registry = make_registry(
+        backend, tmp_path, {"한국경제": {"domain": "a.kr", "selectors": "p"}}
+    )
+    registry.path.write_text(
+        json.dumps({"한국경제": {"domain": "a.kr", "selectors": "div["}}),
+        encoding="utf-8",
+    )
+    # 수정 시각이 같은 나노초로 기록되는 파일 시스템에서도 변경을 감지하도록 함
+    stat = os.stat(registry.path)
+    os.utime(registry.path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    content, _ = registry.extract("https://a.kr/1", "<html><p>본문</p></html>")
+
+    assert content == "본문"
@@ -0,0 +1,160 @@
+import asyncio
+import fakeredis
+from app.core.single_flight import SingleFlight
+
+
+def make_single_flight(wait_timeout: float = 1.0) -> SingleFlight:
+    return SingleFlight(lock_timeout=5.0, wait_timeout=wait_timeout, poll_interval=0.01)
+
+
+class BrokenExistsRedis(fakeredis.FakeRedis):
+    """락 대기 중 exists 호출만 실패하는 Redis"""
+
+    def exists(self, *names):
+        raise ConnectionError("redis down")
+
+
+def test_concurrent_requests_share_one_leader_result():
+    single_flight = make_single_flight()
+    calls = 0
+
+    async def compute():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.05)
+        return "summary"
+
+    async def run():
+        return await asyncio.gather(
+            *(single_flight.do("key", compute) for _ in range(5))
+        )
+
+    assert asyncio.run(run()) == ["summary"] * 5
+    assert calls == 1
+    assert single_flight.get_pending("key") is None
+
+
+def test_leader_failure_is_raised_to_waiters():
+    single_flight = make_single_flight()
+
+    async def compute():
+        await asyncio.sleep(0.05)
+        raise RuntimeError("openai down")
+
+    async def run():
+        return await asyncio.gather(
+            *(single_flight.do("key", compute) for _ in range(3)),
+            return_exceptions=True,
+        )
+
+    results = asyncio.run(run())
+    assert all(isinstance(result, RuntimeError) for result in results)
+    assert single_flight.get_pending("key") is None
+
+
+def test_waiter_uses_result_cached_by_lock_holder():
+    server = fakeredis.FakeServer()
+    redis_client = fakeredis.FakeRedis(server=server)
+    leader, waiter = make_single_flight(), make_single_flight()
+    cache = {}
+    calls = []
+
+    async def leader_compute():
+        calls.append("leader")
+        await asyncio.sleep(0.1)
+        cache["key"] = "summary"
+        return "summary"
+
+    async def waiter_compute():
+        calls.append("waiter")
+        return "duplicate"
+
+    async def run():
+        leader_task = asyncio.create_task(
+            leader.do("key", leader_compute, lambda: cache.get("key"), redis_client)
+        )
+        await asyncio.sleep(0.02)
+        waiter_result = await waiter.do(
+            "key",
+            waiter_compute,
+            lambda: cache.get("key"),
+            fakeredis.FakeRedis(server=server),
+        )
+        return await leader_task, waiter_result
+
+    assert asyncio.run(run()) == ("summary", "summary")
+    assert calls == ["leader"]
+
+
+def test_waiter_computes_itself_after_wait_timeout():
+    redis_client = fakeredis.FakeRedis()
+    # 다른 인스턴스가 락을 잡은 채 결과를 저장하지 않는 상황
+    redis_client.set("lock:key", "other-instance", px=60_000)
+    single_flight = make_single_flight(wait_timeout=0.1)
+
+    async def compute():
+        return "summary"
+
+    result = asyncio.run(single_flight.do("key", compute, lambda: None, redis_client))
+    assert result == "summary"
+
+
+def test_waiter_computes_itself_when_redis_fails_while_waiting():
+    redis_client = BrokenExistsRedis()
+    redis_client.set("lock:key", "other-instance", px=60_000)
+    single_flight = make_single_flight()
+
+    async def compute():
+        return "summary"
+
+    result = asyncio.run(single_flight.do("key", compute, lambda: None, redis_client))
+    assert result == "summary"
+
+
+def test_leader_cancellation_does_not_cancel_waiters():
+    single_flight = make_single_flight()
+    calls = 0
+
+    async def compute():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.05)
+        return "summary"
+
+    async def run():
+        leader = asyncio.create_task(single_flight.do("key", compute))
+        await asyncio.sleep(0)
+        waiters = [
+            asyncio.create_task(single_flight.do("key", compute)) for _ in range(3)
+        ]
+        await asyncio.sleep(0.01)
+        leader.cancel()
+        results = await asyncio.gather(*waiters)
+        return leader.cancelled(), results
+
+    leader_cancelled, results = asyncio.run(run())
+
+    assert leader_cancelled
+    # 대기하던 요청 중 하나가 다시 계산하고 나머지는 그 결과를 공유
+    assert results == ["summary"] * 3
+    assert calls == 2
+    assert single_flight.get_pending("key") is None
+
+
+def test_waiter_cancellation_does_not_affect_leader():
+    single_flight = make_single_flight()
+
+    async def compute():
+        await asyncio.sleep(0.05)
+        return "summary"
+
+    async def run():
+        leader = asyncio.create_task(single_flight.do("key", compute))
+        await asyncio.sleep(0)
+        waiter = asyncio.create_task(single_flight.do("key", compute))
+        await asyncio.sleep(0.01)
+        waiter.cancel()
+        await asyncio.gather(waiter, return_exceptions=True)
+        return waiter.cancelled(), await leader
+
+    assert asyncio.run(run()) == (True, "summary")
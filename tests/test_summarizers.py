@@ -0,0 +1,227 @@
+import asyncio
+from datetime import datetime
+from types import SimpleNamespace
+import pytest
+from openai import AsyncOpenAI
+from app.config.settings import settings
+from app.core.exceptions import SummaryError
+from app.core.openai_client import close_openai_client, get_openai_client
+from app.models.dtos import NewsArticleDTO
+from app.summary.accumulated_summarizer import (
+    ARTICLE_SUBJECT,
+    BATCH_SUBJECT,
+    PERSONA_DATA,
+    AccumulatedSummarizer,
+)
+from app.summary.individual_summarizer import IndividualSummarizer
+from app.summary.prompt_packer import PromptPacker
+from app.summary.rate_limiter import RateLimiter
+
+REPLY = "1. 코스피 상승: 코스피가 1% 상승했다.\n2. 환율 하락: 환율이 하락했다."
+
+
+def make_article(url, content, summary=None):
+    return NewsArticleDTO(
+        title="코스피 상승",
+        published_date=datetime(2024, 11, 5, 8),
+        url=url,
+        content=content,
+        keyword="증시",
+        press="한국경제",
+        summary=summary,
+    )
+
+
+def make_client(fake_openai, max_retries=0):
+    return AsyncOpenAI(
+        api_key="test", base_url=fake_openai.base_url, max_retries=max_retries
+    )
+
+
+def make_individual_summarizer(client):
+    # Redis가 없으면 기사 요약 캐시를 건너뜀
+    return IndividualSummarizer(
+        client,
+        news_data_manager=SimpleNamespace(redis_client=None),
+        rate_limiter=RateLimiter(60_000, 10_000_000),
+    )
+
+
+@pytest.fixture
+def fast_retries(monkeypatch):
+    monkeypatch.setattr(settings, "INDIVIDUAL_SUMMARY_RETRY_BASE_SECONDS", 0.01)
+    monkeypatch.setattr(settings, "INDIVIDUAL_SUMMARY_RETRY_MAX_SECONDS", 0.02)
+
+
+def test_accumulated_summary(fake_openai):
+    fake_openai.reply = REPLY
+    articles = [
+        make_article("https://a/1", "본문", summary="코스피가 1% 상승했다."),
+        make_article("https://a/2", "본문", summary="환율이 하락했다."),
+        make_article("https://a/3", "본문"),
+    ]
+
+    async def run():
+        summarizer = AccumulatedSummarizer(make_client(fake_openai))
+        return await summarizer.accumulated_summary("증시", articles)
+
+    assert asyncio.run(run()) == REPLY
+    (request,) = fake_openai.requests
+    assert request["model"] == settings.OPENAI_MODEL
+    assert request["messages"][0] == {"role": "system", "content": PERSONA_DATA}
+    prompt = request["messages"][1]["content"]
+    assert "주제: 증시" in prompt
+    assert "코스피가 1% 상승했다." in prompt and "환율이 하락했다." in prompt
+
+
+def test_stream_accumulated_summary(fake_openai):
+    fake_openai.reply = REPLY
+    articles = [make_article("https://a/1", "본문", summary="코스피가 상승했다.")]
+
+    async def run():
+        summarizer = AccumulatedSummarizer(make_client(fake_openai))
+        return [
+            chunk
+            async for chunk in summarizer.stream_accumulated_summary("증시", articles)
+        ]
+
+    chunks = asyncio.run(run())
+
+    assert len(chunks) > 1
+    assert "".join(chunks) == REPLY
+    assert fake_openai.requests[0]["stream"] is True
+
+
+@pytest.mark.parametrize("stream", [False, True])
+def test_accumulated_summary_api_error_raises_summary_error(fake_openai, stream):
+    fake_openai.failures.append((400, {}))
+    articles = [make_article("https://a/1", "본문", summary="코스피가 상승했다.")]
+
+    async def run():
+        summarizer = AccumulatedSummarizer(make_client(fake_openai))
+        if stream:
+            return [
+                chunk
+                async for chunk in summarizer.stream_accumulated_summary(
+                    "증시", articles
+                )
+            ]
+        return await summarizer.accumulated_summary("증시", articles)
+
+    with pytest.raises(SummaryError):
+        asyncio.run(run())
+
+
+def test_shared_client_uses_configured_base_url(fake_openai, monkeypatch):
+    fake_openai.reply = REPLY
+    monkeypatch.setattr(settings, "OPENAI_BASE_URL", fake_openai.base_url)
+    get_openai_client.cache_clear()
+    articles = [make_article("https://a/1", "본문", summary="코스피가 상승했다.")]
+
+    async def run():
+        try:
+            return await AccumulatedSummarizer().accumulated_summary("증시", articles)
+        finally:
+            await close_openai_client()
+
+    assert asyncio.run(run()) == REPLY
+    assert len(fake_openai.requests) == 1
+
+
+def test_individual_summary_retries_rate_limit_server_and_connection_errors(
+    fake_openai, fast_retries
+):
+    fake_openai.reply = "코스피가 1% 상승했다."
+    fake_openai.failures = [
+        (429, {"Retry-After": "0.2"}),
+        (500, {}),
+        ("disconnect", {}),
+    ]
+
+    async def run():
+        summarizer = make_individual_summarizer(make_client(fake_openai))
+        return await summarizer._summarize_article(
+            make_article("https://a/1", "코스피 본문"), "증시"
+        )
+
+    assert asyncio.run(run()) == "코스피가 1% 상승했다."
+    assert len(fake_openai.requests) == 4
+    # 429 응답 뒤에는 Retry-After만큼 기다림
+    first, second = fake_openai.requested_at[:2]
+    assert second - first >= 0.2
+
+
+def test_individual_summary_gives_up_after_max_retries(
+    fake_openai, fast_retries, monkeypatch
+):
+    monkeypatch.setattr(settings, "INDIVIDUAL_SUMMARY_MAX_RETRIES", 1)
+    fake_openai.failures = [(503, {}), (503, {}), (503, {})]
+
+    async def run():
+        summarizer = make_individual_summarizer(make_client(fake_openai))
+        return await summarizer._summarize_article(
+            make_article("https://a/1", "코스피 본문"), "증시"
+        )
+
+    with pytest.raises(SummaryError):
+        asyncio.run(run())
+    assert len(fake_openai.requests) == 2
+
+
+def test_non_retryable_error_is_not_retried(fake_openai, fast_retries):
+    fake_openai.failures = [(400, {})]
+
+    async def run():
+        summarizer = make_individual_summarizer(make_client(fake_openai))
+        return await summarizer._summarize_article(
+            make_article("https://a/1", "코스피 본문"), "증시"
+        )
+
+    with pytest.raises(SummaryError):
+        asyncio.run(run())
+    assert len(fake_openai.requests) == 1
+
+
+def test_summarize_summarizes_each_article_once_then_combines(fake_openai):
+    fake_openai.reply = REPLY
+    articles = [
+        make_article("https://a/1", "코스피 본문"),
+        make_article("https://b/1", "코스피 본문"),
+        make_article("https://c/1", "환율 본문"),
+    ]
+
+    async def run():
+        summarizer = make_individual_summarizer(make_client(fake_openai))
+        return await summarizer.summarize(articles, "증시")
+
+    assert asyncio.run(run()) == REPLY
+    # 본문이 같은 기사는 한 번만 요약하고, 마지막에 종합 요약 1회
+    contents = [request["messages"][1]["content"] for request in fake_openai.requests]
+    assert sorted(contents[:2]) == ["코스피 본문", "환율 본문"]
+    assert len(contents) == 3
+
+
+def test_summaries_over_token_budget_are_mapped_then_reduced(fake_openai):
+    fake_openai.reply = REPLY
+    packer = PromptPacker(token_budget=20, max_batches=4)
+    packer.count_tokens = len
+    summaries = [
+        "코스피가 외국인 순매수에 상승했다.",
+        "원·달러 환율이 1,380원으로 하락했다.",
+        "반도체 수출이 두 달 연속 증가했다.",
+    ]
+    articles = [
+        make_article(f"https://a/{i}", "본문", summary=summary)
+        for i, summary in enumerate(summaries)
+    ]
+
+    async def run():
+        summarizer = AccumulatedSummarizer(make_client(fake_openai), packer)
+        return await summarizer.accumulated_summary("증시", articles)
+
+    assert asyncio.run(run()) == REPLY
+    # 묶음 3개를 각각 요약한 뒤 부분 요약들을 한 번 더 요약
+    prompts = [request["messages"][1]["content"] for request in fake_openai.requests]
+    assert len(prompts) == 4
+    assert all(prompt.startswith(ARTICLE_SUBJECT) for prompt in prompts[:3])
+    assert prompts[3].startswith(BATCH_SUBJECT)
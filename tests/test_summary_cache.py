@@ -0,0 +1,124 @@
+import asyncio
+import uuid
+from datetime import datetime
+import fakeredis
+import pytest
+from app.config.settings import settings
+from app.core.cache_codec import CacheCodec
+from app.core.local_cache import LocalCache
+from app.core.single_flight import SingleFlight
+from app.data.news_data_manager import NewsDataManager
+from app.models.dtos import SummaryItemDTO, SummaryRequestDTO, SummaryResponseDTO
+from app.services.news_service import NewsService
+
+REQUEST = SummaryRequestDTO(keyword="금리", press=["hk", "mk"], period=1)
+
+
+def make_news_data_manager(redis_client):
+    # DB 연결 없이 fakeredis로 캐시 경로만 사용
+    news_data_manager = NewsDataManager.__new__(NewsDataManager)
+    news_data_manager._engine = None
+    news_data_manager._redis_client = redis_client
+    news_data_manager.local_cache = LocalCache(max_size=100, ttl=60)
+    news_data_manager.local_cache_date = None
+    news_data_manager.cache_codec = CacheCodec("json", "none", compression_min_bytes=0)
+    news_data_manager.redis_hits = 0
+    news_data_manager.redis_misses = 0
+    news_data_manager.instance_id = uuid.uuid4().hex
+    news_data_manager.content_versions = {}
+    news_data_manager.get_target_date = lambda: datetime(2024, 11, 5, 6, 15)
+    return news_data_manager
+
+
+def make_news_service(redis_client):
+    """create_summary가 기사 조회·요약 대신 버전이 적힌 요약을 캐싱하는 NewsService"""
+    news_service = NewsService.__new__(NewsService)
+    news_service.news_data_manager = make_news_data_manager(redis_client)
+    news_service.single_flight = SingleFlight(
+        lock_timeout=5.0, wait_timeout=1.0, poll_interval=0.01
+    )
+    news_service.refresh_tasks = {}
+    news_service.created = []
+
+    async def create_summary(request, version=0):
+        news_service.created.append(version)
+        await asyncio.sleep(0.01)
+        response = SummaryResponseDTO(
+            summaries=[SummaryItemDTO(title="1. 금리", content=f"요약 v{version}")],
+            sources=[],
+        )
+        news_service.push_to_redis(
+            request.keyword, request.press, request.period, response, version
+        )
+        return response
+
+    news_service.create_summary = create_summary
+    return news_service
+
+
+def summary_content(response):
+    return response.summaries[0].content
+
+
+@pytest.fixture(autouse=True)
+def read_versions_every_time(monkeypatch):
+    # 다른 인스턴스가 올린 버전을 바로 읽도록 프로세스 내 버전 보관을 끔
+    monkeypatch.setattr(settings, "CONTENT_VERSION_REFRESH_SECONDS", 0)
+
+
+def test_miss_creates_summary_once_then_hits_versioned_key():
+    news_service = make_news_service(fakeredis.FakeRedis())
+
+    async def run():
+        first = await asyncio.gather(
+            *(news_service.summarized_news(REQUEST) for _ in range(3))
+        )
+        return first, await news_service.summarized_news(REQUEST)
+
+    first, second = asyncio.run(run())
+
+    assert [summary_content(response) for response in first] == ["요약 v0"] * 3
+    assert summary_content(second) == "요약 v0"
+    assert news_service.created == [0]
+
+
+def test_version_bump_serves_stale_summary_while_refreshing():
+    redis_client = fakeredis.FakeRedis()
+    news_service = make_news_service(redis_client)
+    news_data_manager = news_service.news_data_manager
+
+    async def run():
+        await news_service.summarized_news(REQUEST)
+        news_data_manager.bump_content_versions([("금리", "한국경제")])
+
+        stale = await news_service.summarized_news(REQUEST)
+        # 새 버전 요약은 백그라운드에서 한 번만 생성
+        again = await news_service.summarized_news(REQUEST)
+        await asyncio.gather(*news_service.refresh_tasks.values())
+        return stale, again, await news_service.summarized_news(REQUEST)
+
+    stale, again, fresh = asyncio.run(run())
+
+    assert summary_content(stale) == summary_content(again) == "요약 v0"
+    assert summary_content(fresh) == "요약 v1"
+    assert news_service.created == [0, 1]
+    assert news_service.refresh_tasks == {}
+    # 새 버전은 버전 키와 최근 결과 키 모두에 저장됨
+    latest_key = news_data_manager.get_cache_key(
+        REQUEST.keyword, REQUEST.press, REQUEST.period
+    )
+    latest = news_data_manager.load_cached_response(redis_client.get(latest_key))
+    assert summary_content(latest) == "요약 v1"
+
+
+def test_version_bump_waits_for_new_summary_when_stale_disabled(monkeypatch):
+    monkeypatch.setattr(settings, "SUMMARY_SERVE_STALE", False)
+    news_service = make_news_service(fakeredis.FakeRedis())
+
+    async def run():
+        await news_service.summarized_news(REQUEST)
+        news_service.news_data_manager.bump_content_versions([("금리", "매일경제")])
+        return await news_service.summarized_news(REQUEST)
+
+    assert summary_content(asyncio.run(run())) == "요약 v1"
+    assert news_service.created == [0, 1]
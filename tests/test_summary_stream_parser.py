@@ -0,0 +1,89 @@
+import pytest
+from app.services.news_service import NewsService, SummaryStreamParser
+
+SUMMARY_TEXT = (
+    "1. 코스피 상승: 코스피가 외국인 순매수에 1% 상승했다.\n"
+    "2. 환율 하락: 원·달러 환율이 1,380원으로 하락했다.\n"
+    "3. 반도체 수출 증가"
+)
+
+# _parse_summary는 인스턴스 상태를 쓰지 않으므로 DB/Redis 연결 없이 생성
+parse_summary = NewsService.__new__(NewsService)._parse_summary
+
+
+def stream(chunks):
+    parser = SummaryStreamParser(parse_summary)
+    emitted = []
+    for chunk in chunks:
+        emitted.append(parser.feed(chunk))
+    emitted.append(parser.close())
+    return emitted
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 7, len(SUMMARY_TEXT)])
+def test_streamed_items_match_full_parse(chunk_size):
+    chunks = [
+        SUMMARY_TEXT[i : i + chunk_size]
+        for i in range(0, len(SUMMARY_TEXT), chunk_size)
+    ]
+
+    items = [item for batch in stream(chunks) for item in batch]
+
+    assert items == parse_summary(SUMMARY_TEXT)
+    assert [item.title for item in items] == ["1. 코스피 상승", "2. 환율 하락", "3."]
+
+
+def test_item_is_emitted_only_when_next_number_starts():
+    parser = SummaryStreamParser(parse_summary)
+
+    assert parser.feed("1. 코스피 상승: 코스피가 ") == []
+    assert parser.feed("1% 상승했다.\n") == []
+    completed = parser.feed("2. 환율")
+
+    assert [item.title for item in completed] == ["1. 코스피 상승"]
+    assert completed[0].content == "코스피가 1% 상승했다."
+    assert parser.feed(" 하락: 원·달러 환율이 하락했다.") == []
+    assert [item.title for item in parser.close()] == ["2. 환율 하락"]
+
+
+def test_items_are_not_emitted_twice():
+    parser = SummaryStreamParser(parse_summary)
+
+    parser.feed(SUMMARY_TEXT)
+    parser.close()
+
+    assert parser.feed("") == []
+    assert parser.close() == []
+
+
+def test_text_without_numbered_items_emits_nothing():
+    assert stream(["요약할 ", "기사가 없습니다."]) == [[], [], []]
+
+
+TRICKY_TEXT = (
+    "요약입니다.\n"
+    "9. 금리: 기준금리를 3.25%로 0.25%포인트 인하했다.\n"
+    "10. 환율: 환율이 1,380.5원으로 하락했다.\n"
+    "11. 제목 없음\n"
+    "12. 코스피: 2.5. 상승"
+)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 5])
+def test_numbers_split_across_chunks_match_full_parse(chunk_size):
+    chunks = [
+        TRICKY_TEXT[i : i + chunk_size] for i in range(0, len(TRICKY_TEXT), chunk_size)
+    ]
+
+    items = [item for batch in stream(chunks) for item in batch]
+
+    assert items == parse_summary(TRICKY_TEXT)
+
+
+def test_buffer_keeps_only_unfinished_item():
+    parser = SummaryStreamParser(parse_summary)
+
+    for line in SUMMARY_TEXT.splitlines(keepends=True):
+        parser.feed(line)
+
+    assert parser.buffer == "3. 반도체 수출 증가"